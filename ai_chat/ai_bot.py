@@ -1,8 +1,12 @@
 from redbot.core import commands, Config
 import discord
-import openai
 import random
-import requests
+
+from lazymodule import LazyModule
+
+# Both are imported on first use so loading the cog stays fast.
+openai = LazyModule("openai")
+requests = LazyModule("requests")
 
 # Ensure you set your OpenAI API key in the environment variables
 openai.api_key = 'sk-None-TJqi2r1Hg2VXNrJZ2uq4T3BlbkFJyuXKwxzQxYMIcqb61tut'
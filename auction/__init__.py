@@ -1,4 +1,6 @@
 from .auction import AdvancedAuctionSystem
 
 async def setup(bot):
-    await bot.add_cog(AdvancedAuctionSystem(bot))
\ No newline at end of file
+    cog = AdvancedAuctionSystem(bot)
+    await bot.add_cog(cog)
+    await cog.initialize()
\ No newline at end of file
@@ -4,74 +4,138 @@ from redbot.core import Config, checks, bank, commands
 from redbot.core.utils.chat_formatting import box, pagify
 from redbot.core.utils.menus import menu, DEFAULT_CONTROLS
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
 import asyncio
 import logging
 from typing import Optional, Dict, Any, List, Union, Tuple
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
 import io
 import csv
 import json
 import random
-import seaborn as sns
-import os
 import math
 import re
 from collections import defaultdict
-import aiohttp
+from functools import partial
+
+from .backups import BackupError, BackupManager
+from .bids import bid_history
+from .channels import ChannelPool
+from .charts import ChartRenderer
+from .columns import HistoryColumns
+from .embeds import EmbedUpdater
+from .history import AuctionHistoryStore
+from .ids import AuctionIdAllocator
+from .leaderboards import GuildLeaderboards
+from .migrations import Migrations
+from .notifications import DMDispatcher, SubscriptionIndex
+from .participants import ParticipantIndex
+from .pricing import PricingClient
+from .proxy import IncrementTable, ProxyBook, resolve as resolve_proxy_war
+from .scheduler import DeadlineScheduler
+from .search import AuctionSearchIndex, LazyPageView
+from .sequencer import BidSequencer
+from .settlement import compute_settlement
+from .store import FINISHED_STATUSES, AuctionStore, group_for
+from .transcripts import export_transcript
+from .watch import WatchIndex, WatchNotifier
 
 log = logging.getLogger("red.economy.AdvancedAuctionSystem")
 
+# Seconds before retrying a due auction whose guild is not available.
+DEADLINE_RETRY_DELAY = 60
+
 class AuctionAnalytics:
+    """Aggregate statistics for one guild's completed auctions.
+
+    Auctions are ingested from the history store in ``seq`` order and the
+    highest ``seq`` seen is kept as a high-water mark, so the aggregate can be
+    persisted and updated incrementally instead of being replayed from history.
+    """
+
     def __init__(self):
         self.total_auctions = 0
         self.total_value = 0
         self.item_popularity = defaultdict(int)
         self.user_participation = defaultdict(int)
         self.category_performance = defaultdict(lambda: {"count": 0, "value": 0})
-
-    def update(self, auction: Dict[str, Any]):
+        self.last_seq = 0
+        self._summary = None
+
+    def update(self, auction: Dict[str, Any], seq: int) -> bool:
+        """Ingest the history row ``seq``. Returns False if it was already counted."""
+        if seq <= self.last_seq:
+            return False
+        self.last_seq = seq
         self.total_auctions += 1
         self.total_value += auction['current_bid']
         for item in auction['items']:
             self.item_popularity[item['name']] += item['amount']
-        self.user_participation[auction['user_id']] += 1
-        self.user_participation[auction['current_bidder']] += 1
+        for user_id in (auction['user_id'], auction['current_bidder']):
+            if user_id is not None:
+                self.user_participation[user_id] += 1
         self.category_performance[auction['category']]['count'] += 1
         self.category_performance[auction['category']]['value'] += auction['current_bid']
+        self._summary = None
+        return True
 
     def get_summary(self) -> Dict[str, Any]:
+        if self._summary is None:
+            self._summary = {
+                "total_auctions": self.total_auctions,
+                "total_value": self.total_value,
+                "top_items": dict(sorted(self.item_popularity.items(), key=lambda x: x[1], reverse=True)[:5]),
+                "top_users": dict(sorted(self.user_participation.items(), key=lambda x: x[1], reverse=True)[:5]),
+                "category_performance": dict(self.category_performance)
+            }
+        return self._summary
+
+    def to_dict(self) -> Dict[str, Any]:
         return {
             "total_auctions": self.total_auctions,
             "total_value": self.total_value,
-            "top_items": dict(sorted(self.item_popularity.items(), key=lambda x: x[1], reverse=True)[:5]),
-            "top_users": dict(sorted(self.user_participation.items(), key=lambda x: x[1], reverse=True)[:5]),
-            "category_performance": self.category_performance
+            "item_popularity": dict(self.item_popularity),
+            "user_participation": {str(user_id): count for user_id, count in self.user_participation.items()},
+            "category_performance": dict(self.category_performance),
+            "last_seq": self.last_seq,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuctionAnalytics":
+        analytics = cls()
+        analytics.total_auctions = data["total_auctions"]
+        analytics.total_value = data["total_value"]
+        analytics.item_popularity.update(data["item_popularity"])
+        analytics.user_participation.update({int(user_id): count for user_id, count in data["user_participation"].items()})
+        analytics.category_performance.update(data["category_performance"])
+        analytics.last_seq = data["last_seq"]
+        return analytics
+
 class AuctionVisualization:
-    @staticmethod
-    async def create_bid_history_chart(auction: Dict[str, Any]) -> discord.File:
-        plt.figure(figsize=(10, 6))
-        bids = [(datetime.fromtimestamp(bid['timestamp']), bid['amount']) for bid in auction['bid_history']]
-        times, amounts = zip(*bids)
-        plt.plot(times, amounts, marker='o')
-        plt.title(f"Bid History for Auction #{auction['auction_id']}")
-        plt.xlabel("Time")
-        plt.ylabel("Bid Amount")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png')
-        buf.seek(0)
-        return discord.File(buf, filename=f"auction_{auction['auction_id']}_history.png")
+    def __init__(self, renderer: ChartRenderer):
+        self.renderer = renderer
+
+    async def create_bid_history_chart(self, auction: Dict[str, Any]) -> discord.File:
+        history = bid_history(auction)
+        png = await self.renderer.render("bid_history", auction['auction_id'], history.timestamps, history.amounts)
+        return discord.File(io.BytesIO(png), filename=f"auction_{auction['auction_id']}_history.png")
+
+    async def create_value_distribution_chart(self, values: List[int]) -> discord.File:
+        png = await self.renderer.render("value_distribution", values)
+        return discord.File(io.BytesIO(png), filename="value_distribution.png")
+
+    async def create_category_performance_chart(self, category_stats: Dict[str, Dict[str, int]]) -> discord.File:
+        categories = list(category_stats.keys())
+        values = [stats['value'] for stats in category_stats.values()]
+        png = await self.renderer.render("category_performance", categories, values)
+        return discord.File(io.BytesIO(png), filename="category_performance.png")
 
 class AdvancedAuctionSystem(commands.Cog):
     def __init__(self, bot: Red):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=95932766180)
         default_guild = {
+            # Old layout, moved into per-auction custom groups by migrate_auction_layout.
             "auctions": {},
             "auction_queue": [],
             "scheduled_auctions": {},
@@ -123,6 +187,18 @@ class AdvancedAuctionSystem(commands.Cog):
             },
             "moderator_role": None,
             "donation_tracking": {},
+            "analytics": {},
+            "next_auction_id": 0,
+            "embed_update_interval": 2.0,
+            "schema_version": 0,
+            "channel_pool_size": 2,
+            "pending_settlements": {},
+            "backup_settings": {
+                "enabled": True,
+                "interval": 86400,
+                "snapshot_every": 7,
+                "retention": 3,
+            },
         }
         default_member = {
             "auction_reminders": [],
@@ -140,60 +216,192 @@ class AdvancedAuctionSystem(commands.Cog):
             "subscribed_categories": [],
             "saved_searches": [],
             "proxy_bids": {},
+            "watched_auctions": [],
         }
         self.config.register_guild(**default_guild)
         self.config.register_member(**default_member)
-        self.auction_task = None
-        self.analytics = AuctionAnalytics()
-        self.visualization = AuctionVisualization()
-        self.api_cache = {}
-        self.api_cache_time = {}
+        self.auction_store = AuctionStore(self.config)
+        self.guild_migrations = Migrations()
+        self.guild_migrations.register(self.migrate_history)
+        self.guild_migrations.register(self.migrate_auction_layout)
+        self.id_allocator = AuctionIdAllocator(self.config)
+        self.auction_channels: Dict[int, Dict[int, str]] = defaultdict(dict)
+        self.proxy_books: Dict[Tuple[int, str], ProxyBook] = {}
+        self.increment_tables: Dict[int, IncrementTable] = {}
+        self.history_store = AuctionHistoryStore(cog_data_path(self) / "history.sqlite3")
+        self.history_columns: Dict[int, HistoryColumns] = {}
+        self.leaderboards: Dict[int, GuildLeaderboards] = {}
+        self.backups = BackupManager(cog_data_path(self) / "backups", self.history_store)
+        self.last_backup: Dict[int, float] = {}
+        self.backup_tasks: Dict[int, asyncio.Task] = {}
+        self.search_index = AuctionSearchIndex()
+        self.participants = ParticipantIndex()
+        self.subscriptions = SubscriptionIndex()
+        self.dm_dispatcher = DMDispatcher()
+        self.background_tasks = set()
+        self.watch_index = WatchIndex()
+        self.watch_notifier = WatchNotifier(self.resolve_member, self.dm_dispatcher)
+        self.bid_sequencer = BidSequencer()
+        self.auction_scheduler = DeadlineScheduler(self.on_auction_due)
+        self.analytics: Dict[int, AuctionAnalytics] = defaultdict(AuctionAnalytics)
+        self.dirty_analytics = set()
+        self.settlement_locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.chart_renderer = ChartRenderer()
+        self.visualization = AuctionVisualization(self.chart_renderer)
+        self.pricing = PricingClient()
+        self.embed_updater = EmbedUpdater(self.render_auction_embed)
+        self.channel_pool = ChannelPool()
         self.queue_lock = asyncio.Lock()
 
     async def initialize(self):
-        self.auction_task = self.bot.loop.create_task(self.auction_loop())
+        await self.history_store.open()
         await self.migrate_data()
+        await self.auction_store.load()
+        self.auction_store.start()
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            self.embed_updater.set_interval(guild_id, guild_data['embed_update_interval'])
+        all_members = await self.config.all_members()
+        self.subscriptions.load(all_members)
+        self.watch_index.load(all_members)
+        self.watch_notifier.start()
+        # Red loads cogs before the gateway connects, so bot.guilds is still empty here.
+        for guild_id in self.auction_store.guild_ids():
+            self.rebuild_auction_schedule(guild_id)
+            self.rebuild_channel_routes(guild_id)
+            self.search_index.rebuild(guild_id, self.auction_store.all(guild_id).values())
+            self.participants.rebuild(guild_id, self.auction_store.all(guild_id).values())
+        self.auction_scheduler.start(self.bot.wait_until_red_ready)
+        self.auction_loop.start()
         await self.load_analytics()
+        await self.replay_settlements()
 
     async def cog_unload(self):
-        if self.auction_task:
-            self.auction_task.cancel()
+        self.auction_loop.cancel()
+        for task in self.background_tasks:
+            task.cancel()
+        self.auction_scheduler.close()
+        self.watch_notifier.close()
+        self.embed_updater.close()
+        self.channel_pool.close()
+        await self.bid_sequencer.close()
+        await self.auction_store.close()
+        await self.save_analytics()
+        await self.history_store.close()
+        self.backups.close()
+        await self.pricing.close()
+        self.chart_renderer.close()
 
     async def migrate_data(self):
-        for guild in self.bot.guilds:
-            async with self.config.guild(guild).auctions() as auctions:
-                for auction_id, auction in auctions.items():
-                    if 'channel_id' not in auction:
-                        auction['channel_id'] = None
-                    if 'buy_out_price' not in auction:
-                        auction['buy_out_price'] = None
-                    if 'reserve_price' not in auction:
-                        auction['reserve_price'] = None
-                    if 'proxy_bids' not in auction:
-                        auction['proxy_bids'] = {}
-                    if 'items' not in auction:
-                        auction['items'] = [{"name": auction['item'], "amount": auction['amount']}]
-                        del auction['item']
-                        del auction['amount']
-                    if 'donations' not in auction:
-                        auction['donations'] = []
+        """Run the guild migrations each guild has not had yet.
+
+        Individual auctions are upgraded lazily by the auction store instead.
+        """
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            for version, step in self.guild_migrations.pending(guild_data['schema_version']):
+                log.info(f"Migrating auction data for guild {guild_id} to schema version {version}")
+                await step(guild_id)
+                await self.config.guild_from_id(guild_id).schema_version.set(version)
+
+    async def migrate_history(self, guild_id: int):
+        """Move history kept in Config by older versions into the history store."""
+        history = await self.config.guild_from_id(guild_id).auction_history()
+        if history:
+            await self.history_store.extend(guild_id, history)
+            await self.config.guild_from_id(guild_id).auction_history.set([])
+
+    async def migrate_auction_layout(self, guild_id: int):
+        """Move auctions from the old per-guild ``auctions`` dict into per-auction custom groups."""
+        auctions = await self.config.guild_from_id(guild_id).auctions()
+        for auction_id, auction in auctions.items():
+            await self.config.custom(group_for(auction), guild_id, auction_id).set(auction)
+        if auctions:
+            await self.config.guild_from_id(guild_id).auctions.clear()
 
     async def load_analytics(self):
-        for guild in self.bot.guilds:
-            async with self.config.guild(guild).auction_history() as history:
-                for auction in history:
-                    self.analytics.update(auction)
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            snapshot = guild_data['analytics']
+            # Snapshots from before the high-water mark was kept are rebuilt from history.
+            if snapshot and "last_seq" in snapshot:
+                self.analytics[guild_id] = AuctionAnalytics.from_dict(snapshot)
+            else:
+                self.analytics[guild_id] = AuctionAnalytics()
+            await self.catch_up_analytics(guild_id)
+        await self.save_analytics()
+
+    async def catch_up_analytics(self, guild_id: int):
+        """Ingest the history rows recorded since the guild's analytics were last updated."""
+        analytics = self.analytics[guild_id]
+        async for batch in self.history_store.iter_since(guild_id, analytics.last_seq):
+            for seq, data in batch:
+                analytics.update(json.loads(data), seq)
+            self.dirty_analytics.add(guild_id)
+
+    async def save_analytics(self):
+        while self.dirty_analytics:
+            guild_id = self.dirty_analytics.pop()
+            try:
+                await self.config.guild_from_id(guild_id).analytics.set(self.analytics[guild_id].to_dict())
+            except Exception:
+                self.dirty_analytics.add(guild_id)
+                raise
 
     @tasks.loop(minutes=1)
     async def auction_loop(self):
         try:
             await self.process_auction_queue()
-            await self.check_auction_end()
             await self.process_scheduled_auctions()
-            await self.update_auction_analytics()
+            await self.save_analytics()
+            await self.schedule_backups()
+            await self.replenish_channel_pools()
         except Exception as e:
             log.error(f"Error in auction loop: {e}", exc_info=True)
 
+    async def replenish_channel_pools(self):
+        for guild in self.bot.guilds:
+            auction_category = guild.get_channel(await self.config.guild(guild).auction_category())
+            if isinstance(auction_category, discord.CategoryChannel):
+                self.channel_pool.replenish(auction_category, await self.config.guild(guild).channel_pool_size())
+
+    async def schedule_backups(self):
+        """Start a background backup for every guild whose backup interval has elapsed."""
+        now = datetime.utcnow().timestamp()
+        for guild in self.bot.guilds:
+            if guild.id in self.backup_tasks:
+                continue
+            backup_settings = await self.config.guild(guild).backup_settings()
+            if not backup_settings['enabled']:
+                continue
+            if guild.id not in self.last_backup:
+                entries = await self.backups.entries(guild.id)
+                self.last_backup[guild.id] = entries[-1]['created_at'] if entries else 0
+            if now - self.last_backup[guild.id] < backup_settings['interval']:
+                continue
+            task = asyncio.create_task(self.create_backup(guild))
+            self.backup_tasks[guild.id] = task
+            self.background_tasks.add(task)
+            task.add_done_callback(self.background_tasks.discard)
+            task.add_done_callback(lambda _, guild_id=guild.id: self.backup_tasks.pop(guild_id, None))
+
+    async def create_backup(self, guild: discord.Guild, full: bool = False) -> Optional[Dict[str, Any]]:
+        backup_settings = await self.config.guild(guild).backup_settings()
+        settings = await self.config.guild(guild).get_raw()
+        # Auctions are taken from the store, which may be ahead of Config.
+        settings.pop('auctions', None)
+        try:
+            entry = await self.backups.create(
+                guild.id,
+                settings,
+                self.auction_store.all(guild.id),
+                full=full,
+                snapshot_every=backup_settings['snapshot_every'],
+                retention=backup_settings['retention'],
+            )
+        except Exception:
+            log.exception(f"Error backing up auction data for guild {guild.id}")
+            return None
+        self.last_backup[guild.id] = entry['created_at']
+        return entry
+
     async def process_auction_queue(self):
         async with self.queue_lock:
             for guild in self.bot.guilds:
@@ -215,22 +423,76 @@ class AdvancedAuctionSystem(commands.Cog):
                         await self.start_auction(guild, next_auction)
                         await self.config.guild(guild).auction_queue.set(queue)
 
-    async def check_auction_end(self):
-        for guild in self.bot.guilds:
-            auction_category_id = await self.config.guild(guild).auction_category()
-            if not auction_category_id:
-                continue
-            
-            auction_category = guild.get_channel(auction_category_id)
-            if not auction_category:
-                continue
+    def rebuild_auction_schedule(self, guild_id: int):
+        self.auction_scheduler.rebuild(guild_id, (
+            (auction_id, auction['end_time'])
+            for auction_id, auction in self.auction_store.all(guild_id).items()
+            if auction['status'] == 'active' and auction.get('end_time')
+        ))
+
+    def rebuild_channel_routes(self, guild_id: int):
+        self.auction_channels[guild_id] = {
+            auction['channel_id']: auction_id
+            for auction_id, auction in self.auction_store.all(guild_id).items()
+            if auction.get('channel_id') and auction['status'] not in ('completed', 'cancelled')
+        }
 
-            for channel in auction_category.channels:
-                if channel.name.startswith("auction-"):
-                    auction_id = channel.name.split("-")[1]
-                    auction = (await self.config.guild(guild).auctions()).get(auction_id)
-                    if auction and auction['status'] == 'active' and auction['end_time'] <= datetime.utcnow().timestamp():
-                        await self.end_auction(guild, auction_id)
+    def route_channel(self, guild_id: int, channel_id: int, auction_id: str):
+        self.auction_channels[guild_id][channel_id] = auction_id
+
+    def channel_auction_id(self, channel: discord.abc.GuildChannel) -> Optional[str]:
+        """The ID of the auction held in ``channel``, if any."""
+        return self.auction_channels[channel.guild.id].get(channel.id)
+
+    async def on_auction_due(self, guild_id: int, auction_id: str):
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            # The guild is unavailable, e.g. during an outage; try again later rather than drop the deadline.
+            self.auction_scheduler.schedule(guild_id, auction_id, datetime.utcnow().timestamp() + DEADLINE_RETRY_DELAY)
+            return
+        if await self.bid_sequencer.submit(guild_id, auction_id, partial(self.settle_close, guild, auction_id)):
+            await self.end_auction(guild, auction_id)
+
+    async def settle_close(self, guild: discord.Guild, auction_id: str) -> bool:
+        """Settle an auction whose deadline passed, unless a late bid pushed it back. Returns whether it closed."""
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            return False
+        if auction['end_time'] > datetime.utcnow().timestamp():
+            self.auction_scheduler.schedule(guild.id, auction_id, auction['end_time'])
+            return False
+        return await self.settle_auction(guild.id, auction)
+
+    async def apply_snipe_protection(self, guild: discord.Guild, auction: Dict[str, Any]) -> bool:
+        """Push back the end of an auction that was bid on inside the snipe protection window."""
+        now = datetime.utcnow().timestamp()
+        snipe_protection_time = await self.config.guild(guild).global_auction_settings.snipe_protection_time()
+        if auction['end_time'] - now > snipe_protection_time:
+            return False
+        extension_time = await self.config.guild(guild).auction_extension_time()
+        if now + extension_time <= auction['end_time']:
+            return False
+        auction['end_time'] = now + extension_time
+        self.auction_scheduler.schedule(guild.id, auction['auction_id'], auction['end_time'])
+        self.push_watch_event(
+            guild.id, auction['auction_id'], 'extension',
+            f"Auction #{auction['auction_id']} was extended and now ends <t:{int(auction['end_time'])}:R>."
+        )
+        return True
+
+    def resolve_member(self, guild_id: int, member_id: int) -> Optional[discord.Member]:
+        guild = self.bot.get_guild(guild_id)
+        return guild.get_member(member_id) if guild else None
+
+    def push_watch_event(self, guild_id: int, auction_id: str, kind: str, message: str):
+        self.watch_notifier.push(guild_id, auction_id, self.watch_index.watchers(guild_id, auction_id), kind, message)
+
+    async def release_watchers(self, guild: discord.Guild, auction_id: str):
+        """Remove a finished auction from the index and from its watchers' lists."""
+        for member_id in self.watch_index.drop(guild.id, auction_id):
+            async with self.config.member_from_ids(guild.id, member_id).watched_auctions() as watched:
+                if auction_id in watched:
+                    watched.remove(auction_id)
 
     async def process_scheduled_auctions(self):
         for guild in self.bot.guilds:
@@ -238,19 +500,16 @@ class AdvancedAuctionSystem(commands.Cog):
                 current_time = datetime.utcnow().timestamp()
                 for auction_id, auction_time in list(scheduled.items()):
                     if auction_time <= current_time:
-                        auction_data = (await self.config.guild(guild).auctions()).get(auction_id)
+                        auction_data = self.auction_store.get(guild.id, auction_id)
                         if auction_data:
                             await self.queue_auction(guild, auction_data)
                             del scheduled[auction_id]
 
-    async def update_auction_analytics(self):
-        for guild in self.bot.guilds:
-            async with self.config.guild(guild).auctions() as auctions:
-                for auction in auctions.values():
-                    if auction['status'] == 'completed':
-                        self.analytics.update(auction)
-
     async def start_auction(self, guild: discord.Guild, auction: Dict[str, Any]):
+        if 'max_bid' not in auction:
+            total_value = await self.get_total_value(auction['items'])
+            if total_value is not None:
+                self.apply_valuation(auction, total_value)
         auction['start_time'] = datetime.utcnow().timestamp()
         auction['end_time'] = auction['start_time'] + await self.config.guild(guild).auction_duration()
         auction['status'] = 'active'
@@ -259,11 +518,14 @@ class AdvancedAuctionSystem(commands.Cog):
         auction_category = guild.get_channel(auction_category_id)
         
         if auction_category:
-            channel = await auction_category.create_text_channel(f"auction-{auction['auction_id']}")
+            channel = await self.channel_pool.acquire(auction_category, f"auction-{auction['auction_id']}")
+            self.channel_pool.replenish(auction_category, await self.config.guild(guild).channel_pool_size())
             auction['channel_id'] = channel.id
+            self.route_channel(guild.id, channel.id, auction['auction_id'])
             
             embed = await self.create_auction_embed(auction)
             message = await channel.send("New auction started!", embed=embed, view=self.AuctionControls(self, auction))
+            auction['message_id'] = message.id
             await message.pin()
             
             # Create and send bid history chart
@@ -273,42 +535,123 @@ class AdvancedAuctionSystem(commands.Cog):
             # Notify subscribers
             await self.notify_subscribers(guild, auction, channel)
         
-        async with self.config.guild(guild).auctions() as auctions:
-            auctions[auction['auction_id']] = auction
+        self.auction_store.put(guild.id, auction)
+        self.search_index.add(guild.id, auction)
+        self.participants.add(guild.id, auction)
+        self.auction_scheduler.schedule(guild.id, auction['auction_id'], auction['end_time'])
 
     async def end_auction(self, guild: discord.Guild, auction_id: str):
-        async with self.config.guild(guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction:
-                return
+        """Announce and clean up after an auction that ``settle_auction`` has just completed."""
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'completed':
+            return
 
-            channel = guild.get_channel(auction['channel_id'])
+        self.auction_scheduler.cancel(guild.id, auction_id)
+        self.auction_channels[guild.id].pop(auction['channel_id'], None)
+        self.proxy_books.pop((guild.id, auction_id), None)
+        self.embed_updater.forget(guild.id, auction_id)
+        channel = guild.get_channel(auction['channel_id'])
+        
+        if channel:
+            if auction['current_bidder']:
+                winner = guild.get_member(auction['current_bidder'])
+                await channel.send(f"Auction ended! The winner is {winner.mention} with a bid of {auction['current_bid']:,}.")
+                await self.handle_auction_completion(guild, auction, winner, auction['current_bid'])
+            else:
+                await channel.send("Auction ended with no bids.")
             
-            if channel:
-                if auction['current_bidder']:
-                    winner = guild.get_member(auction['current_bidder'])
-                    await channel.send(f"Auction ended! The winner is {winner.mention} with a bid of {auction['current_bid']:,}.")
-                    await self.handle_auction_completion(guild, auction, winner, auction['current_bid'])
-                else:
-                    await channel.send("Auction ended with no bids.")
-                
-                # Log channel content
-                log_channel_id = await self.config.guild(guild).log_channel()
-                log_channel = guild.get_channel(log_channel_id)
-                if log_channel:
-                    messages = [message async for message in channel.history(limit=None, oldest_first=True)]
-                    content = "\n".join([f"{m.created_at}: {m.author}: {m.content}" for m in messages])
-                    await log_channel.send(f"Auction #{auction_id} log:", file=discord.File(io.StringIO(content), filename=f"auction_{auction_id}_log.txt"))
-                
-                # Delete the channel
-                await channel.delete()
+            # Archive and recycle the channel without holding up completion
+            task = asyncio.create_task(self.archive_auction_channel(guild, auction_id, channel))
+            self.background_tasks.add(task)
+            task.add_done_callback(self.background_tasks.discard)
 
-            auction['status'] = 'completed'
-            auctions[auction_id] = auction
+        if auction['current_bidder']:
+            self.push_watch_event(guild.id, auction_id, 'end', f"Auction #{auction_id} ended with a winning bid of ${auction['current_bid']:,}.")
+        else:
+            self.push_watch_event(guild.id, auction_id, 'end', f"Auction #{auction_id} ended with no bids.")
+        await self.release_watchers(guild, auction_id)
 
-        await self.update_auction_history(guild, auction)
         await self.process_auction_queue()
 
+    async def settle_auction(self, guild_id: int, auction: Dict[str, Any]) -> bool:
+        """Complete an auction through the settlement journal. Returns False if it had already finished.
+
+        This is the only place an auction is marked completed. Callers run it
+        inside the auction's bid sequencer step, so no bid can land between
+        deciding to close and settling.
+        """
+        async with self.settlement_locks[guild_id]:
+            # Settlements build on each other's absolute values, so finish any earlier one first.
+            await self.apply_pending_settlements(guild_id)
+            if auction['status'] in FINISHED_STATUSES:
+                return False
+            guild_config = self.config.guild_from_id(guild_id)
+            reputation = {}
+            for user_id in {auction.get('user_id'), auction.get('current_bidder')} - {None}:
+                reputation[user_id] = await self.config.member_from_ids(guild_id, user_id).reputation_score()
+            settlement = compute_settlement(
+                auction, await guild_config.user_stats(), reputation, await guild_config.reputation_system()
+            )
+            # Writing the journal entry is the commit point; from here on the settlement is replayed until applied.
+            await guild_config.set_raw("pending_settlements", auction['auction_id'], value=settlement)
+            await self.apply_settlement(guild_id, settlement)
+        return True
+
+    async def apply_settlement(self, guild_id: int, settlement: Dict[str, Any]):
+        """Apply a journalled settlement. Every step is idempotent, so an interrupted one can be replayed."""
+        auction_id = settlement['auction_id']
+        guild_config = self.config.guild_from_id(guild_id)
+        auction = self.auction_store.get(guild_id, auction_id)
+        if auction is not None:
+            auction['status'] = settlement['status']
+            await self.auction_store.write_through(guild_id, auction_id)
+        if settlement['user_stats']:
+            async with guild_config.user_stats() as user_stats:
+                user_stats.update(settlement['user_stats'])
+        for user_id, score in settlement['reputation'].items():
+            await self.config.member_from_ids(guild_id, int(user_id)).reputation_score.set(score)
+        if auction is not None:
+            await self.update_auction_history(guild_id, auction)
+            await self.save_analytics()
+        await guild_config.clear_raw("pending_settlements", auction_id)
+
+    async def apply_pending_settlements(self, guild_id: int):
+        pending = await self.config.guild_from_id(guild_id).pending_settlements()
+        for settlement in sorted(pending.values(), key=lambda entry: entry['created_at']):
+            log.info(f"Replaying the settlement of auction {settlement['auction_id']} in guild {guild_id}")
+            await self.apply_settlement(guild_id, settlement)
+
+    async def replay_settlements(self):
+        """Finish settlements that were interrupted, e.g. by a crash, before the cog was last unloaded."""
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            if guild_data['pending_settlements']:
+                async with self.settlement_locks[guild_id]:
+                    await self.apply_pending_settlements(guild_id)
+
+    async def archive_auction_channel(self, guild: discord.Guild, auction_id: str, channel: discord.TextChannel):
+        """Post the channel's transcript to the log channel, then recycle the channel."""
+        try:
+            log_channel_id = await self.config.guild(guild).log_channel()
+            log_channel = guild.get_channel(log_channel_id)
+            if log_channel:
+                transcript = await export_transcript(channel, auction_id)
+                try:
+                    await log_channel.send(f"Auction #{auction_id} log:", file=transcript)
+                finally:
+                    transcript.close()
+                    transcript.fp.close()
+            await self.recycle_auction_channel(guild, channel)
+        except Exception:
+            # Leave the channel in place so its history is not lost.
+            log.exception(f"Error archiving the channel of auction {auction_id}")
+
+    async def recycle_auction_channel(self, guild: discord.Guild, channel: discord.TextChannel):
+        """Return a finished auction's channel to the pool, or delete it if the pool is full."""
+        try:
+            await self.channel_pool.release(channel, await self.config.guild(guild).channel_pool_size())
+        except discord.HTTPException:
+            log.exception(f"Error recycling auction channel {channel.id} in guild {guild.id}")
+
     async def handle_auction_completion(self, guild: discord.Guild, auction: Dict[str, Any], winner: discord.Member, winning_bid: int):
         log_channel_id = await self.config.guild(guild).log_channel()
         log_channel = guild.get_channel(log_channel_id)
@@ -319,33 +662,68 @@ class AdvancedAuctionSystem(commands.Cog):
                 await log_channel.send(f"/serverevents payout user:{winner.id} quantity:{item['amount']} item:{item['name']}")
             await log_channel.send(f"/serverevents payout user:{auction['user_id']} quantity:{winning_bid}")
 
-        await self.update_user_stats(guild, winner.id, winning_bid, 'won')
-        await self.update_user_stats(guild, auction['user_id'], winning_bid, 'sold')
-        await self.update_reputation(guild, winner.id, 'increase', 'purchase')
-        await self.update_reputation(guild, auction['user_id'], 'increase', 'sale')
-
         try:
             items_str = ", ".join(f"{item['amount']}x {item['name']}" for item in auction['items'])
             await winner.send(f"Congratulations! You won the auction for {items_str} with a bid of {winning_bid:,}. The items will be delivered to you shortly.")
         except discord.HTTPException:
             pass
 
-    async def update_auction_history(self, guild: discord.Guild, auction: Dict[str, Any]):
-        async with self.config.guild(guild).auction_history() as history:
-            history.append(auction)
-        self.analytics.update(auction)
+    async def update_auction_history(self, guild_id: int, auction: Dict[str, Any]):
+        if await self.history_store.append(guild_id, auction):
+            if guild_id in self.history_columns:
+                self.history_columns[guild_id].append(auction)
+            if guild_id in self.leaderboards:
+                self.leaderboards[guild_id].ingest(auction)
+        await self.catch_up_analytics(guild_id)
+
+    async def get_history_columns(self, guild_id: int) -> HistoryColumns:
+        """Columnar view of a guild's history, built from the history store on first use."""
+        columns = self.history_columns.get(guild_id)
+        if columns is None:
+            columns = HistoryColumns()
+            async for auction in self.history_store.iter_range(guild_id):
+                columns.append(auction)
+            self.history_columns[guild_id] = columns
+        return columns
+
+    async def get_leaderboards(self, guild_id: int) -> GuildLeaderboards:
+        """A guild's leaderboards, built from the history store on first use."""
+        leaderboards = self.leaderboards.get(guild_id)
+        if leaderboards is None:
+            leaderboards = GuildLeaderboards()
+            async for auction in self.history_store.iter_range(guild_id):
+                leaderboards.ingest(auction)
+            self.leaderboards[guild_id] = leaderboards
+        return leaderboards
+
+    def invalidate_history_views(self, guild_id: int):
+        """Drop the views derived from a guild's history after it was rewritten."""
+        self.history_columns.pop(guild_id, None)
+        self.leaderboards.pop(guild_id, None)
 
     async def notify_subscribers(self, guild: discord.Guild, auction: Dict[str, Any], channel: discord.TextChannel):
-        async with self.config.all_members(guild)() as all_members:
-            for member_id, member_data in all_members.items():
-                if auction['category'] in member_data.get('subscribed_categories', []):
-                    member = guild.get_member(member_id)
-                    if member:
-                        try:
-                            items_str = ", ".join(f"{item['amount']}x {item['name']}" for item in auction['items'])
-                            await member.send(f"New auction started in your subscribed category '{auction['category']}': {items_str}\n{channel.jump_url}")
-                        except discord.HTTPException:
-                            pass
+        """DM the category's subscribers in the background so starting an auction never waits on delivery."""
+        members = [guild.get_member(member_id) for member_id in self.subscriptions.subscribers(guild.id, auction['category'])]
+        members = [member for member in members if member]
+        if not members:
+            return
+
+        items_str = ", ".join(f"{item['amount']}x {item['name']}" for item in auction['items'])
+        content = f"New auction started in your subscribed category '{auction['category']}': {items_str}\n{channel.jump_url}"
+        task = asyncio.create_task(self.dispatch_notifications(guild, auction['auction_id'], members, content))
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+
+    async def dispatch_notifications(self, guild: discord.Guild, auction_id: str, members: List[discord.Member], content: str):
+        try:
+            stats = await self.dm_dispatcher.send(members, content)
+        except Exception:
+            log.exception(f"Error notifying subscribers of auction {auction_id} in guild {guild.id}")
+            return
+        log.info(
+            f"Notified subscribers of auction {auction_id} in guild {guild.id}: "
+            f"{stats['sent']} sent, {stats['failed']} failed, {stats['retries']} retries"
+        )
 
     @commands.group()
     @checks.admin_or_permissions(manage_guild=True)
@@ -383,6 +761,7 @@ class AdvancedAuctionSystem(commands.Cog):
         """Set bid increment for a specific tier."""
         async with self.config.guild(ctx.guild).bid_increment_tiers() as tiers:
             tiers[str(tier)] = increment
+        self.increment_tables.pop(ctx.guild.id, None)
         await ctx.send(f"Bid increment for tier {tier} set to {increment:,}.")
 
     @auctionset.command(name="categories")
@@ -409,6 +788,48 @@ class AdvancedAuctionSystem(commands.Cog):
         await self.config.guild(ctx.guild).auction_extension_time.set(minutes * 60)
         await ctx.send(f"Auction extension time set to {minutes} minutes.")
 
+    @auctionset.command(name="backups")
+    async def set_backup_schedule(self, ctx: commands.Context, hours: int, snapshot_every: int = 7, retention: int = 3):
+        """Set how often backups run, how many backups make a full snapshot, and how many snapshots to keep.
+
+        Use 0 hours to turn scheduled backups off.
+        """
+        if hours < 0 or snapshot_every < 1 or retention < 1:
+            await ctx.send("Hours cannot be negative, and the snapshot frequency and retention must be at least 1.")
+            return
+        await self.config.guild(ctx.guild).backup_settings.set({
+            "enabled": hours > 0,
+            "interval": hours * 3600,
+            "snapshot_every": snapshot_every,
+            "retention": retention,
+        })
+        if hours:
+            await ctx.send(f"Auction data will be backed up every {hours} hours, with a full snapshot every {snapshot_every} backups and the last {retention} snapshots kept.")
+        else:
+            await ctx.send("Scheduled auction backups have been turned off.")
+
+    @auctionset.command(name="embedinterval")
+    async def set_embed_update_interval(self, ctx: commands.Context, seconds: float):
+        """Set the minimum time between edits of an auction's embed."""
+        if seconds < 0.5:
+            await ctx.send("The embed update interval must be at least 0.5 seconds.")
+            return
+        await self.config.guild(ctx.guild).embed_update_interval.set(seconds)
+        self.embed_updater.set_interval(ctx.guild.id, seconds)
+        await ctx.send(f"Auction embeds will be updated at most once every {seconds:g} seconds.")
+
+    @auctionset.command(name="channelpool")
+    async def set_channel_pool_size(self, ctx: commands.Context, size: int):
+        """Set how many idle auction channels to keep ready for reuse (0 to turn pooling off)."""
+        if not 0 <= size <= 10:
+            await ctx.send("The channel pool size must be between 0 and 10.")
+            return
+        await self.config.guild(ctx.guild).channel_pool_size.set(size)
+        if size:
+            await ctx.send(f"Up to {size} idle auction channels will be kept ready for reuse.")
+        else:
+            await ctx.send("Auction channels will no longer be reused.")
+
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
     async def spawnauction(self, ctx: commands.Context):
@@ -426,200 +847,224 @@ class AdvancedAuctionSystem(commands.Cog):
         message = await ctx.send(embed=embed, view=view)
         view.message = message
 
-class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
-    def __init__(self, cog):
-        super().__init__()
-        self.cog = cog
-
-    items = discord.ui.TextInput(label="Items (name:amount, separate with ;)", style=discord.TextStyle.long, placeholder="e.g. Rare Pepe:1;Golden Coin:5")
-    minimum_bid = discord.ui.TextInput(label="Minimum Bid", style=discord.TextStyle.short, placeholder="e.g. 1000000")
-    donations = discord.ui.TextInput(label="Donations (name:amount, separate with ;)", style=discord.TextStyle.long, placeholder="e.g. Rare Pepe:1;Golden Coin:5", required=False)
-
-    async def on_submit(self, interaction: discord.Interaction):
-        items = [item.strip().split(':') for item in self.items.value.split(';')]
-        items = [{"name": item[0], "amount": int(item[1])} for item in items]
-        min_bid = int(self.minimum_bid.value)
-
-        donations = []
-        if self.donations.value:
-            donations = [donation.strip().split(':') for donation in self.donations.value.split(';')]
-            donations = [{"name": donation[0], "amount": int(donation[1])} for donation in donations]
-
-        total_value = sum(await self.cog.get_item_value(item['name']) * item['amount'] for item in items)
-        category = self.cog.determine_category(total_value)
-        buy_out_price = min(int(total_value * 1.5), total_value + 1000000000)  # Max 150% or value + 1B
-
-        auction_data = {
-            "auction_id": await self.cog.get_next_auction_id(interaction.guild),
-            "user_id": interaction.user.id,
-            "items": items,
-            "min_bid": min_bid,
-            "category": category,
-            "buy_out_price": buy_out_price,
-            "current_bid": 0,
-            "current_bidder": None,
-            "status": "pending",
-            "start_time": None,
-            "end_time": None,
-            "bid_history": [],
-            "proxy_bids": {},
-            "donations": donations,
-        }
-
-        channel = await self.cog.create_auction_channel(interaction.guild, auction_data, interaction.user)
-        
-        async with self.cog.config.guild(interaction.guild).auctions() as auctions:
-            auctions[auction_data['auction_id']] = auction_data
-        
-        await interaction.response.send_message(f"Your auction request has been created. Please check the new channel: {channel.mention}", ephemeral=True)
-
     async def get_item_value(self, item_name: str) -> Optional[int]:
-        current_time = datetime.utcnow().timestamp()
-        if item_name in self.api_cache and current_time - self.api_cache_time[item_name] < 3600:  # Cache for 1 hour
-            return self.api_cache[item_name]
-
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(f"https://api.example.com/items/{item_name}") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        item_value = data['value']
-                        self.api_cache[item_name] = item_value
-                        self.api_cache_time[item_name] = current_time
-                        return item_value
-                    else:
-                        log.error(f"Failed to fetch value for item {item_name}. Status: {response.status}")
-                        return None
-            except aiohttp.ClientError as e:
-                log.error(f"API request error for item {item_name}: {e}")
-                return None
+        return await self.pricing.get_value(item_name)
+
+    async def get_total_value(self, items: List[Dict[str, Any]]) -> Optional[int]:
+        return await self.pricing.get_total_value(items)
+
+    def apply_valuation(self, auction: Dict[str, Any], total_value: int):
+        """Snapshot an auction's value and the bid ceilings derived from it."""
+        auction['total_value'] = total_value
+        auction['max_bid'] = int(total_value * 1.5)
+        auction['max_proxy_bid'] = int(min(total_value * 1.5, total_value + 1000000000))  # Max 150% or value + 1B
+        auction['valued_at'] = datetime.utcnow().timestamp()
+
+    async def ensure_valuation(self, guild: discord.Guild, auction: Dict[str, Any]) -> bool:
+        """Backfill the valuation snapshot of auctions listed before snapshots existed."""
+        if 'max_bid' in auction and 'max_proxy_bid' in auction:
+            return True
+        total_value = await self.get_total_value(auction['items'])
+        if total_value is None:
+            return False
+        self.apply_valuation(auction, total_value)
+        self.auction_store.mark_dirty(guild.id, auction['auction_id'])
+        return True
 
     async def get_next_auction_id(self, guild: discord.Guild) -> str:
-        async with self.config.guild(guild).auctions() as auctions:
-            if not auctions:
-                return "AUC0001"
-            last_id = max(int(aid[3:]) for aid in auctions.keys())
-            return f"AUC{last_id + 1:04d}"
+        return await self.id_allocator.allocate(guild.id, self.auction_store.all(guild.id))
 
     @commands.command()
     async def bid(self, ctx: commands.Context, amount: int):
         """Place a bid on the current auction."""
-        if not ctx.channel.name.startswith("auction-"):
+        auction_id = self.channel_auction_id(ctx.channel)
+        if not auction_id:
             await ctx.send("Bids can only be placed in auction channels.")
             return
 
-        auction_id = ctx.channel.name.split('-')[1]
-        async with self.config.guild(ctx.guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction or auction['status'] != 'active':
-                await ctx.send("There is no active auction in this channel.")
-                return
-
-            if amount <= auction['current_bid']:
-                await ctx.send(f"Your bid must be higher than the current bid of ${auction['current_bid']:,}.")
-                return
-
-            total_value = sum(await self.get_item_value(item['name']) * item['amount'] for item in auction['items'])
-            if amount > total_value * 1.5:
-                await ctx.send(f"Your bid cannot exceed 150% of the item's value (${total_value * 1.5:,}).")
-                return
+        auction = self.auction_store.get(ctx.guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            await ctx.send("There is no active auction in this channel.")
+            return
 
-            auction['current_bid'] = amount
-            auction['current_bidder'] = ctx.author.id
-            auction['bid_history'].append({
-                'user_id': ctx.author.id,
-                'amount': amount,
-                'timestamp': datetime.utcnow().timestamp()
-            })
+        if not await self.ensure_valuation(ctx.guild, auction):
+            await ctx.send("Unable to value the auction items right now. Please try again later.")
+            return
+        error = await self.bid_sequencer.submit(
+            ctx.guild.id, auction_id, partial(self.settle_bid, ctx.guild, auction_id, ctx.author.id, amount)
+        )
+        if error:
+            await ctx.send(error)
+            return
 
-            if amount >= auction['buy_out_price']:
-                await self.end_auction(ctx.guild, auction_id)
-            else:
-                auctions[auction_id] = auction
-                await ctx.send(embed=await self.create_auction_embed(auction))
+        if auction['status'] == 'completed':
+            await self.end_auction(ctx.guild, auction_id)
+        else:
+            self.update_auction_message(ctx.channel, auction)
+            await ctx.tick()
 
     @commands.command()
     async def proxybid(self, ctx: commands.Context, amount: int):
         """Set a maximum proxy bid for the current auction."""
-        if not ctx.channel.name.startswith("auction-"):
+        auction_id = self.channel_auction_id(ctx.channel)
+        if not auction_id:
             await ctx.send("Proxy bids can only be set in auction channels.")
             return
 
-        auction_id = ctx.channel.name.split('-')[1]
-        async with self.config.guild(ctx.guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction or auction['status'] != 'active':
-                await ctx.send("There is no active auction in this channel.")
-                return
+        auction = self.auction_store.get(ctx.guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            await ctx.send("There is no active auction in this channel.")
+            return
 
-            total_value = sum(await self.get_item_value(item['name']) * item['amount'] for item in auction['items'])
-            max_proxy_bid = min(total_value * 1.5, total_value + 1000000000)  # Max 150% or value + 1B
-            
-            if amount > max_proxy_bid:
-                await ctx.send(f"Your proxy bid cannot exceed ${max_proxy_bid:,}.")
-                return
+        if not await self.ensure_valuation(ctx.guild, auction):
+            await ctx.send("Unable to value the auction items right now. Please try again later.")
+            return
+        
+        if amount > auction['max_proxy_bid']:
+            await ctx.send(f"Your proxy bid cannot exceed ${auction['max_proxy_bid']:,}.")
+            return
 
-            auction['proxy_bids'][str(ctx.author.id)] = amount
-            auctions[auction_id] = auction
+        error = await self.bid_sequencer.submit(
+            ctx.guild.id, auction_id, partial(self.settle_proxy_bid, ctx.guild, auction_id, ctx.author.id, amount)
+        )
+        if error:
+            await ctx.send(error)
+            return
 
-            await ctx.send(f"Your maximum proxy bid of ${amount:,} has been set.")
-            await self.process_proxy_bids(ctx.guild, auction_id)
+        await ctx.send(f"Your maximum proxy bid of ${amount:,} has been set.")
+        await self.process_proxy_bids(ctx.guild, auction_id)
+
+    async def settle_bid(self, guild: discord.Guild, auction_id: str, user_id: int, amount: int) -> Optional[str]:
+        """Apply a bid inside the auction's sequencer. Returns an error message if the bid is rejected."""
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            return "This auction is not active."
+
+        if amount <= auction['current_bid']:
+            return f"Your bid must be higher than the current bid of ${auction['current_bid']:,}."
+
+        if amount > auction['max_bid']:
+            return f"Your bid cannot exceed 150% of the item's value (${auction['max_bid']:,})."
+
+        auction['current_bid'] = amount
+        auction['current_bidder'] = user_id
+        auction['bid_history'].append({
+            'user_id': user_id,
+            'amount': amount,
+            'timestamp': datetime.utcnow().timestamp()
+        })
+        self.participants.note(guild.id, auction_id, user_id)
+        self.push_watch_event(guild.id, auction_id, 'bid', f"Auction #{auction_id} has a new bid of ${amount:,}.")
+        self.auction_store.mark_dirty(guild.id, auction_id)
+        if auction.get('buy_out_price') and amount >= auction['buy_out_price']:
+            await self.settle_auction(guild.id, auction)
+        else:
+            await self.apply_snipe_protection(guild, auction)
+            # Standing proxy bids answer a direct bid in the same step.
+            await self.resolve_proxy_bids(guild, auction_id)
+        return None
+
+    async def settle_proxy_bid(self, guild: discord.Guild, auction_id: str, user_id: int, amount: int) -> Optional[str]:
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            return "This auction is not active."
+
+        # Re-insert so the mapping stays in the order the maxima were set, which breaks ties.
+        auction['proxy_bids'].pop(str(user_id), None)
+        auction['proxy_bids'][str(user_id)] = amount
+        self.proxy_book(guild.id, auction).set(user_id, amount)
+        self.participants.note(guild.id, auction_id, user_id)
+        self.auction_store.mark_dirty(guild.id, auction_id)
+        return None
+
+    def proxy_book(self, guild_id: int, auction: Dict[str, Any]) -> ProxyBook:
+        key = (guild_id, auction['auction_id'])
+        book = self.proxy_books.get(key)
+        if book is None:
+            book = self.proxy_books[key] = ProxyBook()
+            for user_id, amount in auction['proxy_bids'].items():
+                book.set(int(user_id), int(amount))
+        return book
+
+    def forget_proxy_state(self, guild_id: int):
+        for key in [key for key in self.proxy_books if key[0] == guild_id]:
+            del self.proxy_books[key]
+        self.increment_tables.pop(guild_id, None)
+
+    async def get_increment_table(self, guild: discord.Guild) -> IncrementTable:
+        table = self.increment_tables.get(guild.id)
+        if table is None:
+            guild_config = self.config.guild(guild)
+            table = self.increment_tables[guild.id] = IncrementTable(
+                await guild_config.bid_increment_tiers(), await guild_config.minimum_bid_increment()
+            )
+        return table
 
     async def process_proxy_bids(self, guild: discord.Guild, auction_id: str):
-        async with self.config.guild(guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction or auction['status'] != 'active':
-                return
-
-            sorted_bids = sorted(auction['proxy_bids'].items(), key=lambda x: int(x[1]), reverse=True)
-            if len(sorted_bids) < 2:
-                return
-
-            top_bidder_id, top_bid = sorted_bids[0]
-            second_highest_bid = int(sorted_bids[1][1])
-
-            if second_highest_bid >= auction['current_bid']:
-                new_bid = min(second_highest_bid + 1, int(top_bid))
-                auction['current_bid'] = new_bid
-                auction['current_bidder'] = int(top_bidder_id)
-                auction['bid_history'].append({
-                    'user_id': int(top_bidder_id),
-                    'amount': new_bid,
-                    'timestamp': datetime.utcnow().timestamp()
-                })
-
-                auctions[auction_id] = auction
+        changed = await self.bid_sequencer.submit(guild.id, auction_id, partial(self.resolve_proxy_bids, guild, auction_id))
+        if not changed:
+            return
 
-                # Notify about the new bid
-                channel = guild.get_channel(auction['channel_id'])
-                if channel:
-                    await channel.send(embed=await self.create_auction_embed(auction))
+        # Notify about the new bid
+        auction = self.auction_store.get(guild.id, auction_id)
+        channel = guild.get_channel(auction['channel_id'])
+        if channel:
+            self.update_auction_message(channel, auction)
+
+    async def resolve_proxy_bids(self, guild: discord.Guild, auction_id: str) -> bool:
+        """Raise the current bid on behalf of proxy bidders. Returns whether the auction changed."""
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            return False
+
+        outcome = resolve_proxy_war(
+            self.proxy_book(guild.id, auction),
+            auction['current_bid'],
+            auction['current_bidder'],
+            auction.get('min_bid') or 0,
+            await self.get_increment_table(guild),
+        )
+        if outcome is None:
+            return False
+
+        bidder, new_bid = outcome
+        auction['current_bid'] = new_bid
+        auction['current_bidder'] = bidder
+        auction['bid_history'].append({
+            'user_id': bidder,
+            'amount': new_bid,
+            'timestamp': datetime.utcnow().timestamp()
+        })
+        self.participants.note(guild.id, auction_id, bidder)
+        self.push_watch_event(guild.id, auction_id, 'bid', f"Auction #{auction_id} has a new bid of ${new_bid:,}.")
+        await self.apply_snipe_protection(guild, auction)
+
+        self.auction_store.mark_dirty(guild.id, auction_id)
+        return True
 
     @commands.command()
     async def auctioninfo(self, ctx: commands.Context, auction_id: Optional[str] = None):
         """Display information about the current or a specific auction."""
-        if not auction_id and ctx.channel.name.startswith("auction-"):
-            auction_id = ctx.channel.name.split('-')[1]
+        if not auction_id:
+            auction_id = self.channel_auction_id(ctx.channel)
 
         if not auction_id:
             await ctx.send("Please provide an auction ID or use this command in an auction channel.")
             return
 
-        async with self.config.guild(ctx.guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction:
-                await ctx.send("Invalid auction ID.")
-                return
+        auction = self.auction_store.get(ctx.guild.id, auction_id)
+        if not auction:
+            await ctx.send("Invalid auction ID.")
+            return
 
-            embed = await self.create_auction_embed(auction)
-            await ctx.send(embed=embed)
+        embed = await self.create_auction_embed(auction)
+        await ctx.send(embed=embed)
 
     @commands.command()
     async def auctionhistory(self, ctx: commands.Context, user: Optional[discord.Member] = None):
         """View auction history for yourself or another user."""
         target = user or ctx.author
-        async with self.config.guild(ctx.guild).auction_history() as history:
-            user_history = [a for a in history if a['user_id'] == target.id or a['current_bidder'] == target.id]
+        user_history = await self.history_store.for_user(ctx.guild.id, target.id)
 
         if not user_history:
             await ctx.send(f"No auction history found for {target.name}.")
@@ -642,26 +1087,60 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
     @checks.admin_or_permissions(manage_guild=True)
     async def cancelauction(self, ctx: commands.Context, auction_id: str):
         """Cancel an ongoing auction."""
-        async with self.config.guild(ctx.guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction:
-                await ctx.send("Invalid auction ID.")
-                return
+        auction = self.auction_store.get(ctx.guild.id, auction_id)
+        if not auction:
+            await ctx.send("Invalid auction ID.")
+            return
 
-            if auction['status'] != 'active':
-                await ctx.send("This auction is not active and cannot be cancelled.")
-                return
+        # Through the sequencer, so a bid or buy-out already queued settles first.
+        error = await self.bid_sequencer.submit(ctx.guild.id, auction_id, partial(self.settle_cancel, ctx.guild, auction_id))
+        if error:
+            await ctx.send(error)
+            return
 
-            auction['status'] = 'cancelled'
-            auctions[auction_id] = auction
+        self.embed_updater.forget(ctx.guild.id, auction_id)
+        self.push_watch_event(ctx.guild.id, auction_id, 'end', f"Auction #{auction_id} was cancelled.")
+        await self.release_watchers(ctx.guild, auction_id)
 
         channel = ctx.guild.get_channel(auction['channel_id'])
         if channel:
             await channel.send("This auction has been cancelled by an administrator.")
-            await channel.delete()
+            task = asyncio.create_task(self.recycle_auction_channel(ctx.guild, channel))
+            self.background_tasks.add(task)
+            task.add_done_callback(self.background_tasks.discard)
 
         await ctx.send(f"Auction #{auction_id} has been cancelled.")
 
+    async def settle_cancel(self, guild: discord.Guild, auction_id: str) -> Optional[str]:
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            return "This auction is not active and cannot be cancelled."
+
+        auction['status'] = 'cancelled'
+        self.auction_store.mark_dirty(guild.id, auction_id)
+        self.auction_scheduler.cancel(guild.id, auction_id)
+        self.auction_channels[guild.id].pop(auction['channel_id'], None)
+        self.proxy_books.pop((guild.id, auction_id), None)
+        return None
+
+    @commands.command()
+    @checks.admin_or_permissions(manage_guild=True)
+    async def revalueauction(self, ctx: commands.Context, auction_id: str):
+        """Refresh the valuation and bid limits of an auction."""
+        auction = self.auction_store.get(ctx.guild.id, auction_id)
+        if not auction:
+            await ctx.send("Invalid auction ID.")
+            return
+
+        total_value = await self.get_total_value(auction['items'])
+        if total_value is None:
+            await ctx.send("Unable to value the auction items right now. Please try again later.")
+            return
+
+        self.apply_valuation(auction, total_value)
+        self.auction_store.mark_dirty(ctx.guild.id, auction_id)
+        await ctx.send(f"Auction #{auction_id} has been revalued at ${total_value:,}. Maximum bid: ${auction['max_bid']:,}.")
+
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
     async def setmoderatorrole(self, ctx: commands.Context, role: discord.Role):
@@ -681,20 +1160,32 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             await ctx.send("No auction moderator role set.")
 
     @commands.command()
-    async def auctionleaderboard(self, ctx: commands.Context):
-        """Display the auction leaderboard."""
-        async with self.config.guild(ctx.guild).user_stats() as user_stats:
-            sorted_stats = sorted(user_stats.items(), key=lambda x: x[1]['total_value'], reverse=True)[:10]
-
-        embed = discord.Embed(title="Auction Leaderboard", color=discord.Color.gold())
-        for i, (user_id, stats) in enumerate(sorted_stats, 1):
-            user = ctx.guild.get_member(int(user_id))
-            if user:
-                embed.add_field(
-                    name=f"{i}. {user.name}",
-                    value=f"Total Value: ${stats['total_value']:,}\nAuctions Won: {stats['auctions_won']}",
-                    inline=False
-                )
+    async def auctionleaderboard(self, ctx: commands.Context, board: str = "value"):
+        """Display the auction leaderboard.
+
+        Boards: `value` (total spent), `wins` (auctions won), `sellers` (total sold) and `items` (quantity sold).
+        """
+        board = board.lower()
+        if board not in GuildLeaderboards.BOARDS:
+            await ctx.send(f"Unknown leaderboard. Choose one of: {', '.join(GuildLeaderboards.BOARDS)}")
+            return
+
+        leaderboards = await self.get_leaderboards(ctx.guild.id)
+        embed = discord.Embed(title=f"Auction Leaderboard ({board.capitalize()})", color=discord.Color.gold())
+        for i, (key, score, count) in enumerate(leaderboards.top(board), 1):
+            if board == "items":
+                embed.add_field(name=f"{i}. {key}", value=f"Quantity Sold: {score:,}", inline=False)
+                continue
+            user = ctx.guild.get_member(key)
+            if not user:
+                continue
+            if board == "value":
+                value = f"Total Value: ${score:,}\nAuctions Won: {count}"
+            elif board == "wins":
+                value = f"Auctions Won: {score}"
+            else:
+                value = f"Total Sold: ${score:,}\nAuctions Sold: {count}"
+            embed.add_field(name=f"{i}. {user.name}", value=value, inline=False)
 
         await ctx.send(embed=embed)
 
@@ -713,6 +1204,7 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
 
         async with self.config.member(ctx.author).subscribed_categories() as subscribed:
             subscribed.extend(cat for cat in categories if cat not in subscribed)
+        self.subscriptions.subscribe(ctx.guild.id, ctx.author.id, categories)
 
         await ctx.send(f"You have been subscribed to the following categories: {', '.join(categories)}")
 
@@ -727,6 +1219,7 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             for cat in categories:
                 if cat in subscribed:
                     subscribed.remove(cat)
+        self.subscriptions.unsubscribe(ctx.guild.id, ctx.author.id, categories)
 
         await ctx.send(f"You have been unsubscribed from the following categories: {', '.join(categories)}")
 
@@ -744,34 +1237,28 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
     async def auctionreport(self, ctx: commands.Context, days: int = 7):
         """Generate a detailed report of auction activity for the specified number of days."""
         guild = ctx.guild
-        async with self.config.guild(guild).auction_history() as history:
-            now = datetime.utcnow().timestamp()
-            relevant_auctions = [a for a in history if now - a['end_time'] <= days * 86400]
+        now = datetime.utcnow().timestamp()
+        columns = await self.get_history_columns(guild.id)
+        summary = columns.summarize(start=now - days * 86400)
 
-        if not relevant_auctions:
+        if not summary:
             await ctx.send(f"No completed auctions in the last {days} days.")
             return
 
-        total_value = sum(a['current_bid'] for a in relevant_auctions)
-        avg_value = total_value / len(relevant_auctions)
-        most_valuable = max(relevant_auctions, key=lambda x: x['current_bid'])
-        most_bids = max(relevant_auctions, key=lambda x: len(x['bid_history']))
-
-        category_stats = defaultdict(lambda: {"count": 0, "value": 0})
-        for auction in relevant_auctions:
-            category_stats[auction['category']]["count"] += 1
-            category_stats[auction['category']]["value"] += auction['current_bid']
+        most_valuable = await self.history_store.get(guild.id, summary['most_valuable'])
+        most_bids = await self.history_store.get(guild.id, summary['most_bids'])
+        category_stats = summary['category_performance']
 
         embed = discord.Embed(title=f"Auction Report (Last {days} Days)", color=discord.Color.gold())
-        embed.add_field(name="Total Auctions", value=len(relevant_auctions), inline=True)
-        embed.add_field(name="Total Value", value=f"${total_value:,}", inline=True)
-        embed.add_field(name="Average Value", value=f"${avg_value:,.2f}", inline=True)
+        embed.add_field(name="Total Auctions", value=summary['total_auctions'], inline=True)
+        embed.add_field(name="Total Value", value=f"${summary['total_value']:,}", inline=True)
+        embed.add_field(name="Average Value", value=f"${summary['avg_value']:,.2f}", inline=True)
         
         most_valuable_items = ', '.join(f"{item['amount']}x {item['name']}" for item in most_valuable['items'])
         embed.add_field(name="Most Valuable Auction", value=f"${most_valuable['current_bid']:,} ({most_valuable_items})", inline=False)
         
         most_bids_items = ', '.join(f"{item['amount']}x {item['name']}" for item in most_bids['items'])
-        embed.add_field(name="Most Bids", value=f"{len(most_bids['bid_history'])} bids ({most_bids_items})", inline=False)
+        embed.add_field(name="Most Bids", value=f"{summary['most_bids_count']} bids ({most_bids_items})", inline=False)
 
         category_report = "\n".join(f"{cat}: {stats['count']} auctions, ${stats['value']:,} total value" for cat, stats in category_stats.items())
         embed.add_field(name="Category Performance", value=category_report, inline=False)
@@ -779,45 +1266,20 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
         await ctx.send(embed=embed)
 
         # Generate and send charts
-        value_chart = await self.create_value_distribution_chart(relevant_auctions)
+        value_chart = await self.create_value_distribution_chart(summary['values'].tolist())
         category_chart = await self.create_category_performance_chart(category_stats)
         await ctx.send(files=[value_chart, category_chart])
 
-    async def create_value_distribution_chart(self, auctions: List[Dict[str, Any]]) -> discord.File:
-        plt.figure(figsize=(10, 6))
-        values = [a['current_bid'] for a in auctions]
-        plt.hist(values, bins=20, edgecolor='black')
-        plt.title("Auction Value Distribution")
-        plt.xlabel("Auction Value")
-        plt.ylabel("Number of Auctions")
-        plt.tight_layout()
-        
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png')
-        buf.seek(0)
-        return discord.File(buf, filename="value_distribution.png")
+    async def create_value_distribution_chart(self, values: List[int]) -> discord.File:
+        return await self.visualization.create_value_distribution_chart(values)
 
     async def create_category_performance_chart(self, category_stats: Dict[str, Dict[str, int]]) -> discord.File:
-        categories = list(category_stats.keys())
-        values = [stats['value'] for stats in category_stats.values()]
-        
-        plt.figure(figsize=(10, 6))
-        plt.bar(categories, values)
-        plt.title("Category Performance")
-        plt.xlabel("Category")
-        plt.ylabel("Total Value")
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png')
-        buf.seek(0)
-        return discord.File(buf, filename="category_performance.png")
+        return await self.visualization.create_category_performance_chart(category_stats)
 
     @commands.command()
     async def auctioninsights(self, ctx: commands.Context):
         """Display insights and analytics about the auction system."""
-        summary = self.analytics.get_summary()
+        summary = self.analytics[ctx.guild.id].get_summary()
         
         embed = discord.Embed(title="Auction System Insights", color=discord.Color.blue())
         embed.add_field(name="Total Auctions", value=str(summary['total_auctions']), inline=True)
@@ -837,25 +1299,21 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
     @commands.command()
     async def auctionsearch(self, ctx: commands.Context, *, query: str):
         """Search for auctions based on item name, category, or seller."""
-        auctions = await self.config.guild(ctx.guild).auctions()
-        results = []
-        
-        for auction in auctions.values():
-            if (query.lower() in [item['name'].lower() for item in auction['items']] or
-                query.lower() in auction['category'].lower() or
-                query == str(auction['user_id'])):
-                results.append(auction)
-        
+        auctions = self.auction_store.all(ctx.guild.id)
+        scores = self.search_index.search(ctx.guild.id, query)
+        results = [auctions[auction_id] for auction_id in scores if auction_id in auctions]
+
         if not results:
             await ctx.send("No matching auctions found.")
             return
-        
-        embeds = []
-        for auction in results:
-            embed = await self.create_auction_embed(auction)
-            embeds.append(embed)
-        
-        await menu(ctx, embeds, DEFAULT_CONTROLS)
+
+        # Best matches first, then live auctions, then the most recent.
+        results.sort(key=lambda a: (-scores[a['auction_id']], a['status'] != 'active', -(a.get('end_time') or 0)))
+
+        async def build_page(index: int) -> discord.Embed:
+            return await self.create_auction_embed(results[index])
+
+        await LazyPageView(ctx.author.id, len(results), build_page).start(ctx)
 
     @commands.command()
     async def savesearch(self, ctx: commands.Context, name: str, *, query: str):
@@ -932,40 +1390,39 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
     @commands.command()
     async def buyauctioninsurance(self, ctx: commands.Context):
         """Buy insurance for your current auction."""
-        if not ctx.channel.name.startswith("auction-"):
+        auction_id = self.channel_auction_id(ctx.channel)
+        if not auction_id:
             await ctx.send("This command can only be used in auction channels.")
             return
         
         guild = ctx.guild
-        auction_id = ctx.channel.name.split("-")[1]
         
-        async with self.config.guild(guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction or auction['user_id'] != ctx.author.id:
-                await ctx.send("You don't have an active auction in this channel.")
-                return
-            
-            if auction.get('insurance_bought', False):
-                await ctx.send("You've already bought insurance for this auction.")
-                return
-            
-            settings = await self.config.guild(guild).global_auction_settings()
-            if not settings.get('insurance_allowed', False):
-                await ctx.send("Auction insurance is not enabled on this server.")
-                return
-            
-            insurance_rate = settings['auction_insurance_rate']
-            insurance_cost = int(auction['min_bid'] * insurance_rate)
-            
-            # Check if user can afford the insurance
-            if not await bank.can_spend(ctx.author, insurance_cost):
-                await ctx.send(f"You don't have enough funds to buy insurance. Cost: ${insurance_cost:,}")
-                return
-            
-            # Deduct insurance cost and mark insurance as bought
-            await bank.withdraw_credits(ctx.author, insurance_cost)
-            auction['insurance_bought'] = True
-            auctions[auction_id] = auction
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['user_id'] != ctx.author.id:
+            await ctx.send("You don't have an active auction in this channel.")
+            return
+        
+        if auction.get('insurance_bought', False):
+            await ctx.send("You've already bought insurance for this auction.")
+            return
+        
+        settings = await self.config.guild(guild).global_auction_settings()
+        if not settings.get('insurance_allowed', False):
+            await ctx.send("Auction insurance is not enabled on this server.")
+            return
+        
+        insurance_rate = settings['auction_insurance_rate']
+        insurance_cost = int(auction['min_bid'] * insurance_rate)
+        
+        # Check if user can afford the insurance
+        if not await bank.can_spend(ctx.author, insurance_cost):
+            await ctx.send(f"You don't have enough funds to buy insurance. Cost: ${insurance_cost:,}")
+            return
+        
+        # Deduct insurance cost and mark insurance as bought
+        await bank.withdraw_credits(ctx.author, insurance_cost)
+        auction['insurance_bought'] = True
+        self.auction_store.mark_dirty(guild.id, auction_id)
         
         await ctx.send(f"You've successfully bought insurance for your auction. Cost: ${insurance_cost:,}")
 
@@ -984,7 +1441,8 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
         if not channel:
             return
 
-        total_value = sum(await self.get_item_value(item['name']) * item['amount'] for item in auction['items'])
+        await self.ensure_valuation(guild, auction)
+        total_value = auction.get('total_value', 0)
         massive_threshold = await self.config.guild(guild).massive_auction_threshold()
 
         if total_value >= massive_threshold:
@@ -1007,31 +1465,21 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
     async def topauctioneer(self, ctx: commands.Context):
         """Display the top auctioneer based on total value sold."""
         guild = ctx.guild
-        async with self.config.guild(guild).auction_history() as history:
-            if not history:
-                await ctx.send("No auction history available.")
-                return
-
-            seller_stats = defaultdict(lambda: {"total_value": 0, "auctions_count": 0})
-            for auction in history:
-                if auction['status'] == 'completed':
-                    seller_stats[auction['user_id']]["total_value"] += auction['current_bid']
-                    seller_stats[auction['user_id']]["auctions_count"] += 1
-
-            if not seller_stats:
-                await ctx.send("No completed auctions found.")
-                return
+        seller_totals = (await self.get_leaderboards(guild.id)).top("sellers", 1)
+        if not seller_totals:
+            await ctx.send("No completed auctions found.")
+            return
 
-            top_seller_id = max(seller_stats, key=lambda x: seller_stats[x]["total_value"])
-            top_seller = guild.get_member(top_seller_id)
-            top_seller_name = top_seller.name if top_seller else f"User ID: {top_seller_id}"
+        top_seller_id, total_value, auctions_count = seller_totals[0]
+        top_seller = guild.get_member(top_seller_id)
+        top_seller_name = top_seller.name if top_seller else f"User ID: {top_seller_id}"
 
-            embed = discord.Embed(title="Top Auctioneer", color=discord.Color.gold())
-            embed.add_field(name="Auctioneer", value=top_seller_name, inline=False)
-            embed.add_field(name="Total Value Sold", value=f"${seller_stats[top_seller_id]['total_value']:,}", inline=True)
-            embed.add_field(name="Auctions Completed", value=str(seller_stats[top_seller_id]['auctions_count']), inline=True)
+        embed = discord.Embed(title="Top Auctioneer", color=discord.Color.gold())
+        embed.add_field(name="Auctioneer", value=top_seller_name, inline=False)
+        embed.add_field(name="Total Value Sold", value=f"${total_value:,}", inline=True)
+        embed.add_field(name="Auctions Completed", value=str(auctions_count), inline=True)
 
-            await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
@@ -1077,24 +1525,28 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
     async def auctionextension(self, ctx: commands.Context, auction_id: str, minutes: int):
         """Request an extension for an ongoing auction."""
         guild = ctx.guild
-        async with self.config.guild(guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction or auction['status'] != 'active':
-                await ctx.send("Invalid auction ID or the auction is not active.")
-                return
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            await ctx.send("Invalid auction ID or the auction is not active.")
+            return
 
-            if ctx.author.id != auction['user_id']:
-                await ctx.send("Only the auction creator can request an extension.")
-                return
+        if ctx.author.id != auction['user_id']:
+            await ctx.send("Only the auction creator can request an extension.")
+            return
 
-            max_extensions = await self.config.guild(guild).max_auction_extensions()
-            if auction.get('extensions', 0) >= max_extensions:
-                await ctx.send(f"This auction has already been extended the maximum number of times ({max_extensions}).")
-                return
+        max_extensions = await self.config.guild(guild).max_auction_extensions()
+        if auction.get('extensions', 0) >= max_extensions:
+            await ctx.send(f"This auction has already been extended the maximum number of times ({max_extensions}).")
+            return
 
-            auction['end_time'] += minutes * 60
-            auction['extensions'] = auction.get('extensions', 0) + 1
-            auctions[auction_id] = auction
+        auction['end_time'] += minutes * 60
+        auction['extensions'] = auction.get('extensions', 0) + 1
+        self.auction_store.mark_dirty(guild.id, auction_id)
+        self.auction_scheduler.schedule(guild.id, auction_id, auction['end_time'])
+        self.push_watch_event(
+            guild.id, auction_id, 'extension',
+            f"Auction #{auction_id} was extended and now ends <t:{int(auction['end_time'])}:R>."
+        )
 
         await ctx.send(f"Auction #{auction_id} has been extended by {minutes} minutes. New end time: <t:{int(auction['end_time'])}:F>")
 
@@ -1126,7 +1578,10 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
                 return
 
         bundle_name = f"Bundle: {', '.join(item['name'] for item in bundle_items)}"
-        total_value = sum(await self.get_item_value(item['name']) * item['amount'] for item in bundle_items)
+        total_value = await self.get_total_value(bundle_items)
+        if total_value is None:
+            await ctx.send("Unable to value the auction items right now. Please try again later.")
+            return
 
         if not await self.check_auction_limits(ctx.guild, ctx.author.id):
             await ctx.send("You have reached the maximum number of active auctions or are in the cooldown period.")
@@ -1139,7 +1594,6 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             "min_bid": int(total_value * 0.8),  # Set minimum bid to 80% of total value
             "category": "Bundle",
             "status": "pending",
-            "total_value": total_value,
             "current_bid": 0,
             "current_bidder": None,
             "bid_history": [],
@@ -1147,6 +1601,7 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             "end_time": None,
             "proxy_bids": {},
         }
+        self.apply_valuation(auction_data, total_value)
 
         await self.create_auction_channel(ctx.guild, auction_data, ctx.author)
         await ctx.send(f"Bundle auction created: {bundle_name}")
@@ -1155,16 +1610,16 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
     async def auctionwatch(self, ctx: commands.Context, auction_id: str):
         """Add an auction to your watch list."""
         guild = ctx.guild
-        async with self.config.guild(guild).auctions() as auctions:
-            if auction_id not in auctions:
-                await ctx.send("Invalid auction ID.")
-                return
+        if not self.auction_store.get(guild.id, auction_id):
+            await ctx.send("Invalid auction ID.")
+            return
 
-            async with self.config.member(ctx.author).watched_auctions() as watched:
-                if auction_id in watched:
-                    await ctx.send("This auction is already in your watch list.")
-                    return
-                watched.append(auction_id)
+        async with self.config.member(ctx.author).watched_auctions() as watched:
+            if auction_id in watched:
+                await ctx.send("This auction is already in your watch list.")
+                return
+            watched.append(auction_id)
+        self.watch_index.watch(guild.id, ctx.author.id, auction_id)
 
         await ctx.send(f"Auction #{auction_id} has been added to your watch list.")
 
@@ -1176,6 +1631,7 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
                 await ctx.send("This auction is not in your watch list.")
                 return
             watched.remove(auction_id)
+        self.watch_index.unwatch(ctx.guild.id, ctx.author.id, auction_id)
 
         await ctx.send(f"Auction #{auction_id} has been removed from your watch list.")
 
@@ -1188,17 +1644,16 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             return
 
         guild = ctx.guild
-        async with self.config.guild(guild).auctions() as auctions:
-            embed = discord.Embed(title="Your Auction Watch List", color=discord.Color.blue())
-            for auction_id in watched:
-                auction = auctions.get(auction_id)
-                if auction:
-                    items_str = ", ".join(f"{item['amount']}x {item['name']}" for item in auction['items'])
-                    embed.add_field(
-                        name=f"Auction #{auction_id}",
-                        value=f"Items: {items_str}\nCurrent Bid: ${auction['current_bid']:,}\nEnds: <t:{int(auction['end_time'])}:R>",
-                        inline=False
-                    )
+        embed = discord.Embed(title="Your Auction Watch List", color=discord.Color.blue())
+        for auction_id in watched:
+            auction = self.auction_store.get(guild.id, auction_id)
+            if auction:
+                items_str = ", ".join(f"{item['amount']}x {item['name']}" for item in auction['items'])
+                embed.add_field(
+                    name=f"Auction #{auction_id}",
+                    value=f"Items: {items_str}\nCurrent Bid: ${auction['current_bid']:,}\nEnds: <t:{int(auction['end_time'])}:R>",
+                    inline=False
+                )
 
         await ctx.send(embed=embed)
 
@@ -1265,11 +1720,17 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             key, value = line.split(':')
             auction_data[key.strip()] = value.strip()
 
+        items = [{"name": auction_data["item"], "amount": int(auction_data["amount"])}]
+        total_value = await self.get_total_value(items)
+        if total_value is None:
+            await ctx.send("Unable to value the auction items right now. Please try again later.")
+            return
+
         # Convert the parsed data into the format expected by create_auction_channel
         formatted_auction_data = {
             "auction_id": await self.get_next_auction_id(ctx.guild),
             "user_id": ctx.author.id,
-            "items": [{"name": auction_data["item"], "amount": int(auction_data["amount"])}],
+            "items": items,
             "min_bid": int(auction_data["min_bid"]),
             "category": auction_data["category"],
             "status": "pending",
@@ -1280,55 +1741,104 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             "end_time": None,
             "proxy_bids": {},
         }
+        self.apply_valuation(formatted_auction_data, total_value)
 
         # Create the auction channel
         channel = await self.create_auction_channel(ctx.guild, formatted_auction_data, ctx.author)
 
         # Add the auction to the guild's auctions
-        async with self.config.guild(ctx.guild).auctions() as auctions:
-            auctions[formatted_auction_data['auction_id']] = formatted_auction_data
+        self.auction_store.put(ctx.guild.id, formatted_auction_data)
+        self.route_channel(ctx.guild.id, channel.id, formatted_auction_data['auction_id'])
+        self.search_index.add(ctx.guild.id, formatted_auction_data)
+        self.participants.add(ctx.guild.id, formatted_auction_data)
     
         await ctx.send(f"Auction created using the template. Please check the new channel: {channel.mention}")
 
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
-    async def auctionbackup(self, ctx: commands.Context):
-        """Create a backup of all auction data."""
-        guild = ctx.guild
-        backup_data = {
-            "auctions": await self.config.guild(guild).auctions(),
-            "auction_history": await self.config.guild(guild).auction_history(),
-            "settings": await self.config.guild(guild).get_raw(),
-        }
+    async def auctionbackup(self, ctx: commands.Context, full: bool = False):
+        """Back up all auction data now.
 
-        filename = f"auction_backup_{guild.id}_{int(datetime.utcnow().timestamp())}.json"
-        with open(filename, 'w') as f:
-            json.dump(backup_data, f, indent=4)
+        Writes a compressed snapshot, or a delta against the previous backup unless `full` is set.
+        """
+        guild = ctx.guild
+        async with ctx.typing():
+            entry = await self.create_backup(guild, full=full)
+        if not entry:
+            await ctx.send("The backup failed. Check the bot's logs for details.")
+            return
 
-        await ctx.send("Auction data backup created.", file=discord.File(filename))
-        os.remove(filename)
+        message = f"Auction data backup created: `{entry['file']}` ({entry['kind']}, {entry['records']:,} records, {entry['size'] / 1024:,.1f} KiB)."
+        if entry['kind'] == 'snapshot' and entry['size'] <= guild.filesize_limit:
+            await ctx.send(message, file=discord.File(self.backups.guild_path(guild.id) / entry['file']))
+        else:
+            await ctx.send(message)
 
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
-    async def auctionrestore(self, ctx: commands.Context):
-        """Restore auction data from a backup file."""
-        if not ctx.message.attachments:
-            await ctx.send("Please attach the backup file when using this command.")
+    async def auctionbackups(self, ctx: commands.Context):
+        """List the stored auction backups."""
+        entries = await self.backups.entries(ctx.guild.id)
+        if not entries:
+            await ctx.send("No auction backups have been made yet.")
             return
 
-        attachment = ctx.message.attachments[0]
-        if not attachment.filename.endswith('.json'):
-            await ctx.send("Please attach a valid JSON backup file.")
-            return
+        lines = [
+            f"{entry['file']}  {entry['kind']:<8}  {datetime.utcfromtimestamp(entry['created_at']):%Y-%m-%d %H:%M}  {entry['records']:>8,} records"
+            for entry in entries
+        ]
+        for page in pagify("\n".join(lines)):
+            await ctx.send(box(page))
 
+    @commands.command()
+    @checks.admin_or_permissions(manage_guild=True)
+    async def auctionrestore(self, ctx: commands.Context, backup: Optional[str] = None):
+        """Restore auction data from a stored backup or an attached backup file.
+
+        Without arguments the latest stored backup is restored. Pass a name from `auctionbackups` to restore an earlier one.
+        """
+        guild = ctx.guild
+        if ctx.message.attachments:
+            attachment = ctx.message.attachments[0]
+            if attachment.filename.endswith('.json'):
+                await self.restore_legacy_backup(ctx, attachment)
+                return
+            if not attachment.filename.endswith('.jsonl.gz'):
+                await ctx.send("Please attach a `.jsonl.gz` snapshot or a legacy `.json` backup file.")
+                return
+
+        async with ctx.typing():
+            upload = None
+            try:
+                if ctx.message.attachments:
+                    upload = self.backups.guild_path(guild.id) / f"upload-{ctx.message.id}.jsonl.gz"
+                    upload.parent.mkdir(parents=True, exist_ok=True)
+                    await ctx.message.attachments[0].save(upload)
+                    header = await self.backups.verify(upload)
+                    if header['kind'] != 'snapshot':
+                        raise BackupError("Only snapshot backups can be restored from a file.")
+                    paths = [upload]
+                else:
+                    paths = await self.backups.chain(guild.id, backup)
+                settings, auctions = await self.backups.restore(guild.id, paths)
+            except BackupError as e:
+                await ctx.send(f"The backup could not be restored: {e}")
+                return
+            finally:
+                if upload:
+                    upload.unlink(missing_ok=True)
+
+            await self.apply_restored_data(guild, settings, auctions)
+        await ctx.send(f"Auction data has been restored from {len(paths)} backup file(s).")
+
+    async def restore_legacy_backup(self, ctx: commands.Context, attachment: discord.Attachment):
         try:
             backup_content = await attachment.read()
             backup_data = json.loads(backup_content)
 
             guild = ctx.guild
-            await self.config.guild(guild).auctions.set(backup_data["auctions"])
-            await self.config.guild(guild).auction_history.set(backup_data["auction_history"])
-            await self.config.guild(guild).set_raw(value=backup_data["settings"])
+            await self.history_store.replace(guild.id, backup_data["auction_history"])
+            await self.apply_restored_data(guild, backup_data["settings"], backup_data["auctions"])
 
             await ctx.send("Auction data has been restored from the backup.")
         except json.JSONDecodeError:
@@ -1336,40 +1846,49 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
         except KeyError:
             await ctx.send("The backup file is missing required data.")
 
+    async def apply_restored_data(self, guild: discord.Guild, settings: Dict[str, Any], auctions: Dict[str, Dict[str, Any]]):
+        """Install restored settings and auctions once the history store has been repopulated."""
+        # Auctions live in their own Config groups; a legacy backup's copy must not land in the guild scope.
+        settings.pop('auctions', None)
+        await self.config.guild(guild).set_raw(value=settings)
+        await self.config.guild(guild).auction_history.set([])
+        self.invalidate_history_views(guild.id)
+        self.auction_store.replace(guild.id, auctions)
+        self.rebuild_auction_schedule(guild.id)
+        self.rebuild_channel_routes(guild.id)
+        self.search_index.rebuild(guild.id, self.auction_store.all(guild.id).values())
+        self.participants.rebuild(guild.id, self.auction_store.all(guild.id).values())
+        await self.id_allocator.reset(guild.id)
+        self.forget_proxy_state(guild.id)
+        self.embed_updater.set_interval(guild.id, await self.config.guild(guild).embed_update_interval())
+        # The restored history rows were given new seqs, so the restored snapshot cannot be caught up.
+        self.analytics[guild.id] = AuctionAnalytics()
+        self.dirty_analytics.add(guild.id)
+        await self.catch_up_analytics(guild.id)
+
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
     async def auctionmetrics(self, ctx: commands.Context, days: int = 30):
         """Display advanced auction metrics for the specified number of days."""
         guild = ctx.guild
-        async with self.config.guild(guild).auction_history() as history:
-            now = datetime.utcnow().timestamp()
-            relevant_auctions = [a for a in history if now - a['end_time'] <= days * 86400]
+        now = datetime.utcnow().timestamp()
+        columns = await self.get_history_columns(guild.id)
+        summary = columns.summarize(start=now - days * 86400)
 
-        if not relevant_auctions:
+        if not summary:
             await ctx.send(f"No completed auctions in the last {days} days.")
             return
 
-        total_auctions = len(relevant_auctions)
-        total_value = sum(a['current_bid'] for a in relevant_auctions)
-        avg_value = total_value / total_auctions
-        median_value = sorted(a['current_bid'] for a in relevant_auctions)[total_auctions // 2]
-        total_unique_bidders = len(set(bid['user_id'] for a in relevant_auctions for bid in a['bid_history']))
-        total_unique_sellers = len(set(a['user_id'] for a in relevant_auctions))
-        avg_bids_per_auction = sum(len(a['bid_history']) for a in relevant_auctions) / total_auctions
-        
-        category_performance = defaultdict(lambda: {"count": 0, "value": 0})
-        for auction in relevant_auctions:
-            category_performance[auction['category']]["count"] += 1
-            category_performance[auction['category']]["value"] += auction['current_bid']
+        category_performance = summary['category_performance']
 
         embed = discord.Embed(title=f"Advanced Auction Metrics (Last {days} Days)", color=discord.Color.gold())
-        embed.add_field(name="Total Auctions", value=str(total_auctions), inline=True)
-        embed.add_field(name="Total Value", value=f"${total_value:,}", inline=True)
-        embed.add_field(name="Average Value", value=f"${avg_value:,.2f}", inline=True)
-        embed.add_field(name="Median Value", value=f"${median_value:,}", inline=True)
-        embed.add_field(name="Unique Bidders", value=str(total_unique_bidders), inline=True)
-        embed.add_field(name="Unique Sellers", value=str(total_unique_sellers), inline=True)
-        embed.add_field(name="Avg. Bids per Auction", value=f"{avg_bids_per_auction:.2f}", inline=True)
+        embed.add_field(name="Total Auctions", value=str(summary['total_auctions']), inline=True)
+        embed.add_field(name="Total Value", value=f"${summary['total_value']:,}", inline=True)
+        embed.add_field(name="Average Value", value=f"${summary['avg_value']:,.2f}", inline=True)
+        embed.add_field(name="Median Value", value=f"${summary['median_value']:,}", inline=True)
+        embed.add_field(name="Unique Bidders", value=str(summary['unique_bidders']), inline=True)
+        embed.add_field(name="Unique Sellers", value=str(summary['unique_sellers']), inline=True)
+        embed.add_field(name="Avg. Bids per Auction", value=f"{summary['avg_bids_per_auction']:.2f}", inline=True)
 
         category_stats = "\n".join(f"{cat}: {stats['count']} auctions, ${stats['value']:,} total value" for cat, stats in category_performance.items())
         embed.add_field(name="Category Performance", value=category_stats, inline=False)
@@ -1377,7 +1896,7 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
         await ctx.send(embed=embed)
 
         # Generate and send additional charts
-        value_distribution_chart = await self.create_value_distribution_chart(relevant_auctions)
+        value_distribution_chart = await self.create_value_distribution_chart(summary['values'].tolist())
         category_performance_chart = await self.create_category_performance_chart(category_performance)
         await ctx.send(files=[value_distribution_chart, category_performance_chart])
 
@@ -1391,7 +1910,7 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             "`proxybid <amount>`: Set a maximum proxy bid",
             "`auctioninfo [auction_id]`: Display auction information",
             "`auctionhistory [user]`: View auction history",
-            "`auctionleaderboard`: View top auction participants",
+            "`auctionleaderboard [board]`: View top buyers, winners, sellers or items",
             "`auctionsubscribe <categories>`: Subscribe to auction categories",
             "`auctionunsubscribe <categories>`: Unsubscribe from categories",
             "`mysubscriptions`: View your category subscriptions",
@@ -1413,6 +1932,7 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             "`auctionset`: Configure auction settings",
             "`spawnauction`: Create a new auction request button",
             "`cancelauction <auction_id>`: Cancel an auction",
+            "`revalueauction <auction_id>`: Refresh an auction's valuation and bid limits",
             "`setmoderatorrole <role>`: Set the auction moderator role",
             "`listmoderatorroles`: List auction moderator roles",
             "`auctionreport [days]`: Generate an auction report",
@@ -1428,8 +1948,9 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             "`deleteauctiontemplate <name>`: Delete an auction template",
             "`listauctiontemplatenames`: List all auction template names",
             "`viewauctiontemplate <name>`: View a specific auction template",
-            "`auctionbackup`: Create a backup of all auction data",
-            "`auctionrestore`: Restore auction data from a backup file",
+            "`auctionbackup [full]`: Back up all auction data",
+            "`auctionbackups`: List stored auction backups",
+            "`auctionrestore [backup]`: Restore auction data from a stored backup or an attached file",
             "`auctionmetrics [days]`: Display advanced auction metrics",
         ]
         
@@ -1438,34 +1959,35 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
         
         await ctx.send(embed=embed)
 
-    def cog_unload(self):
-        """Clean up when cog is unloaded."""
-        self.bot.loop.create_task(self._unload())
-
-    async def _unload(self):
-        """Cancel any ongoing tasks."""
-        if self.auction_task:
-            self.auction_task.cancel()
-
     async def red_delete_data_for_user(self, *, requester: str, user_id: int):
         """Delete user data when requested."""
         for guild in self.bot.guilds:
-            async with self.config.guild(guild).auction_history() as history:
-                for auction in history:
-                    if auction['user_id'] == user_id:
-                        auction['user_id'] = None
-                    auction['bid_history'] = [bid for bid in auction['bid_history'] if bid['user_id'] != user_id]
-                    if auction['current_bidder'] == user_id:
-                        auction['current_bidder'] = None
+            scrubbed = False
+            for auction in await self.history_store.involving(guild.id, user_id):
+                if auction['user_id'] == user_id:
+                    auction['user_id'] = None
+                auction['bid_history'] = bid_history(auction).without_user(user_id)
+                if auction['current_bidder'] == user_id:
+                    auction['current_bidder'] = None
+                auction.get('proxy_bids', {}).pop(str(user_id), None)
+                await self.history_store.update(guild.id, auction)
+                scrubbed = True
+            if scrubbed:
+                self.invalidate_history_views(guild.id)
+                # Deltas only carry new history rows, so the scrubbed rows need a fresh snapshot.
+                await self.backups.force_snapshot(guild.id)
             
             async with self.config.guild(guild).banned_users() as banned_users:
                 if user_id in banned_users:
                     banned_users.remove(user_id)
 
-            async with self.config.guild(guild).auctions() as auctions:
-                for auction in auctions.values():
-                    if str(user_id) in auction['proxy_bids']:
-                        del auction['proxy_bids'][str(user_id)]
+            for auction_id in self.participants.auctions(guild.id, user_id):
+                auction = self.auction_store.get(guild.id, auction_id)
+                if auction and str(user_id) in auction['proxy_bids']:
+                    del auction['proxy_bids'][str(user_id)]
+                    self.auction_store.mark_dirty(guild.id, auction_id)
+                    if (guild.id, auction_id) in self.proxy_books:
+                        self.proxy_books[guild.id, auction_id].remove(user_id)
 
         await self.config.user_from_id(user_id).clear()
 
@@ -1502,9 +2024,10 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
             async def on_submit(self, interaction: discord.Interaction):
                 try:
                     amount = int(self.bid_amount.value)
-                    await self.cog.handle_bid(interaction, self.auction['auction_id'], amount)
                 except ValueError:
                     await interaction.response.send_message("Invalid bid amount. Please enter a number.", ephemeral=True)
+                    return
+                await self.cog.handle_bid(interaction, self.auction['auction_id'], amount)
 
         class ConfirmBuyout(discord.ui.View):
             def __init__(self, cog, auction):
@@ -1522,74 +2045,94 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
 
     async def handle_bid(self, interaction: discord.Interaction, auction_id: str, amount: int):
         guild = interaction.guild
-        async with self.config.guild(guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction or auction['status'] != 'active':
-                await interaction.response.send_message("This auction is not active.", ephemeral=True)
-                return
-
-            if amount <= auction['current_bid']:
-                await interaction.response.send_message(f"Your bid must be higher than the current bid of ${auction['current_bid']:,}.", ephemeral=True)
-                return
-
-            total_value = sum(await self.get_item_value(item['name']) * item['amount'] for item in auction['items'])
-            if amount > total_value * 1.5:
-                await interaction.response.send_message(f"Your bid cannot exceed 150% of the item's value (${total_value * 1.5:,}).", ephemeral=True)
-                return
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            await interaction.response.send_message("This auction is not active.", ephemeral=True)
+            return
 
-            auction['current_bid'] = amount
-            auction['current_bidder'] = interaction.user.id
-            auction['bid_history'].append({
-                'user_id': interaction.user.id,
-                'amount': amount,
-                'timestamp': datetime.utcnow().timestamp()
-            })
+        # Acknowledge first; legacy auctions without a valuation snapshot still need a lookup.
+        await interaction.response.defer(ephemeral=True)
+        if not await self.ensure_valuation(guild, auction):
+            await interaction.followup.send("Unable to value the auction items right now. Please try again later.", ephemeral=True)
+            return
+        error = await self.bid_sequencer.submit(
+            guild.id, auction_id, partial(self.settle_bid, guild, auction_id, interaction.user.id, amount)
+        )
+        if error:
+            await interaction.followup.send(error, ephemeral=True)
+            return
 
-            auctions[auction_id] = auction
-            
-            await interaction.response.send_message(f"Your bid of ${amount:,} has been placed!", ephemeral=True)
-            await self.update_auction_message(interaction.channel, auction)
+        await interaction.followup.send(f"Your bid of ${amount:,} has been placed!", ephemeral=True)
+        if auction['status'] == 'completed':
+            await self.end_auction(guild, auction_id)
+        else:
+            self.update_auction_message(interaction.channel, auction)
 
     async def handle_buyout(self, interaction: discord.Interaction, auction_id: str):
         guild = interaction.guild
-        async with self.config.guild(guild).auctions() as auctions:
-            auction = auctions.get(auction_id)
-            if not auction or auction['status'] != 'active':
-                await interaction.response.send_message("This auction is not active.", ephemeral=True)
-                return
-
-            if not auction.get('buy_out_price'):
-                await interaction.response.send_message("This auction doesn't have a buy-out option.", ephemeral=True)
-                return
-
-            if not await bank.can_spend(interaction.user, auction['buy_out_price']):
-                await interaction.response.send_message(f"You don't have enough funds to buy out this auction. You need ${auction['buy_out_price']:,}.", ephemeral=True)
-                return
-
-            await bank.withdraw_credits(interaction.user, auction['buy_out_price'])
-            auction['current_bid'] = auction['buy_out_price']
-            auction['current_bidder'] = interaction.user.id
-            auction['status'] = 'completed'
-            auctions[auction_id] = auction
-
-            await interaction.response.send_message(f"Congratulations! You've bought out the auction for ${auction['buy_out_price']:,}!", ephemeral=True)
-            await self.end_auction(guild, auction_id)
+        await interaction.response.defer(ephemeral=True)
+        error = await self.bid_sequencer.submit(guild.id, auction_id, partial(self.settle_buyout, guild, auction_id, interaction.user))
+        if error:
+            await interaction.followup.send(error, ephemeral=True)
+            return
 
-    async def update_auction_message(self, channel: discord.TextChannel, auction: Dict[str, Any]):
-        message = await channel.fetch_message(auction['message_id'])
-        embed = await self.create_auction_embed(auction)
-        await message.edit(embed=embed)
+        auction = self.auction_store.get(guild.id, auction_id)
+        await interaction.followup.send(f"Congratulations! You've bought out the auction for ${auction['buy_out_price']:,}!", ephemeral=True)
+        await self.end_auction(guild, auction_id)
+
+    async def settle_buyout(self, guild: discord.Guild, auction_id: str, member: discord.Member) -> Optional[str]:
+        auction = self.auction_store.get(guild.id, auction_id)
+        if not auction or auction['status'] != 'active':
+            return "This auction is not active."
+
+        if not auction.get('buy_out_price'):
+            return "This auction doesn't have a buy-out option."
+
+        if not await bank.can_spend(member, auction['buy_out_price']):
+            return f"You don't have enough funds to buy out this auction. You need ${auction['buy_out_price']:,}."
+
+        await bank.withdraw_credits(member, auction['buy_out_price'])
+        auction['current_bid'] = auction['buy_out_price']
+        auction['current_bidder'] = member.id
+        self.auction_store.mark_dirty(guild.id, auction_id)
+        await self.settle_auction(guild.id, auction)
+        return None
+
+    def update_auction_message(self, channel: discord.TextChannel, auction: Dict[str, Any]):
+        self.embed_updater.request(channel, auction['auction_id'], auction.get('message_id'))
+
+    async def create_auction_embed(self, auction: Dict[str, Any]) -> discord.Embed:
+        embed = discord.Embed(title=f"Auction #{auction['auction_id']}", color=discord.Color.gold())
+        items_str = "\n".join(f"{item['amount']}x {item['name']}" for item in auction['items'])
+        embed.add_field(name="Items", value=items_str, inline=False)
+        embed.add_field(name="Current Bid", value=f"${auction['current_bid']:,}", inline=True)
+        bidder = f"<@{auction['current_bidder']}>" if auction.get('current_bidder') else "No bids yet"
+        embed.add_field(name="Top Bidder", value=bidder, inline=True)
+        embed.add_field(name="Minimum Bid", value=f"${auction['min_bid']:,}", inline=True)
+        if auction.get('buy_out_price'):
+            embed.add_field(name="Buy-out Price", value=f"${auction['buy_out_price']:,}", inline=True)
+        embed.add_field(name="Category", value=auction['category'], inline=True)
+        if auction.get('end_time'):
+            embed.add_field(name="Ends", value=f"<t:{int(auction['end_time'])}:R>", inline=True)
+        embed.set_footer(text=f"Status: {auction['status'].capitalize()}")
+        return embed
+
+    async def render_auction_embed(self, guild_id: int, auction_id: str) -> Optional[discord.Embed]:
+        auction = self.auction_store.get(guild_id, auction_id)
+        if not auction:
+            return None
+        return await self.create_auction_embed(auction)
 
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
     async def pruneauctionhistory(self, ctx: commands.Context, days: int):
         """Remove auction history older than the specified number of days."""
         guild = ctx.guild
-        async with self.config.guild(guild).auction_history() as history:
-            current_time = datetime.utcnow().timestamp()
-            original_length = len(history)
-            history[:] = [auction for auction in history if current_time - auction['end_time'] <= days * 86400]
-            pruned_count = original_length - len(history)
+        current_time = datetime.utcnow().timestamp()
+        pruned_count = await self.history_store.prune(guild.id, before=current_time - days * 86400)
+        self.invalidate_history_views(guild.id)
+        if pruned_count:
+            await self.backups.force_snapshot(guild.id)
 
         await ctx.send(f"Pruned {pruned_count} auctions from the history.")
 
@@ -1610,7 +2153,19 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
 
         await self.config.guild(ctx.guild).clear()
         await self.config.guild(ctx.guild).set(self.config.guild(ctx.guild).defaults)
-        self.analytics = AuctionAnalytics()  # Reset analytics
+        await self.auction_store.clear(ctx.guild.id)
+        self.rebuild_auction_schedule(ctx.guild.id)
+        self.rebuild_channel_routes(ctx.guild.id)
+        self.search_index.clear(ctx.guild.id)
+        self.participants.clear(ctx.guild.id)
+        await self.id_allocator.reset(ctx.guild.id)
+        self.forget_proxy_state(ctx.guild.id)
+        self.channel_pool.forget(ctx.guild.id)
+        await self.history_store.clear(ctx.guild.id)
+        await self.backups.force_snapshot(ctx.guild.id)
+        self.invalidate_history_views(ctx.guild.id)
+        self.analytics[ctx.guild.id] = AuctionAnalytics()  # Reset analytics
+        self.dirty_analytics.discard(ctx.guild.id)
         await ctx.send("All auction data has been reset.")
 
     @commands.command()
@@ -1628,6 +2183,62 @@ class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
         
         await ctx.send(embed=embed)
 
+class AuctionDetailsModal(discord.ui.Modal, title="Auction Details"):
+    def __init__(self, cog):
+        super().__init__()
+        self.cog = cog
+
+    items = discord.ui.TextInput(label="Items (name:amount, separate with ;)", style=discord.TextStyle.long, placeholder="e.g. Rare Pepe:1;Golden Coin:5")
+    minimum_bid = discord.ui.TextInput(label="Minimum Bid", style=discord.TextStyle.short, placeholder="e.g. 1000000")
+    donations = discord.ui.TextInput(label="Donations (name:amount, separate with ;)", style=discord.TextStyle.long, placeholder="e.g. Rare Pepe:1;Golden Coin:5", required=False)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        items = [item.strip().split(':') for item in self.items.value.split(';')]
+        items = [{"name": item[0], "amount": int(item[1])} for item in items]
+        min_bid = int(self.minimum_bid.value)
+
+        donations = []
+        if self.donations.value:
+            donations = [donation.strip().split(':') for donation in self.donations.value.split(';')]
+            donations = [{"name": donation[0], "amount": int(donation[1])} for donation in donations]
+
+        # Valuing the items can outlast the 3 second interaction window.
+        await interaction.response.defer(ephemeral=True)
+        total_value = await self.cog.get_total_value(items)
+        if total_value is None:
+            await interaction.followup.send("Unable to value the auction items right now. Please try again later.", ephemeral=True)
+            return
+        category = self.cog.determine_category(total_value)
+        buy_out_price = min(int(total_value * 1.5), total_value + 1000000000)  # Max 150% or value + 1B
+
+        auction_data = {
+            "auction_id": await self.cog.get_next_auction_id(interaction.guild),
+            "user_id": interaction.user.id,
+            "items": items,
+            "min_bid": min_bid,
+            "category": category,
+            "buy_out_price": buy_out_price,
+            "current_bid": 0,
+            "current_bidder": None,
+            "status": "pending",
+            "start_time": None,
+            "end_time": None,
+            "bid_history": [],
+            "proxy_bids": {},
+            "donations": donations,
+        }
+        self.cog.apply_valuation(auction_data, total_value)
+
+        channel = await self.cog.create_auction_channel(interaction.guild, auction_data, interaction.user)
+        
+        self.cog.auction_store.put(interaction.guild.id, auction_data)
+        self.cog.route_channel(interaction.guild.id, channel.id, auction_data['auction_id'])
+        self.cog.search_index.add(interaction.guild.id, auction_data)
+        self.cog.participants.add(interaction.guild.id, auction_data)
+        
+        await interaction.followup.send(f"Your auction request has been created. Please check the new channel: {channel.mention}", ephemeral=True)
+
+
 async def setup(bot):
     """Setup function to add the cog to the bot."""
     cog = AdvancedAuctionSystem(bot)
@@ -0,0 +1,292 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .bids import dumps_auction
+from .history import AuctionHistoryStore
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+
+class BackupError(Exception):
+    """A backup could not be read, or failed verification."""
+
+
+def _digest(encoded: str) -> str:
+    return hashlib.blake2b(encoded.encode(), digest_size=8).hexdigest()
+
+
+def _sha256(path: Path) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _record(record_type: str, **fields: Any) -> str:
+    return json.dumps({"type": record_type, **fields}) + "\n"
+
+
+def _raw_record(record_type: str, key: str, raw: str) -> str:
+    # Embeds already-encoded JSON without decoding it first.
+    return f'{{"type": "{record_type}", "{key}": {raw}}}\n'
+
+
+def _read_batch(f, batch_size: int) -> List[Dict[str, Any]]:
+    batch = []
+    for line in f:
+        batch.append(json.loads(line))
+        if len(batch) >= batch_size:
+            break
+    return batch
+
+
+class BackupManager:
+    """Compressed snapshot and delta backups under the cog's data path.
+
+    Each guild has a directory of gzipped JSON-lines files and a manifest that
+    lists them with their SHA-256. A snapshot holds the guild's settings, every
+    auction and the whole history. A delta holds the settings, the auctions
+    that changed since the previous backup (tracked by digest), and the history
+    rows appended since then (tracked by the history sequence number). All file
+    work happens on a dedicated thread, and history is streamed in batches, so
+    neither backing up nor restoring a large guild blocks the event loop.
+    """
+
+    def __init__(self, root: Path, history: AuctionHistoryStore):
+        self.root = root
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auction-backups")
+        self._locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def guild_path(self, guild_id: int) -> Path:
+        return self.root / str(guild_id)
+
+    def _load_manifest(self, guild_id: int) -> Dict[str, Any]:
+        try:
+            with open(self.guild_path(guild_id) / MANIFEST) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"entries": [], "digests": {}, "force_snapshot": False}
+
+    def _save_manifest(self, guild_id: int, manifest: Dict[str, Any]):
+        path = self.guild_path(guild_id) / MANIFEST
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, path)
+
+    def _force_snapshot(self, guild_id: int):
+        if self.guild_path(guild_id).exists():
+            manifest = self._load_manifest(guild_id)
+            manifest["force_snapshot"] = True
+            self._save_manifest(guild_id, manifest)
+
+    async def force_snapshot(self, guild_id: int):
+        """Make the next backup a snapshot.
+
+        Deltas only record new history rows, so this must be called after
+        history rows are deleted or rewritten in place; otherwise restoring the
+        chain would bring the old rows back.
+        """
+        async with self._locks[guild_id]:
+            await self._run(self._force_snapshot, guild_id)
+
+    async def entries(self, guild_id: int) -> List[Dict[str, Any]]:
+        return (await self._run(self._load_manifest, guild_id))["entries"]
+
+    async def create(
+        self,
+        guild_id: int,
+        settings: Dict[str, Any],
+        auctions: Dict[str, Dict[str, Any]],
+        full: bool = False,
+        snapshot_every: int = 7,
+        retention: int = 3,
+    ) -> Dict[str, Any]:
+        """Write a backup and return its manifest entry.
+
+        A snapshot is written when ``full`` is set, when there is nothing to build
+        on, or once ``snapshot_every`` backups have been taken since the last one;
+        otherwise a delta is written. Afterwards only the newest ``retention``
+        snapshots and the deltas that build on them are kept.
+        """
+        async with self._locks[guild_id]:
+            directory = self.guild_path(guild_id)
+            await self._run(lambda: directory.mkdir(parents=True, exist_ok=True))
+            manifest = await self._run(self._load_manifest, guild_id)
+            entries = manifest["entries"]
+            since_snapshot = next(
+                (i for i, entry in enumerate(reversed(entries)) if entry["kind"] == "snapshot"), len(entries)
+            )
+            kind = "snapshot" if (
+                full or not entries or manifest["force_snapshot"] or since_snapshot + 1 >= snapshot_every
+            ) else "delta"
+
+            # Encode on the loop so in-flight bids cannot change an auction mid-write.
+            encoded = {auction_id: dumps_auction(auction, sort_keys=True) for auction_id, auction in auctions.items()}
+            digests = await self._run(lambda: {auction_id: _digest(raw) for auction_id, raw in encoded.items()})
+            previous = {} if kind == "snapshot" else manifest["digests"]
+            changed = [auction_id for auction_id, digest in digests.items() if previous.get(auction_id) != digest]
+            removed = [auction_id for auction_id in previous if auction_id not in digests]
+            after_seq = 0 if kind == "snapshot" else entries[-1]["history_seq"]
+
+            created_at = datetime.utcnow().timestamp()
+            name = f"{kind}-{int(created_at * 1000)}.jsonl.gz"
+            path = directory / name
+            tmp = path.with_suffix(".tmp")
+            writer = await self._run(lambda: gzip.open(tmp, "wt", encoding="utf-8"))
+            records = 0
+            last_seq = after_seq
+            try:
+                lines = [
+                    _record("header", version=FORMAT_VERSION, kind=kind, guild_id=guild_id, created_at=created_at),
+                    _record("settings", data=settings),
+                ]
+                lines.extend(_raw_record("auction", "data", encoded[auction_id]) for auction_id in changed)
+                lines.extend(_record("removed", auction_id=auction_id) for auction_id in removed)
+                await self._run(writer.writelines, lines)
+                records += len(lines)
+
+                async for rows in self.history.iter_since(guild_id, after_seq):
+                    await self._run(writer.writelines, [_raw_record("history", "data", raw) for _, raw in rows])
+                    records += len(rows)
+                    last_seq = rows[-1][0]
+
+                records += 1
+                await self._run(writer.write, _record("end", records=records))
+            finally:
+                await self._run(writer.close)
+
+            try:
+                await self._run(os.replace, tmp, path)
+                entry = {
+                    "file": name,
+                    "kind": kind,
+                    "created_at": created_at,
+                    "history_seq": last_seq,
+                    "records": records,
+                    "size": (await self._run(path.stat)).st_size,
+                    "sha256": await self._run(_sha256, path),
+                }
+            except BaseException:
+                await self._run(lambda: tmp.unlink(missing_ok=True))
+                raise
+
+            entries.append(entry)
+            manifest["digests"] = digests
+            manifest["force_snapshot"] = False
+            expired = self._apply_retention(manifest, retention)
+            await self._run(self._save_manifest, guild_id, manifest)
+            for old in expired:
+                await self._run(lambda: (directory / old["file"]).unlink(missing_ok=True))
+            return entry
+
+    @staticmethod
+    def _apply_retention(manifest: Dict[str, Any], retention: int) -> List[Dict[str, Any]]:
+        entries = manifest["entries"]
+        snapshots = [i for i, entry in enumerate(entries) if entry["kind"] == "snapshot"]
+        if len(snapshots) <= retention:
+            return []
+        keep_from = snapshots[-retention]
+        manifest["entries"] = entries[keep_from:]
+        return entries[:keep_from]
+
+    async def chain(self, guild_id: int, upto: Optional[str] = None) -> List[Path]:
+        """The snapshot and deltas that rebuild the backup ``upto`` (default: the latest)."""
+        entries = await self.entries(guild_id)
+        if upto is not None:
+            names = [entry["file"] for entry in entries]
+            if upto not in names:
+                raise BackupError(f"There is no backup named {upto}.")
+            entries = entries[:names.index(upto) + 1]
+        start = next((i for i in range(len(entries) - 1, -1, -1) if entries[i]["kind"] == "snapshot"), None)
+        if start is None:
+            raise BackupError("There is no snapshot to restore from.")
+
+        chain = entries[start:]
+        directory = self.guild_path(guild_id)
+        for entry in chain:
+            path = directory / entry["file"]
+            try:
+                sha = await self._run(_sha256, path)
+            except FileNotFoundError:
+                raise BackupError(f"Backup file {entry['file']} is missing.")
+            if sha != entry["sha256"]:
+                raise BackupError(f"Backup file {entry['file']} is corrupted (checksum mismatch).")
+        return [directory / entry["file"] for entry in chain]
+
+    async def read(self, path: Path, batch_size: int = 500) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream a backup file's records in batches, decoded off the event loop."""
+        f = await self._run(lambda: gzip.open(path, "rt", encoding="utf-8"))
+        try:
+            while True:
+                try:
+                    batch = await self._run(_read_batch, f, batch_size)
+                except (OSError, EOFError, ValueError) as e:
+                    raise BackupError(f"{path.name} could not be read: {e}")
+                if not batch:
+                    return
+                yield batch
+        finally:
+            await self._run(f.close)
+
+    async def verify(self, path: Path) -> Dict[str, Any]:
+        """Read a backup file end to end, check its header and record count, and return the header."""
+        count = 0
+        header = end = None
+        async for batch in self.read(path):
+            if header is None:
+                header = batch[0]
+            count += len(batch)
+            end = batch[-1]
+        if not header or header.get("type") != "header" or header.get("version") != FORMAT_VERSION:
+            raise BackupError(f"{path.name} is not an auction backup.")
+        if not end or end.get("type") != "end" or end.get("records") != count:
+            raise BackupError(f"{path.name} is incomplete.")
+        return header
+
+    async def restore(self, guild_id: int, paths: List[Path]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Replay verified backup files into the history store.
+
+        History rows are inserted batch by batch as they are read. The settings
+        and auctions are returned for the caller to apply.
+        """
+        settings: Dict[str, Any] = {}
+        auctions: Dict[str, Dict[str, Any]] = {}
+        async with self._locks[guild_id]:
+            await self.history.clear(guild_id)
+            for path in paths:
+                async for batch in self.read(path):
+                    rows = []
+                    for record in batch:
+                        kind = record["type"]
+                        if kind == "history":
+                            rows.append(record["data"])
+                        elif kind == "auction":
+                            auctions[record["data"]["auction_id"]] = record["data"]
+                        elif kind == "removed":
+                            auctions.pop(record["auction_id"], None)
+                        elif kind == "settings":
+                            settings = record["data"]
+                    if rows:
+                        await self.history.extend(guild_id, rows)
+
+            # History sequence numbers were reassigned, so the next backup starts a new chain.
+            await self._run(self._force_snapshot, guild_id)
+        return settings, auctions
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict
+
+import discord
+
+log = logging.getLogger("red.economy.AdvancedAuctionSystem.channels")
+
+# Idle channels must not look like live auction channels ("auction-<id>").
+IDLE_NAME = "idle-auction"
+# Discord bulk deletes up to 100 messages, all younger than 14 days, in one request.
+BULK_DELETE_LIMIT = 100
+BULK_DELETE_MAX_AGE = timedelta(days=14)
+
+
+class ChannelPool:
+    """Warm pool of idle auction channels, recycled between auctions.
+
+    Creating and deleting channels is heavily rate limited, so finished
+    auction channels are emptied, renamed back to ``IDLE_NAME`` with their
+    permissions re-synced to the category, and kept for the next auction.
+    Starting an auction then costs a single rename. Emptying a channel only
+    beats replacing it while one bulk delete covers its history, so busier
+    channels and ones with messages too old to bulk delete are deleted instead.
+    Each guild's pool is rebuilt from the idle channels in its auction category
+    on first use and topped up to the configured size by a background task.
+    """
+
+    def __init__(self):
+        self._idle: Dict[int, "OrderedDict[int, None]"] = {}
+        self._categories: Dict[int, int] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    def _pool(self, category: discord.CategoryChannel) -> "OrderedDict[int, None]":
+        guild_id = category.guild.id
+        if self._categories.get(guild_id) != category.id:
+            self._categories[guild_id] = category.id
+            self._idle[guild_id] = OrderedDict(
+                (channel.id, None) for channel in category.text_channels if channel.name == IDLE_NAME
+            )
+        return self._idle[guild_id]
+
+    def idle_count(self, category: discord.CategoryChannel) -> int:
+        return len(self._pool(category))
+
+    async def acquire(self, category: discord.CategoryChannel, name: str) -> discord.TextChannel:
+        """Rename the longest-idle channel to ``name``, or create one if the pool is empty."""
+        pool = self._pool(category)
+        while pool:
+            channel_id, _ = pool.popitem(last=False)
+            channel = category.guild.get_channel(channel_id)
+            if channel is None or channel.category_id != category.id:
+                continue
+            try:
+                await channel.edit(name=name)
+                return channel
+            except discord.NotFound:
+                continue
+            except discord.HTTPException:
+                log.exception(f"Failed to take pooled channel {channel_id} in guild {category.guild.id}")
+                pool[channel_id] = None
+                break
+        return await category.create_text_channel(name)
+
+    async def release(self, channel: discord.TextChannel, size: int):
+        """Empty a finished auction channel and return it to the pool.
+
+        The channel is deleted instead if the pool is full or emptying it would
+        take more than one bulk delete.
+        """
+        category = channel.category
+        if category is None or size <= 0 or self.idle_count(category) >= size:
+            await channel.delete()
+            return
+        try:
+            messages = [message async for message in channel.history(limit=BULK_DELETE_LIMIT)]
+            oldest_allowed = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+            if len(messages) >= BULK_DELETE_LIMIT or any(m.created_at < oldest_allowed for m in messages):
+                await channel.delete()
+                return
+            if messages:
+                await channel.delete_messages(messages)
+            await channel.edit(name=IDLE_NAME, topic=None, slowmode_delay=0, sync_permissions=True)
+        except discord.NotFound:
+            return
+        except discord.HTTPException:
+            log.exception(f"Failed to recycle channel {channel.id}; deleting it instead")
+            await channel.delete()
+            return
+        self._pool(category)[channel.id] = None
+
+    def replenish(self, category: discord.CategoryChannel, size: int):
+        """Top the pool up to ``size`` idle channels in the background."""
+        guild_id = category.guild.id
+        if guild_id in self._tasks or self.idle_count(category) >= size:
+            return
+        task = asyncio.create_task(self._replenish(category, size))
+        self._tasks[guild_id] = task
+        task.add_done_callback(lambda done: self._tasks.pop(guild_id, None))
+
+    async def _replenish(self, category: discord.CategoryChannel, size: int):
+        try:
+            while self.idle_count(category) < size:
+                channel = await category.create_text_channel(IDLE_NAME)
+                self._pool(category)[channel.id] = None
+        except discord.HTTPException:
+            log.exception(f"Failed to replenish the auction channel pool in guild {category.guild.id}")
+
+    def forget(self, guild_id: int):
+        self._idle.pop(guild_id, None)
+        self._categories.pop(guild_id, None)
+
+    def close(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
@@ -0,0 +1,131 @@
+import asyncio
+import hashlib
+import io
+import json
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+
+# The render functions run inside worker processes, so they must stay at module
+# level where a spawned worker can import them. They use matplotlib's object
+# oriented API only, so no global pyplot state is involved and each figure is
+# released as soon as its PNG has been written.
+
+def _new_figure():
+    from matplotlib.figure import Figure
+    return Figure(figsize=(10, 6))
+
+
+def _to_png(fig) -> bytes:
+    try:
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png')
+        return buf.getvalue()
+    finally:
+        fig.clear()
+
+
+def render_bid_history(auction_id: str, timestamps: Sequence[float], amounts: Sequence[int]) -> bytes:
+    fig = _new_figure()
+    ax = fig.add_subplot()
+    if timestamps:
+        ax.plot([datetime.fromtimestamp(ts) for ts in timestamps], amounts, marker='o')
+    else:
+        ax.text(0.5, 0.5, "No bids yet", ha='center', va='center', transform=ax.transAxes)
+    ax.set_title(f"Bid History for Auction #{auction_id}")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Bid Amount")
+    ax.tick_params(axis='x', labelrotation=45)
+    return _to_png(fig)
+
+
+def render_value_distribution(values: List[int]) -> bytes:
+    fig = _new_figure()
+    ax = fig.add_subplot()
+    ax.hist(values, bins=20, edgecolor='black')
+    ax.set_title("Auction Value Distribution")
+    ax.set_xlabel("Auction Value")
+    ax.set_ylabel("Number of Auctions")
+    return _to_png(fig)
+
+
+def render_category_performance(categories: List[str], values: List[int]) -> bytes:
+    fig = _new_figure()
+    ax = fig.add_subplot()
+    ax.bar(categories, values)
+    ax.set_title("Category Performance")
+    ax.set_xlabel("Category")
+    ax.set_ylabel("Total Value")
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
+    return _to_png(fig)
+
+
+RENDERERS = {
+    "bid_history": render_bid_history,
+    "value_distribution": render_value_distribution,
+    "category_performance": render_category_performance,
+}
+
+
+class ChartRenderer:
+    """Renders charts to PNG bytes in a process pool, off the event loop.
+
+    Results are cached by a hash of the chart kind and the plotted data, so asking
+    for the same chart twice only renders it once. Workers are spawned rather
+    than forked: the bot already runs threads (the history and backup executors)
+    whose locks a forked child could inherit in a held state.
+    """
+
+    def __init__(self, max_workers: int = 2, cache_size: int = 64):
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def render(self, kind: str, *args: Any) -> bytes:
+        key = hashlib.sha256(json.dumps([kind, args], default=list).encode()).hexdigest()
+        png = self._cache.get(key)
+        if png is not None:
+            self._cache.move_to_end(key)
+            return png
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = self._inflight[key] = asyncio.ensure_future(self._render(kind, args))
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        png = await asyncio.shield(future)
+
+        self._cache[key] = png
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return png
+
+    async def _render(self, kind: str, args: tuple) -> bytes:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), RENDERERS[kind], *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); start a fresh pool and try once more.
+            self.close()
+            return await loop.run_in_executor(self._get_executor(), RENDERERS[kind], *args)
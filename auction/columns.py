@@ -0,0 +1,104 @@
+from typing import Any, Dict, List, Optional
+
+from lazymodule import LazyModule
+
+from .bids import NO_USER, bid_history
+
+np = LazyModule("numpy")
+
+
+class HistoryColumns:
+    """Columnar projection of one guild's auction history.
+
+    Each finished auction becomes one row across a set of NumPy arrays, and the
+    user IDs of every bid are flattened into one array addressed through
+    per-auction offsets. Window reports are then computed with a handful of
+    vectorized passes instead of walking every auction dict.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.auction_ids: List[str] = []
+        self.categories: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        self.end_time = np.empty(capacity, dtype=np.float64)
+        self.current_bid = np.empty(capacity, dtype=np.int64)
+        self.category = np.empty(capacity, dtype=np.int32)
+        self.seller = np.empty(capacity, dtype=np.int64)
+        self.bid_count = np.empty(capacity, dtype=np.int32)
+        self.bidders = np.empty(capacity * 4, dtype=np.int64)
+        self.bidders_size = 0
+
+    def _grow(self, rows: int, bids: int):
+        if self.size + rows > self.end_time.size:
+            capacity = max(self.end_time.size * 2, self.size + rows)
+            for name in ("end_time", "current_bid", "category", "seller", "bid_count"):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self.size] = column[:self.size]
+                setattr(self, name, grown)
+        if self.bidders_size + bids > self.bidders.size:
+            grown = np.empty(max(self.bidders.size * 2, self.bidders_size + bids), dtype=np.int64)
+            grown[:self.bidders_size] = self.bidders[:self.bidders_size]
+            self.bidders = grown
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def append(self, auction: Dict[str, Any]):
+        bids = bid_history(auction).user_ids
+        self._grow(1, len(bids))
+        row = self.size
+        self.auction_ids.append(auction['auction_id'])
+        self.end_time[row] = auction.get('end_time') or 0
+        self.current_bid[row] = auction.get('current_bid') or 0
+        self.category[row] = self._category_code(auction['category'])
+        self.seller[row] = auction.get('user_id') or NO_USER
+        self.bid_count[row] = len(bids)
+        self.bidders[self.bidders_size:self.bidders_size + len(bids)] = bids
+        self.bidders_size += len(bids)
+        self.size += 1
+
+    def summarize(self, start: float) -> Optional[Dict[str, Any]]:
+        """Compute report metrics for auctions that ended at or after ``start``."""
+        n = self.size
+        mask = self.end_time[:n] >= start
+        rows = np.flatnonzero(mask)
+        if not rows.size:
+            return None
+
+        bids = self.current_bid[rows]
+        bid_counts = self.bid_count[rows]
+        count = rows.size
+        total_value = int(bids.sum())
+
+        window_bidders = self.bidders[:self.bidders_size][np.repeat(mask, self.bid_count[:n])]
+        sellers = self.seller[rows]
+
+        codes = self.category[rows]
+        category_counts = np.bincount(codes, minlength=len(self.categories))
+        category_values = np.zeros(len(self.categories), dtype=np.int64)
+        np.add.at(category_values, codes, bids)
+
+        return {
+            "total_auctions": count,
+            "total_value": total_value,
+            "avg_value": total_value / count,
+            "median_value": int(np.partition(bids, count // 2)[count // 2]),
+            "unique_bidders": int(np.unique(window_bidders[window_bidders != NO_USER]).size),
+            "unique_sellers": int(np.unique(sellers[sellers != NO_USER]).size),
+            "avg_bids_per_auction": float(bid_counts.mean()),
+            "most_valuable": self.auction_ids[rows[int(bids.argmax())]],
+            "most_bids": self.auction_ids[rows[int(bid_counts.argmax())]],
+            "most_bids_count": int(bid_counts.max()),
+            "values": bids,
+            "category_performance": {
+                category: {"count": int(category_counts[code]), "value": int(category_values[code])}
+                for code, category in enumerate(self.categories)
+                if category_counts[code]
+            },
+        }
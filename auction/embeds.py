@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import discord
+
+log = logging.getLogger("red.economy.AdvancedAuctionSystem.embeds")
+
+
+class EmbedUpdater:
+    """Keeps each auction's pinned embed current without flooding the channel.
+
+    Update requests are coalesced per auction: the first starts a short-lived
+    task and later ones only mark the auction as stale. The task waits until
+    at least ``interval`` seconds have passed since the previous edit, renders
+    the latest state and edits through a cached partial message, skipping the
+    edit when the rendered embed is unchanged.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[int, str], Awaitable[Optional[discord.Embed]]],
+        interval: float = 2.0,
+    ):
+        self.render = render
+        self.interval = interval
+        self.intervals: Dict[int, float] = {}
+        self._handles: Dict[Tuple[int, str], discord.PartialMessage] = {}
+        self._rendered: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        self._last_edit: Dict[Tuple[int, str], float] = {}
+        self._stale: Dict[Tuple[int, str], bool] = {}
+        self._tasks: Dict[Tuple[int, str], asyncio.Task] = {}
+
+    def set_interval(self, guild_id: int, seconds: float):
+        self.intervals[guild_id] = seconds
+
+    def request(self, channel: discord.TextChannel, auction_id: str, message_id: Optional[int]):
+        """Ask for the auction's embed message to be brought up to date."""
+        if not message_id:
+            return
+        key = (channel.guild.id, auction_id)
+        handle = self._handles.get(key)
+        if handle is None or handle.id != message_id:
+            self._handles[key] = channel.get_partial_message(message_id)
+            self._rendered.pop(key, None)
+        self._stale[key] = True
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._run(key))
+
+    def forget(self, guild_id: int, auction_id: str):
+        key = (guild_id, auction_id)
+        task = self._tasks.pop(key, None)
+        if task:
+            task.cancel()
+        for state in (self._handles, self._rendered, self._last_edit, self._stale):
+            state.pop(key, None)
+
+    def close(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    async def _run(self, key: Tuple[int, str]):
+        try:
+            await self._flush(key)
+        finally:
+            # Deregister in the same step as the last stale check, so a request
+            # arriving after it always starts a new task.
+            if self._tasks.get(key) is asyncio.current_task():
+                del self._tasks[key]
+
+    async def _flush(self, key: Tuple[int, str]):
+        loop = asyncio.get_running_loop()
+        interval = self.intervals.get(key[0], self.interval)
+        while self._stale.get(key):
+            delay = self._last_edit.get(key, 0) + interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._stale[key] = False
+            try:
+                embed = await self.render(*key)
+                if embed is None:
+                    return
+                rendered = embed.to_dict()
+                if rendered == self._rendered.get(key):
+                    continue
+                await self._handles[key].edit(embed=embed)
+                self._rendered[key] = rendered
+            except discord.NotFound:
+                # The message is gone; a later request with a new message ID starts over.
+                self._handles.pop(key, None)
+                self._rendered.pop(key, None)
+                return
+            except discord.HTTPException:
+                log.exception(f"Failed to update the embed of auction {key[1]} in guild {key[0]}")
+            self._last_edit[key] = loop.time()
@@ -0,0 +1,236 @@
+import asyncio
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from .bids import dumps_auction, loads_auction
+from .participants import ANY_ROLE, SELLER, WINNER, participants
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS auction_history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id INTEGER NOT NULL,
+    auction_id TEXT NOT NULL,
+    end_time REAL NOT NULL,
+    seller_id INTEGER,
+    buyer_id INTEGER,
+    status TEXT,
+    current_bid INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    UNIQUE (guild_id, auction_id)
+);
+CREATE INDEX IF NOT EXISTS history_end_time ON auction_history (guild_id, end_time);
+CREATE INDEX IF NOT EXISTS history_seller ON auction_history (guild_id, seller_id);
+CREATE INDEX IF NOT EXISTS history_buyer ON auction_history (guild_id, buyer_id);
+CREATE TABLE IF NOT EXISTS history_participants (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    roles INTEGER NOT NULL,
+    PRIMARY KEY (guild_id, user_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS participants_seq ON history_participants (seq);
+"""
+
+# Bumped when a schema change needs existing rows rewritten; see ``_open``.
+SCHEMA_VERSION = 2
+
+INSERT_HISTORY = (
+    "INSERT OR IGNORE INTO auction_history "
+    "(guild_id, auction_id, end_time, seller_id, buyer_id, status, current_bid, data) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_PARTICIPANT = "INSERT INTO history_participants (guild_id, user_id, seq, roles) VALUES (?, ?, ?, ?)"
+
+
+def _row(guild_id: int, auction: Dict[str, Any]) -> Tuple:
+    return (
+        guild_id,
+        auction['auction_id'],
+        auction.get('end_time') or datetime.utcnow().timestamp(),
+        auction.get('user_id'),
+        auction.get('current_bidder'),
+        auction.get('status'),
+        auction.get('current_bid') or 0,
+        dumps_auction(auction),
+    )
+
+
+def _participant_rows(guild_id: int, seq: int, auction: Dict[str, Any]) -> List[Tuple]:
+    return [(guild_id, user_id, seq, roles) for user_id, roles in participants(auction).items()]
+
+
+class AuctionHistoryStore:
+    """Append-only store of finished auctions, backed by SQLite.
+
+    Rows are indexed by end time, and a participants table maps each user to
+    the auctions they sold, bid on, won or set proxy bids in, so report
+    windows, per-user views and data deletion read only the rows they need.
+    All database work runs on one worker thread that owns the connection,
+    keeping disk I/O off the event loop.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auction-history")
+        self._conn: Optional[sqlite3.Connection] = None
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _open(self):
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        version, = self._conn.execute("PRAGMA user_version").fetchone()
+        if version < 1:
+            # Index the participants of auctions recorded before the table existed.
+            with self._conn:
+                rows = self._conn.execute("SELECT guild_id, seq, data FROM auction_history").fetchall()
+                self._conn.execute("DELETE FROM history_participants")
+                for guild_id, seq, data in rows:
+                    self._conn.executemany(INSERT_PARTICIPANT, _participant_rows(guild_id, seq, json.loads(data)))
+        if version < 2:
+            # Rewrite bid histories recorded as lists of dicts in the packed form.
+            with self._conn:
+                rows = self._conn.execute("SELECT seq, data FROM auction_history").fetchall()
+                self._conn.executemany(
+                    "UPDATE auction_history SET data = ? WHERE seq = ?",
+                    [(dumps_auction(loads_auction(data)), seq) for seq, data in rows],
+                )
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    async def open(self):
+        await self._run(self._open)
+
+    async def close(self):
+        if self._conn:
+            await self._run(self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=False)
+
+    def _fetchall(self, sql: str, params: Iterable = ()) -> List[Tuple]:
+        return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def _insert(self, guild_id: int, auctions: List[Dict[str, Any]]) -> int:
+        inserted = 0
+        with self._conn:
+            for auction in auctions:
+                cursor = self._conn.execute(INSERT_HISTORY, _row(guild_id, auction))
+                if cursor.rowcount > 0:
+                    inserted += 1
+                    self._conn.executemany(INSERT_PARTICIPANT, _participant_rows(guild_id, cursor.lastrowid, auction))
+        return inserted
+
+    def _update(self, guild_id: int, auction: Dict[str, Any]):
+        row = _row(guild_id, auction)
+        with self._conn:
+            found = self._conn.execute(
+                "SELECT seq FROM auction_history WHERE guild_id = ? AND auction_id = ?", row[:2]
+            ).fetchone()
+            if found is None:
+                return
+            seq, = found
+            self._conn.execute(
+                "UPDATE auction_history SET end_time = ?, seller_id = ?, buyer_id = ?, status = ?, current_bid = ?, data = ? "
+                "WHERE seq = ?",
+                row[2:] + (seq,),
+            )
+            self._conn.execute("DELETE FROM history_participants WHERE seq = ?", (seq,))
+            self._conn.executemany(INSERT_PARTICIPANT, _participant_rows(guild_id, seq, auction))
+
+    async def append(self, guild_id: int, auction: Dict[str, Any]) -> bool:
+        """Append a finished auction. Returns False if it was already recorded."""
+        return await self._run(self._insert, guild_id, [auction]) > 0
+
+    async def extend(self, guild_id: int, auctions: Iterable[Dict[str, Any]]):
+        await self._run(self._insert, guild_id, list(auctions))
+
+    async def update(self, guild_id: int, auction: Dict[str, Any]):
+        """Rewrite a recorded auction in place, e.g. after scrubbing a user's data."""
+        await self._run(self._update, guild_id, auction)
+
+    async def iter_range(
+        self, guild_id: int, start: Optional[float] = None, end: Optional[float] = None, batch_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream auctions that ended in ``[start, end]`` in end time order, one batch at a time."""
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        last = (start, -1)
+        while True:
+            rows = await self._run(
+                self._fetchall,
+                "SELECT end_time, seq, data FROM auction_history "
+                "WHERE guild_id = ? AND end_time >= ? AND end_time <= ? AND (end_time, seq) > (?, ?) "
+                "ORDER BY end_time, seq LIMIT ?",
+                (guild_id, start, end, last[0], last[1], batch_size),
+            )
+            for _, _, data in rows:
+                yield loads_auction(data)
+            if len(rows) < batch_size:
+                return
+            last = rows[-1][:2]
+
+    async def iter_since(self, guild_id: int, after_seq: int = 0, batch_size: int = 500) -> AsyncIterator[List[Tuple[int, str]]]:
+        """Stream ``(seq, raw JSON)`` batches of auctions recorded after ``after_seq``, in insertion order."""
+        while True:
+            rows = await self._run(
+                self._fetchall,
+                "SELECT seq, data FROM auction_history WHERE guild_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (guild_id, after_seq, batch_size),
+            )
+            if rows:
+                yield rows
+            if len(rows) < batch_size:
+                return
+            after_seq = rows[-1][0]
+
+    async def fetch_range(self, guild_id: int, start: Optional[float] = None, end: Optional[float] = None) -> List[Dict[str, Any]]:
+        return [auction async for auction in self.iter_range(guild_id, start, end)]
+
+    async def get(self, guild_id: int, auction_id: str) -> Optional[Dict[str, Any]]:
+        rows = await self._run(
+            self._fetchall,
+            "SELECT data FROM auction_history WHERE guild_id = ? AND auction_id = ?",
+            (guild_id, auction_id),
+        )
+        return loads_auction(rows[0][0]) if rows else None
+
+    async def for_user(self, guild_id: int, user_id: int, roles: int = SELLER | WINNER) -> List[Dict[str, Any]]:
+        """Auctions in which the user had any of ``roles``, oldest first."""
+        rows = await self._run(
+            self._fetchall,
+            "SELECT h.data FROM history_participants p JOIN auction_history h ON h.seq = p.seq "
+            "WHERE p.guild_id = ? AND p.user_id = ? AND p.roles & ? ORDER BY h.end_time, h.seq",
+            (guild_id, user_id, roles),
+        )
+        return [loads_auction(data) for data, in rows]
+
+    async def involving(self, guild_id: int, user_id: int) -> List[Dict[str, Any]]:
+        """Every recorded auction the user took part in, in any role."""
+        return await self.for_user(guild_id, user_id, ANY_ROLE)
+
+    async def count(self, guild_id: int) -> int:
+        rows = await self._run(self._fetchall, "SELECT COUNT(*) FROM auction_history WHERE guild_id = ?", (guild_id,))
+        return rows[0][0]
+
+    def _delete(self, guild_id: int, where: str, params: Tuple) -> int:
+        with self._conn:
+            self._conn.execute(
+                f"DELETE FROM history_participants WHERE seq IN (SELECT seq FROM auction_history WHERE guild_id = ?{where})",
+                (guild_id,) + params,
+            )
+            return self._conn.execute(f"DELETE FROM auction_history WHERE guild_id = ?{where}", (guild_id,) + params).rowcount
+
+    async def prune(self, guild_id: int, before: float) -> int:
+        return await self._run(self._delete, guild_id, " AND end_time < ?", (before,))
+
+    async def clear(self, guild_id: int):
+        await self._run(self._delete, guild_id, "", ())
+
+    async def replace(self, guild_id: int, auctions: Iterable[Dict[str, Any]]):
+        await self.clear(guild_id)
+        await self.extend(guild_id, auctions)
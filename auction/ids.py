@@ -0,0 +1,43 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, Iterable
+
+from redbot.core import Config
+
+
+class AuctionIdAllocator:
+    """Hands out auction IDs from a persisted per-guild counter.
+
+    The counter lives in the guild's ``next_auction_id`` Config value and is
+    advanced under a per-guild lock, so concurrent listings never share an ID
+    and allocation does not depend on how many auctions exist. A guild without
+    a counter yet is seeded once from the highest existing auction ID.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self._locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._next: Dict[int, int] = {}
+
+    @staticmethod
+    def format(number: int) -> str:
+        return f"AUC{number:04d}"
+
+    async def allocate(self, guild_id: int, existing: Iterable[str] = ()) -> str:
+        """Reserve the next ID. ``existing`` is only read to seed a guild without a counter."""
+        async with self._locks[guild_id]:
+            number = self._next.get(guild_id)
+            if number is None:
+                number = await self.config.guild_from_id(guild_id).next_auction_id()
+            if not number:
+                numbers = [int(aid[3:]) for aid in existing if aid.startswith("AUC") and aid[3:].isdigit()]
+                number = max(numbers, default=0) + 1
+            await self.config.guild_from_id(guild_id).next_auction_id.set(number + 1)
+            self._next[guild_id] = number + 1
+            return self.format(number)
+
+    async def reset(self, guild_id: int):
+        """Drop the counter so it is reseeded from the guild's auctions on next use."""
+        async with self._locks[guild_id]:
+            self._next.pop(guild_id, None)
+            await self.config.guild_from_id(guild_id).next_auction_id.set(0)
@@ -0,0 +1,63 @@
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class Leaderboard:
+    """Running totals per key with the ``k`` highest kept in order.
+
+    Totals only grow, so a key can only enter the top list when its own total
+    changes. Each update therefore costs O(k) and reading the top list is a
+    slice, however many keys there are.
+    """
+
+    def __init__(self, k: int = 10):
+        self.k = k
+        self.scores: Dict[Hashable, int] = defaultdict(int)
+        self.counts: Dict[Hashable, int] = defaultdict(int)
+        self._top: List[Hashable] = []
+
+    def add(self, key: Hashable, score: int, count: int = 1):
+        self.scores[key] += score
+        self.counts[key] += count
+        if key not in self._top:
+            if len(self._top) >= self.k and self.scores[key] <= self.scores[self._top[-1]]:
+                return
+            self._top.append(key)
+        self._top.sort(key=lambda k: self.scores[k], reverse=True)
+        del self._top[self.k:]
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[Hashable, int, int]]:
+        """Return ``(key, score, count)`` for the leaders, highest first."""
+        return [(key, self.scores[key], self.counts[key]) for key in self._top[:n]]
+
+
+class GuildLeaderboards:
+    """The leaderboards of one guild, fed by its finished auctions.
+
+    ``value`` ranks buyers by total spent, ``wins`` by auctions won,
+    ``sellers`` ranks sellers by total sold, and ``items`` ranks items by
+    quantity sold.
+    """
+
+    BOARDS = ("value", "wins", "sellers", "items")
+
+    def __init__(self, k: int = 10):
+        self.boards = {name: Leaderboard(k) for name in self.BOARDS}
+
+    def ingest(self, auction: Dict[str, Any]):
+        if auction.get('status') != 'completed':
+            return
+        amount = auction.get('current_bid') or 0
+        seller = auction.get('user_id')
+        if seller is not None:
+            self.boards["sellers"].add(seller, amount)
+        buyer = auction.get('current_bidder')
+        if buyer is None:
+            return
+        self.boards["value"].add(buyer, amount)
+        self.boards["wins"].add(buyer, 1)
+        for item in auction.get('items', []):
+            self.boards["items"].add(item['name'], item['amount'])
+
+    def top(self, board: str, n: Optional[int] = None) -> List[Tuple[Hashable, int, int]]:
+        return self.boards[board].top(n)
@@ -0,0 +1,62 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+from .bids import unpack_auction
+
+
+class Migrations:
+    """Numbered upgrade steps, applied in order from a stored version.
+
+    Step ``n`` (counting from 1) upgrades data from version ``n - 1`` to ``n``,
+    so adding a migration means registering a new step at the end; the schema
+    version is the number of steps.
+    """
+
+    def __init__(self):
+        self.steps: List[Callable] = []
+
+    def register(self, step: Callable) -> Callable:
+        self.steps.append(step)
+        return step
+
+    @property
+    def version(self) -> int:
+        return len(self.steps)
+
+    def pending(self, version: int) -> List[Tuple[int, Callable]]:
+        """The ``(new version, step)`` pairs still to run for data at ``version``."""
+        return list(enumerate(self.steps[version:], version + 1))
+
+
+auction_migrations = Migrations()
+
+
+@auction_migrations.register
+def _fill_missing_fields(auction: Dict[str, Any]):
+    # Fields added after the first releases, and single-item auctions turned into item lists.
+    auction.setdefault('channel_id', None)
+    auction.setdefault('buy_out_price', None)
+    auction.setdefault('reserve_price', None)
+    auction.setdefault('proxy_bids', {})
+    if 'items' not in auction:
+        auction['items'] = [{"name": auction.pop('item'), "amount": auction.pop('amount')}]
+    auction.setdefault('donations', [])
+
+
+@auction_migrations.register
+def _pack_bid_history(auction: Dict[str, Any]):
+    # Bumping the version gets the auction rewritten with its bids in the packed form.
+    unpack_auction(auction)
+
+
+def needs_upgrade(auction: Dict[str, Any]) -> bool:
+    return auction.get('schema_version', 0) < auction_migrations.version
+
+
+def upgrade_auction(auction: Dict[str, Any]) -> bool:
+    """Bring one auction up to the current schema in place. Returns whether it changed."""
+    if not needs_upgrade(auction):
+        return False
+    for version, step in auction_migrations.pending(auction.get('schema_version', 0)):
+        step(auction)
+        auction['schema_version'] = version
+    return True
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import random
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, Set
+
+import discord
+
+log = logging.getLogger("red.economy.AdvancedAuctionSystem.notifications")
+
+
+class SubscriptionIndex:
+    """Maps each guild's auction categories to the IDs of subscribed members.
+
+    It is loaded from Config once and then kept in step by the subscribe and
+    unsubscribe commands, so finding the audience for a new auction is a single
+    dict lookup instead of a read of every member's data.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[int, Dict[str, Set[int]]] = defaultdict(lambda: defaultdict(set))
+
+    def load(self, all_members: Dict[int, Dict[int, Dict[str, Any]]]):
+        self._subscribers.clear()
+        for guild_id, members in all_members.items():
+            for member_id, data in members.items():
+                self.subscribe(guild_id, member_id, data.get('subscribed_categories', []))
+
+    def subscribe(self, guild_id: int, member_id: int, categories: Iterable[str]):
+        for category in categories:
+            self._subscribers[guild_id][category].add(member_id)
+
+    def unsubscribe(self, guild_id: int, member_id: int, categories: Iterable[str]):
+        for category in categories:
+            self._subscribers[guild_id][category].discard(member_id)
+
+    def subscribers(self, guild_id: int, category: str) -> Set[int]:
+        return set(self._subscribers[guild_id].get(category, ()))
+
+    def clear(self, guild_id: int):
+        self._subscribers.pop(guild_id, None)
+
+
+class DMDispatcher:
+    """Sends the same message to many recipients with bounded concurrency.
+
+    At most ``concurrency`` sends are in flight at once. Rate limits are retried
+    after the delay Discord asks for, and server errors after an exponential
+    backoff, up to ``max_attempts`` tries. Recipients that refuse DMs are not
+    retried. Any object with an async ``send(content)`` can be a recipient.
+    """
+
+    def __init__(self, concurrency: int = 5, max_attempts: int = 3, backoff: float = 1.0):
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+
+    async def send(self, recipients: Iterable[Any], content: str) -> Dict[str, int]:
+        """Deliver ``content`` to every recipient. Returns ``sent``, ``failed`` and ``retries`` counts."""
+        stats = Counter(sent=0, failed=0, retries=0)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def deliver(recipient):
+            async with semaphore:
+                stats["sent" if await self._deliver(recipient, content, stats) else "failed"] += 1
+
+        await asyncio.gather(*(deliver(recipient) for recipient in recipients))
+        return dict(stats)
+
+    async def _deliver(self, recipient: Any, content: str, stats: Counter) -> bool:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await recipient.send(content)
+                return True
+            except discord.Forbidden:
+                return False
+            except discord.RateLimited as e:
+                delay = e.retry_after
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    delay = getattr(e, 'retry_after', None) or self.backoff * 2 ** (attempt - 1)
+                elif e.status >= 500:
+                    delay = self.backoff * 2 ** (attempt - 1) * (1 + random.random() / 2)
+                else:
+                    return False
+            if attempt == self.max_attempts:
+                return False
+            stats["retries"] += 1
+            await asyncio.sleep(delay)
+        return False
@@ -0,0 +1,58 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Set
+
+from .bids import bid_history
+
+# Roles a user can have in an auction, combined as bit flags.
+SELLER = 1
+BIDDER = 2
+WINNER = 4
+PROXY = 8
+ANY_ROLE = SELLER | BIDDER | WINNER | PROXY
+
+
+def participants(auction: Dict[str, Any]) -> Dict[int, int]:
+    """Map every user who took part in an auction to their role flags."""
+    roles: Dict[int, int] = defaultdict(int)
+    if auction.get('user_id') is not None:
+        roles[auction['user_id']] |= SELLER
+    for user_id in bid_history(auction).bidders():
+        roles[user_id] |= BIDDER
+    if auction.get('current_bidder') is not None:
+        roles[auction['current_bidder']] |= BIDDER
+        if auction.get('status') == 'completed':
+            roles[auction['current_bidder']] |= WINNER
+    for user_id in auction.get('proxy_bids', {}):
+        roles[int(user_id)] |= PROXY
+    return dict(roles)
+
+
+class ParticipantIndex:
+    """Which of a guild's live auctions each user takes part in.
+
+    Entries are added as users sell, bid or set proxy bids and are never
+    removed when a user drops out of an auction, so a lookup returns a
+    superset that callers check against the auction itself.
+    """
+
+    def __init__(self):
+        self._guilds: Dict[int, Dict[int, Set[str]]] = defaultdict(lambda: defaultdict(set))
+
+    def rebuild(self, guild_id: int, auctions: Iterable[Dict[str, Any]]):
+        self._guilds.pop(guild_id, None)
+        for auction in auctions:
+            self.add(guild_id, auction)
+
+    def clear(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+
+    def add(self, guild_id: int, auction: Dict[str, Any]):
+        for user_id in participants(auction):
+            self._guilds[guild_id][user_id].add(auction['auction_id'])
+
+    def note(self, guild_id: int, auction_id: str, user_id: int):
+        self._guilds[guild_id][user_id].add(auction_id)
+
+    def auctions(self, guild_id: int, user_id: int) -> Set[str]:
+        users = self._guilds.get(guild_id)
+        return set(users.get(user_id, ())) if users else set()
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+log = logging.getLogger("red.economy.AdvancedAuctionSystem.pricing")
+
+
+class PricingClient:
+    """Looks up item values through one pooled HTTP session.
+
+    Values are kept in a bounded LRU cache. A value younger than ``ttl`` is served
+    directly; one younger than ``ttl + stale_ttl`` is served immediately while a
+    background refresh runs. Concurrent lookups for the same item share a single
+    request, and a failed refresh falls back to the last known value.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.example.com/items/",
+        ttl: float = 3600,
+        stale_ttl: float = 6 * 3600,
+        max_entries: int = 2048,
+        timeout: float = 10,
+    ):
+        self.base_url = base_url
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    async def close(self):
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    async def get_value(self, item_name: str) -> Optional[int]:
+        entry = self._cache.get(item_name)
+        if entry:
+            value, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl + self.stale_ttl:
+                self._cache.move_to_end(item_name)
+                if age >= self.ttl:
+                    self._refresh(item_name)
+                return value
+        return await asyncio.shield(self._refresh(item_name))
+
+    async def get_values(self, item_names: Iterable[str]) -> Dict[str, Optional[int]]:
+        names = list(dict.fromkeys(item_names))
+        values = await asyncio.gather(*(self.get_value(name) for name in names))
+        return dict(zip(names, values))
+
+    async def get_total_value(self, items: List[Dict[str, Any]]) -> Optional[int]:
+        """Value a whole item list concurrently. Returns None if any item could not be valued."""
+        values = await self.get_values(item['name'] for item in items)
+        if any(values[item['name']] is None for item in items):
+            return None
+        return sum(values[item['name']] * item['amount'] for item in items)
+
+    def _refresh(self, item_name: str) -> asyncio.Task:
+        task = self._inflight.get(item_name)
+        if task is None:
+            task = asyncio.create_task(self._fetch(item_name))
+            self._inflight[item_name] = task
+            task.add_done_callback(lambda _: self._inflight.pop(item_name, None))
+        return task
+
+    async def _fetch(self, item_name: str) -> Optional[int]:
+        try:
+            async with self._get_session().get(f"{self.base_url}{item_name}") as response:
+                if response.status == 200:
+                    data = await response.json()
+                    item_value = data['value']
+                    self._store(item_name, item_value)
+                    return item_value
+                log.error(f"Failed to fetch value for item {item_name}. Status: {response.status}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.error(f"API request error for item {item_name}: {e}")
+
+        entry = self._cache.get(item_name)
+        return entry[0] if entry else None
+
+    def _store(self, item_name: str, value: int):
+        self._cache[item_name] = (value, time.monotonic())
+        self._cache.move_to_end(item_name)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
@@ -0,0 +1,104 @@
+import bisect
+import heapq
+from itertools import count
+from typing import Dict, List, Optional, Tuple
+
+
+class IncrementTable:
+    """The guild's bid increment tiers, compiled for bisect lookups.
+
+    ``tiers`` maps a price threshold to the increment that applies from that
+    price upwards. ``minimum`` is the smallest increment allowed at any price.
+    """
+
+    def __init__(self, tiers: Dict[str, int], minimum: int):
+        ordered = sorted((int(threshold), int(increment)) for threshold, increment in tiers.items())
+        self.thresholds = [threshold for threshold, _ in ordered]
+        self.increments = [max(increment, minimum) for _, increment in ordered]
+        self.minimum = max(minimum, 1)
+
+    def step(self, price: int) -> int:
+        index = bisect.bisect_right(self.thresholds, price) - 1
+        return self.increments[index] if index >= 0 else self.minimum
+
+
+class ProxyBook:
+    """Proxy maxima for one auction in a max-heap with lazy deletion.
+
+    Raising or withdrawing a proxy bid only updates ``_bids``; superseded heap
+    entries are discarded when they surface, so both operations are O(log n)
+    and reading the two highest bids is amortised O(log n). Equal maxima are
+    ordered by when they were placed, earliest first.
+    """
+
+    def __init__(self):
+        self._bids: Dict[int, Tuple[int, int]] = {}
+        self._heap: List[Tuple[int, int, int]] = []
+        self._order = count()
+
+    def __len__(self) -> int:
+        return len(self._bids)
+
+    def set(self, user_id: int, amount: int):
+        entry = (amount, next(self._order))
+        self._bids[user_id] = entry
+        heapq.heappush(self._heap, (-amount, entry[1], user_id))
+        if len(self._heap) > 2 * len(self._bids) + 32:
+            # Too many superseded entries; rebuild from the live bids.
+            self._heap = [(-amount, order, user_id) for user_id, (amount, order) in self._bids.items()]
+            heapq.heapify(self._heap)
+
+    def remove(self, user_id: int):
+        self._bids.pop(user_id, None)
+
+    def _clean_top(self):
+        heap = self._heap
+        while heap:
+            amount, order, user_id = heap[0]
+            if self._bids.get(user_id) == (-amount, order):
+                return
+            heapq.heappop(heap)
+
+    def top_two(self) -> List[Tuple[int, int]]:
+        """Return up to two ``(user_id, amount)`` pairs, highest first."""
+        self._clean_top()
+        if not self._heap:
+            return []
+        first = heapq.heappop(self._heap)
+        self._clean_top()
+        result = [(first[2], -first[0])]
+        if self._heap:
+            amount, _, user_id = self._heap[0]
+            result.append((user_id, -amount))
+        heapq.heappush(self._heap, first)
+        return result
+
+
+def resolve(
+    book: ProxyBook, current_bid: int, current_bidder: Optional[int], min_bid: int, increments: IncrementTable
+) -> Optional[Tuple[int, int]]:
+    """Settle a whole proxy war in one step.
+
+    The highest proxy wins at one increment above the strongest competing bid
+    (the runner-up proxy or the standing bid), capped at its own maximum.
+    Returns the new ``(bidder, price)``, or None if the standing bid holds.
+    """
+    top = book.top_two()
+    if not top:
+        return None
+    leader, maximum = top[0]
+    runner_up = top[1][1] if len(top) > 1 else 0
+
+    leading = current_bidder == leader
+    competitor = runner_up if leading else max(runner_up, current_bid)
+    if leading and competitor <= current_bid:
+        return None
+
+    if competitor or current_bidder is not None:
+        target = competitor + increments.step(competitor)
+    else:
+        target = increments.step(0)
+    price = min(max(target, min_bid), maximum)
+    if price <= current_bid or price < min_bid:
+        return None
+    return leader, price
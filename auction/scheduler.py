@@ -0,0 +1,99 @@
+import asyncio
+import heapq
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+log = logging.getLogger("red.economy.AdvancedAuctionSystem.scheduler")
+
+
+class DeadlineScheduler:
+    """Ends auctions exactly when they are due.
+
+    Each guild keeps a min-heap of ``(end_time, auction_id)``. Rescheduling pushes
+    a new entry and records the auction's current deadline; entries that no longer
+    match the recorded deadline are discarded lazily when they reach the top, so
+    both scheduling and extensions are O(log n). A single task sleeps until the
+    earliest deadline across all guilds and is woken early whenever that changes.
+    It waits for ``ready`` first, so deadlines that passed while the bot was down
+    fire only once the guilds they belong to can be looked up.
+    """
+
+    def __init__(self, on_due: Callable[[int, str], Awaitable[None]]):
+        self.on_due = on_due
+        self._heaps: Dict[int, List[Tuple[float, str]]] = defaultdict(list)
+        self._deadlines: Dict[int, Dict[str, float]] = defaultdict(dict)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, ready: Optional[Callable[[], Awaitable[None]]] = None):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(ready))
+
+    def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def rebuild(self, guild_id: int, deadlines: Iterable[Tuple[str, float]]):
+        self._deadlines[guild_id] = dict(deadlines)
+        heap = [(end_time, auction_id) for auction_id, end_time in self._deadlines[guild_id].items()]
+        heapq.heapify(heap)
+        self._heaps[guild_id] = heap
+        self._wakeup.set()
+
+    def schedule(self, guild_id: int, auction_id: str, end_time: float):
+        self._deadlines[guild_id][auction_id] = end_time
+        heapq.heappush(self._heaps[guild_id], (end_time, auction_id))
+        self._wakeup.set()
+
+    def cancel(self, guild_id: int, auction_id: str):
+        self._deadlines[guild_id].pop(auction_id, None)
+
+    def _peek(self, guild_id: int) -> Optional[Tuple[float, str]]:
+        heap = self._heaps[guild_id]
+        deadlines = self._deadlines[guild_id]
+        while heap:
+            end_time, auction_id = heap[0]
+            if deadlines.get(auction_id) == end_time:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def next_deadline(self) -> Optional[Tuple[float, int, str]]:
+        earliest = None
+        for guild_id in list(self._heaps):
+            top = self._peek(guild_id)
+            if top and (earliest is None or top[0] < earliest[0]):
+                earliest = (top[0], guild_id, top[1])
+        return earliest
+
+    async def _run(self, ready: Optional[Callable[[], Awaitable[None]]]):
+        if ready is not None:
+            await ready()
+        while True:
+            self._wakeup.clear()
+            due = self.next_deadline()
+            if due is None:
+                await self._wakeup.wait()
+                continue
+
+            end_time, guild_id, auction_id = due
+            delay = end_time - datetime.utcnow().timestamp()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heaps[guild_id])
+            del self._deadlines[guild_id][auction_id]
+            task = asyncio.create_task(self.on_due(guild_id, auction_id))
+            task.add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task):
+        if not task.cancelled() and task.exception():
+            log.error("Error ending auction", exc_info=task.exception())
@@ -0,0 +1,186 @@
+import bisect
+import difflib
+import re
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import discord
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+MENTION_RE = re.compile(r"^<@!?(\d+)>$")
+
+# Points a query token earns for how closely it matches an item-name token.
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+FUZZY_SCORE = 1.0
+# Bonuses for the ways the original search matched a whole query.
+NAME_SCORE = 5.0
+CATEGORY_SCORE = 4.0
+SELLER_SCORE = 10.0
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class _GuildIndex:
+    def __init__(self):
+        self.tokens: Dict[str, Set[str]] = defaultdict(set)
+        self.sorted_tokens: List[str] = []
+        self.names: Dict[str, Set[str]] = defaultdict(set)
+        self.categories: Dict[str, Set[str]] = defaultdict(set)
+        self.sellers: Dict[int, Set[str]] = defaultdict(set)
+        self.docs: Dict[str, Tuple[Set[str], Set[str], str, Optional[int]]] = {}
+
+
+class AuctionSearchIndex:
+    """Inverted index over auction item names, categories and sellers.
+
+    Item names are split into lowercase tokens that map to the auctions using
+    them, and the distinct tokens are kept sorted so prefix matches are a bisect
+    away. A query token that matches nothing exactly or by prefix falls back to a
+    fuzzy match against the vocabulary. Matches are scored and ranked, so a query
+    only touches the auctions it hits rather than every auction in the guild.
+    """
+
+    def __init__(self):
+        self._guilds: Dict[int, _GuildIndex] = defaultdict(_GuildIndex)
+
+    def rebuild(self, guild_id: int, auctions: Iterable[Dict[str, Any]]):
+        self._guilds.pop(guild_id, None)
+        for auction in auctions:
+            self.add(guild_id, auction)
+
+    def clear(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+
+    def add(self, guild_id: int, auction: Dict[str, Any]):
+        index = self._guilds[guild_id]
+        auction_id = auction['auction_id']
+        if auction_id in index.docs:
+            self.remove(guild_id, auction_id)
+
+        names = {item['name'].lower() for item in auction.get('items', [])}
+        tokens = {token for name in names for token in tokenize(name)}
+        category = (auction.get('category') or "").lower()
+        seller = auction.get('user_id')
+
+        for token in tokens:
+            if not index.tokens[token]:
+                bisect.insort(index.sorted_tokens, token)
+            index.tokens[token].add(auction_id)
+        for name in names:
+            index.names[name].add(auction_id)
+        index.categories[category].add(auction_id)
+        index.sellers[seller].add(auction_id)
+        index.docs[auction_id] = (tokens, names, category, seller)
+
+    def remove(self, guild_id: int, auction_id: str):
+        index = self._guilds[guild_id]
+        doc = index.docs.pop(auction_id, None)
+        if doc is None:
+            return
+        tokens, names, category, seller = doc
+        for token in tokens:
+            _discard(index.tokens, token, auction_id)
+            if token not in index.tokens:
+                del index.sorted_tokens[bisect.bisect_left(index.sorted_tokens, token)]
+        for name in names:
+            _discard(index.names, name, auction_id)
+        _discard(index.categories, category, auction_id)
+        _discard(index.sellers, seller, auction_id)
+
+    def _prefixed(self, index: _GuildIndex, prefix: str) -> List[str]:
+        start = bisect.bisect_left(index.sorted_tokens, prefix)
+        end = bisect.bisect_left(index.sorted_tokens, prefix + "\uffff")
+        return index.sorted_tokens[start:end]
+
+    def search(self, guild_id: int, query: str) -> Dict[str, float]:
+        """Return ``{auction_id: score}`` for every auction matching ``query``."""
+        index = self._guilds.get(guild_id)
+        if index is None:
+            return {}
+        scores: Dict[str, float] = defaultdict(float)
+        needle = query.strip().lower()
+
+        for auction_id in index.names.get(needle, ()):
+            scores[auction_id] += NAME_SCORE
+        for category, auction_ids in index.categories.items():
+            if needle and needle in category:
+                for auction_id in auction_ids:
+                    scores[auction_id] += CATEGORY_SCORE
+        mention = MENTION_RE.match(query.strip())
+        seller = mention.group(1) if mention else query.strip()
+        if seller.isdigit():
+            for auction_id in index.sellers.get(int(seller), ()):
+                scores[auction_id] += SELLER_SCORE
+
+        for token in tokenize(query):
+            best: Dict[str, float] = {}
+            for auction_id in index.tokens.get(token, ()):
+                best[auction_id] = EXACT_SCORE
+            for match in self._prefixed(index, token):
+                for auction_id in index.tokens[match]:
+                    best.setdefault(auction_id, PREFIX_SCORE)
+            if not best:
+                for match in difflib.get_close_matches(token, index.sorted_tokens, n=5, cutoff=0.75):
+                    ratio = difflib.SequenceMatcher(None, token, match).ratio()
+                    for auction_id in index.tokens[match]:
+                        best[auction_id] = max(best.get(auction_id, 0.0), FUZZY_SCORE * ratio)
+            for auction_id, score in best.items():
+                scores[auction_id] += score
+        return scores
+
+
+def _discard(mapping: Dict[Any, Set[str]], key: Any, auction_id: str):
+    auction_ids = mapping.get(key)
+    if auction_ids is not None:
+        auction_ids.discard(auction_id)
+        if not auction_ids:
+            del mapping[key]
+
+
+class LazyPageView(discord.ui.View):
+    """Paginates ``count`` pages, building each embed only when it is shown."""
+
+    def __init__(self, author_id: int, count: int, build_page: Callable[[int], Awaitable[discord.Embed]], timeout: float = 180):
+        super().__init__(timeout=timeout)
+        self.author_id = author_id
+        self.count = count
+        self.build_page = build_page
+        self.page = 0
+        self.message: Optional[discord.Message] = None
+
+    async def render(self) -> discord.Embed:
+        embed = await self.build_page(self.page)
+        embed.set_footer(text=f"Result {self.page + 1} of {self.count}")
+        self.previous.disabled = self.page == 0
+        self.next.disabled = self.page >= self.count - 1
+        return embed
+
+    async def start(self, ctx) -> discord.Message:
+        self.message = await ctx.send(embed=await self.render(), view=self)
+        return self.message
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("These results belong to someone else.", ephemeral=True)
+            return False
+        return True
+
+    async def on_timeout(self):
+        if self.message:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(self.page - 1, 0)
+        await interaction.response.edit_message(embed=await self.render(), view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.page + 1, self.count - 1)
+        await interaction.response.edit_message(embed=await self.render(), view=self)
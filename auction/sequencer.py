@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+Settlement = Callable[[], Awaitable[Any]]
+
+
+class BidSequencer:
+    """Serializes state changes per auction without blocking unrelated auctions.
+
+    Every auction gets its own queue and worker task. Work submitted for the same
+    auction is settled strictly in arrival order, while different auctions settle
+    concurrently. Workers shut themselves down after ``idle_timeout`` seconds
+    without work so idle auctions cost nothing.
+    """
+
+    def __init__(self, idle_timeout: float = 30.0):
+        self.idle_timeout = idle_timeout
+        self._queues: Dict[Tuple[int, str], asyncio.Queue] = {}
+        self._workers: Dict[Tuple[int, str], asyncio.Task] = {}
+
+    async def submit(self, guild_id: int, auction_id: str, settle: Settlement) -> Any:
+        """Queue ``settle`` behind earlier work for the auction and return its result."""
+        key = (guild_id, auction_id)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = asyncio.Queue()
+            self._workers[key] = asyncio.create_task(self._run(key, queue))
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((settle, future))
+        return await future
+
+    async def _run(self, key: Tuple[int, str], queue: asyncio.Queue):
+        while True:
+            try:
+                settle, future = await asyncio.wait_for(queue.get(), timeout=self.idle_timeout)
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    del self._queues[key]
+                    del self._workers[key]
+                    return
+                continue
+            if future.cancelled():
+                continue
+            try:
+                result = await settle()
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
+    async def close(self):
+        for task in self._workers.values():
+            task.cancel()
+        self._queues.clear()
+        self._workers.clear()
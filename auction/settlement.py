@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# A user's running totals in the guild's ``user_stats``.
+EMPTY_STATS = {"auctions_won": 0, "auctions_sold": 0, "total_spent": 0, "total_earned": 0}
+
+
+def _stats_after(stats: Optional[Dict[str, int]], won: int = 0, sold: int = 0, spent: int = 0, earned: int = 0) -> Dict[str, int]:
+    after = {**EMPTY_STATS, **(stats or {})}
+    after["auctions_won"] += won
+    after["auctions_sold"] += sold
+    after["total_spent"] += spent
+    after["total_earned"] += earned
+    return after
+
+
+def _reputation_after(score: int, bonus: int, rules: Dict[str, int]) -> int:
+    return max(rules["min_score"], min(rules["max_score"], score + bonus))
+
+
+def compute_settlement(
+    auction: Dict[str, Any],
+    user_stats: Dict[str, Dict[str, int]],
+    reputation: Dict[int, int],
+    rules: Dict[str, int],
+) -> Dict[str, Any]:
+    """Work out every effect of completing an auction, as absolute values.
+
+    ``user_stats`` is the guild's stats mapping and ``reputation`` the current
+    scores of the seller and winner. The result records the values those
+    entries end up with rather than the increments, so applying it a second
+    time, e.g. when replaying after a crash, changes nothing.
+    """
+    seller = auction.get('user_id')
+    winner = auction.get('current_bidder')
+    amount = auction.get('current_bid') or 0
+    settlement = {
+        "auction_id": auction['auction_id'],
+        "status": "completed",
+        "winner_id": winner,
+        "seller_id": seller,
+        "amount": amount,
+        "user_stats": {},
+        "reputation": {},
+        "created_at": datetime.utcnow().timestamp(),
+    }
+    if winner is None:
+        return settlement
+
+    stats = settlement["user_stats"]
+    scores = settlement["reputation"]
+    stats[str(winner)] = _stats_after(user_stats.get(str(winner)), won=1, spent=amount)
+    scores[str(winner)] = _reputation_after(reputation[winner], rules["successful_purchase_bonus"], rules)
+    if seller is not None:
+        # A seller who wins their own auction gets both sets of effects.
+        stats[str(seller)] = _stats_after(stats.get(str(seller)) or user_stats.get(str(seller)), sold=1, earned=amount)
+        base = scores[str(seller)] if seller == winner else reputation[seller]
+        scores[str(seller)] = _reputation_after(base, rules["successful_sale_bonus"], rules)
+    return settlement
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
+
+from redbot.core import Config
+
+from .bids import pack_auction, unpack_auction
+from .migrations import needs_upgrade, upgrade_auction
+
+log = logging.getLogger("red.economy.AdvancedAuctionSystem.store")
+
+# Config custom groups holding one auction per (guild ID, auction ID).
+LIVE_GROUP = "LIVE_AUCTION"
+COMPLETED_GROUP = "COMPLETED_AUCTION"
+FINISHED_STATUSES = ('completed', 'cancelled')
+
+
+def group_for(auction: Dict[str, Any]) -> str:
+    return COMPLETED_GROUP if auction.get('status') in FINISHED_STATUSES else LIVE_GROUP
+
+
+class AuctionStore:
+    """Authoritative in-memory copy of every guild's auctions.
+
+    Auctions are loaded from Config once and mutated in place. Each auction is
+    its own entry in a Config custom group keyed by guild and auction ID, with
+    live and finished auctions in separate groups, so writing one auction does
+    not re-serialize the rest. Callers mark the auctions they touch as dirty
+    and a background task writes only those entries back to Config every
+    ``flush_interval`` seconds (and once more on unload).
+    An auction stays in the dirty set until its write has succeeded, so a failed
+    flush is retried on the next tick instead of being dropped.
+
+    Auctions stored under an older schema are upgraded the first time they are
+    read, and only those are written back; loading current data writes nothing.
+    """
+
+    def __init__(self, config: Config, flush_interval: float = 5.0):
+        self.config = config
+        self.flush_interval = flush_interval
+        self._auctions: Dict[int, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        self._dirty: Dict[int, Set[str]] = defaultdict(set)
+        self._removed: Dict[int, Set[str]] = defaultdict(set)
+        self._outdated: Dict[int, Set[str]] = defaultdict(set)
+        # The custom group each auction was last written to.
+        self._locations: Dict[int, Dict[str, str]] = defaultdict(dict)
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        config.init_custom(LIVE_GROUP, 2)
+        config.init_custom(COMPLETED_GROUP, 2)
+
+    async def load(self):
+        for group in (LIVE_GROUP, COMPLETED_GROUP):
+            for guild_id, auctions in (await self.config.custom(group).all()).items():
+                guild_id = int(guild_id)
+                for auction in auctions.values():
+                    unpack_auction(auction)
+                self._auctions[guild_id].update(auctions)
+                self._locations[guild_id].update(dict.fromkeys(auctions, group))
+                self._outdated[guild_id].update(
+                    auction_id for auction_id, auction in auctions.items() if needs_upgrade(auction)
+                )
+
+    def start(self):
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self):
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    def _upgrade(self, guild_id: int, auction_id: str):
+        self._outdated[guild_id].discard(auction_id)
+        auction = self._auctions[guild_id].get(auction_id)
+        if auction is not None and upgrade_auction(auction):
+            self._dirty[guild_id].add(auction_id)
+
+    def get(self, guild_id: int, auction_id: str) -> Optional[Dict[str, Any]]:
+        if auction_id in self._outdated.get(guild_id, ()):
+            self._upgrade(guild_id, auction_id)
+        return self._auctions[guild_id].get(auction_id)
+
+    def all(self, guild_id: int) -> Dict[str, Dict[str, Any]]:
+        """Return the live mapping for a guild. Mutations must be followed by ``mark_dirty``."""
+        for auction_id in list(self._outdated.pop(guild_id, ())):
+            self._upgrade(guild_id, auction_id)
+        return self._auctions[guild_id]
+
+    def guild_ids(self) -> List[int]:
+        """Guilds with auctions in the store. Unlike ``bot.guilds``, this is complete before the bot connects."""
+        return [guild_id for guild_id, auctions in self._auctions.items() if auctions]
+
+    def put(self, guild_id: int, auction: Dict[str, Any]):
+        auction_id = auction['auction_id']
+        upgrade_auction(auction)
+        unpack_auction(auction)
+        self._auctions[guild_id][auction_id] = auction
+        self._outdated[guild_id].discard(auction_id)
+        self._removed[guild_id].discard(auction_id)
+        self._dirty[guild_id].add(auction_id)
+
+    def mark_dirty(self, guild_id: int, auction_id: str):
+        if auction_id in self._auctions[guild_id]:
+            self._dirty[guild_id].add(auction_id)
+
+    def remove(self, guild_id: int, auction_id: str):
+        if self._auctions[guild_id].pop(auction_id, None) is not None:
+            self._outdated[guild_id].discard(auction_id)
+            self._dirty[guild_id].discard(auction_id)
+            self._removed[guild_id].add(auction_id)
+
+    def replace(self, guild_id: int, auctions: Dict[str, Dict[str, Any]]):
+        for auction_id in set(self._auctions[guild_id]) - set(auctions):
+            self.remove(guild_id, auction_id)
+        for auction in auctions.values():
+            self.put(guild_id, auction)
+
+    async def clear(self, guild_id: int):
+        """Delete all of a guild's auctions, in memory and in Config."""
+        async with self._flush_lock:
+            for group in (LIVE_GROUP, COMPLETED_GROUP):
+                await self.config.custom(group, guild_id).clear()
+            for state in (self._auctions, self._dirty, self._removed, self._outdated, self._locations):
+                state.pop(guild_id, None)
+
+    async def _write(self, guild_id: int, auction_id: str):
+        auction = self._auctions[guild_id].get(auction_id)
+        if auction is None:
+            return
+        group = group_for(auction)
+        previous = self._locations[guild_id].get(auction_id)
+        await self.config.custom(group, guild_id, auction_id).set(pack_auction(auction))
+        if previous is not None and previous != group:
+            # The auction finished; drop its entry from the live group.
+            await self.config.custom(previous, guild_id, auction_id).clear()
+        self._locations[guild_id][auction_id] = group
+
+    async def _delete(self, guild_id: int, auction_id: str):
+        group = self._locations[guild_id].get(auction_id)
+        if group is not None:
+            await self.config.custom(group, guild_id, auction_id).clear()
+            del self._locations[guild_id][auction_id]
+
+    async def write_through(self, guild_id: int, auction_id: str):
+        """Persist one auction now rather than on the next flush."""
+        async with self._flush_lock:
+            self._dirty[guild_id].discard(auction_id)
+            try:
+                await self._write(guild_id, auction_id)
+            except Exception:
+                self._dirty[guild_id].add(auction_id)
+                raise
+
+    async def flush(self):
+        async with self._flush_lock:
+            for guild_id in list(set(self._dirty) | set(self._removed)):
+                dirty = self._dirty.pop(guild_id, set())
+                removed = self._removed.pop(guild_id, set())
+                for auction_id in removed:
+                    try:
+                        await self._delete(guild_id, auction_id)
+                    except Exception:
+                        log.exception(f"Failed to remove auction {auction_id} in guild {guild_id}")
+                        self._removed[guild_id].add(auction_id)
+                for auction_id in dirty:
+                    try:
+                        await self._write(guild_id, auction_id)
+                    except Exception:
+                        log.exception(f"Failed to persist auction {auction_id} in guild {guild_id}")
+                        self._dirty[guild_id].add(auction_id)
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Error flushing auction store")
@@ -0,0 +1,54 @@
+import asyncio
+import gzip
+import io
+import json
+import tempfile
+from typing import Any, Dict, List
+
+import discord
+
+# Transcripts up to this size stay in memory; larger ones roll over to disk.
+SPOOL_SIZE = 1024 * 1024
+
+
+def _record(message: discord.Message) -> Dict[str, Any]:
+    return {
+        "id": message.id,
+        "created_at": message.created_at.isoformat(),
+        "author_id": message.author.id,
+        "author": str(message.author),
+        "content": message.content,
+        "attachments": [attachment.url for attachment in message.attachments],
+    }
+
+
+def _write_lines(writer: gzip.GzipFile, lines: List[str]):
+    writer.write("".join(lines).encode())
+
+
+async def export_transcript(channel: discord.TextChannel, auction_id: str, page_size: int = 100) -> discord.File:
+    """Write a channel's history as gzipped JSON lines, one message per line.
+
+    History is read oldest first and written a page at a time, so only one page
+    of messages is ever held in memory. Compression runs in a worker thread and
+    the output is spooled to a temporary file once it outgrows ``SPOOL_SIZE``.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    try:
+        with gzip.GzipFile(fileobj=spool, mode="wb") as writer:
+            loop = asyncio.get_running_loop()
+            page: List[str] = []
+            async for message in channel.history(limit=None, oldest_first=True):
+                page.append(json.dumps(_record(message)) + "\n")
+                if len(page) >= page_size:
+                    await loop.run_in_executor(None, _write_lines, writer, page)
+                    page = []
+            if page:
+                await loop.run_in_executor(None, _write_lines, writer, page)
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+    # SpooledTemporaryFile only became an IOBase in Python 3.11, which discord.File requires.
+    fp = spool if isinstance(spool, io.IOBase) else spool._file
+    return discord.File(fp, filename=f"auction_{auction_id}_log.jsonl.gz")
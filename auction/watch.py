@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .notifications import DMDispatcher
+
+log = logging.getLogger("red.economy.AdvancedAuctionSystem.watch")
+
+# Leaves room for the heading under Discord's 2000 character message limit.
+MAX_CONTENT = 1900
+
+
+class WatchIndex:
+    """Maps each auction to the IDs of the members watching it.
+
+    Loaded from every member's ``watched_auctions`` once, then kept in step by
+    the watch commands, so finding an auction's watchers is a dict lookup.
+    """
+
+    def __init__(self):
+        self._watchers: Dict[int, Dict[str, Set[int]]] = defaultdict(dict)
+
+    def load(self, all_members: Dict[int, Dict[int, Dict[str, Any]]]):
+        self._watchers.clear()
+        for guild_id, members in all_members.items():
+            for member_id, data in members.items():
+                for auction_id in data.get('watched_auctions', []):
+                    self.watch(guild_id, member_id, auction_id)
+
+    def watch(self, guild_id: int, member_id: int, auction_id: str):
+        self._watchers[guild_id].setdefault(auction_id, set()).add(member_id)
+
+    def unwatch(self, guild_id: int, member_id: int, auction_id: str):
+        watchers = self._watchers[guild_id].get(auction_id)
+        if watchers is not None:
+            watchers.discard(member_id)
+            if not watchers:
+                del self._watchers[guild_id][auction_id]
+
+    def watchers(self, guild_id: int, auction_id: str) -> Set[int]:
+        return self._watchers[guild_id].get(auction_id, set())
+
+    def drop(self, guild_id: int, auction_id: str) -> Set[int]:
+        """Forget an auction's watchers and return them."""
+        return self._watchers[guild_id].pop(auction_id, set())
+
+    def clear(self, guild_id: int):
+        self._watchers.pop(guild_id, None)
+
+
+class WatchNotifier:
+    """Batches auction events and pushes them to watchers by DM.
+
+    Events are buffered per auction for ``interval`` seconds. Within a batch a
+    newer event of the same kind replaces the older one, so a bidding war sends
+    the latest bid rather than every bid. Each member then gets a single DM that
+    covers all the auctions they watch which changed during the batch.
+    """
+
+    def __init__(
+        self,
+        resolve_member: Callable[[int, int], Optional[Any]],
+        dispatcher: DMDispatcher,
+        interval: float = 10.0,
+    ):
+        self.resolve_member = resolve_member
+        self.dispatcher = dispatcher
+        self.interval = interval
+        self._pending: Dict[Tuple[int, str], Tuple[Set[int], Dict[str, str]]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def push(self, guild_id: int, auction_id: str, watchers: Iterable[int], kind: str, message: str):
+        """Queue an event for the given watchers. Does nothing if nobody is watching."""
+        watchers = set(watchers)
+        if not watchers:
+            return
+        recipients, events = self._pending.setdefault((guild_id, auction_id), (set(), {}))
+        recipients.update(watchers)
+        events.pop(kind, None)
+        events[kind] = message
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Error sending watch list notifications")
+
+    async def flush(self):
+        pending, self._pending = self._pending, {}
+        lines: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+        for (guild_id, auction_id), (recipients, events) in pending.items():
+            for member_id in recipients:
+                lines[guild_id, member_id].extend(events.values())
+
+        groups: Dict[str, List[Any]] = defaultdict(list)
+        for (guild_id, member_id), member_lines in lines.items():
+            member = self.resolve_member(guild_id, member_id)
+            if member:
+                content = "\n".join(member_lines)
+                if len(content) > MAX_CONTENT:
+                    content = content[:content.rfind("\n", 0, MAX_CONTENT)] + "\n..."
+                groups[content].append(member)
+
+        for content, members in groups.items():
+            await self.dispatcher.send(members, f"Updates on your watched auctions:\n{content}")
@@ -0,0 +1,40 @@
+import importlib
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+
+class LazyModule:
+    """Stands in for a module until one of its attributes is first used.
+
+    The real module is imported at that point, so a heavy dependency costs
+    nothing when the cog loads. Attributes assigned before then are applied to
+    the module once it is imported.
+    """
+
+    def __init__(self, name: str):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+        object.__setattr__(self, "_pending", {})
+
+    def _load(self) -> ModuleType:
+        module: Optional[ModuleType] = self._module
+        if module is None:
+            module = importlib.import_module(self._name)
+            pending: Dict[str, Any] = self._pending
+            for attr, value in pending.items():
+                setattr(module, attr, value)
+            object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any):
+        if self._module is None:
+            self._pending[attr] = value
+        else:
+            setattr(self._module, attr, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
@@ -7,11 +7,15 @@ import logging
 import json
 import os
 import re
-import joblib
 from datetime import datetime, timedelta
 from collections import defaultdict
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+
+from lazymodule import LazyModule
+
+# scikit-learn and joblib take seconds to import; load them on first use.
+joblib = LazyModule("joblib")
+sklearn_text = LazyModule("sklearn.feature_extraction.text")
+sklearn_linear = LazyModule("sklearn.linear_model")
 
 logger = logging.getLogger("red.MessageModeration")
 
@@ -26,9 +30,10 @@ class MessageModeration(commands.Cog):
         self.data_path = cog_data_path(self) / "ai_data.json"
         self.model_path = cog_data_path(self) / "moderation_model.pkl"
         self.load_data()
-        self.load_model()
+        self.model = None
+        self.model_loading = None
         self.storage_limit = 2 * 1024 * 1024 * 1024  # 2GB
-        self.vectorizer = TfidfVectorizer()
+        self._vectorizer = None
         self.user_behavior = defaultdict(lambda: {"count": 0, "last_activity": None})
 
     def register_defaults(self):
@@ -63,12 +68,27 @@ class MessageModeration(commands.Cog):
         with open(self.data_path, "w") as file:
             json.dump(self.ai_data, file)
 
+    @property
+    def vectorizer(self):
+        if self._vectorizer is None:
+            self._vectorizer = sklearn_text.TfidfVectorizer()
+        return self._vectorizer
+
     def load_model(self):
         if os.path.exists(self.model_path):
             self.model = joblib.load(self.model_path)
         else:
             self.model = None
 
+    def _log_model_load(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Failed to load the moderation model.", exc_info=future.exception())
+
+    async def wait_for_model(self):
+        """Wait for the saved model to finish loading, so it is neither used nor replaced mid-load."""
+        if self.model_loading is not None:
+            await asyncio.wait([self.model_loading])
+
     def save_model(self):
         if self.model:
             joblib.dump(self.model, self.model_path)
@@ -77,6 +97,9 @@ class MessageModeration(commands.Cog):
         await self.bot.wait_until_ready()
         self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
         logger.info("MessageModeration cog initialized.")
+        # Unpickling the model imports scikit-learn, so keep it off the load path.
+        self.model_loading = self.bot.loop.run_in_executor(None, self.load_model)
+        self.model_loading.add_done_callback(self._log_model_load)
         self.bot.loop.create_task(self.periodic_training())
         self.bot.loop.create_task(self.periodic_adjustment())
 
@@ -165,9 +188,10 @@ class MessageModeration(commands.Cog):
         labels = [msg.get("flagged", False) for msg in messages]
 
         if contents and labels:
+            await self.wait_for_model()
             # Train a simple logistic regression model
             X = self.vectorizer.fit_transform(contents)
-            self.model = LogisticRegression()
+            self.model = sklearn_linear.LogisticRegression()
             self.model.fit(X, labels)
             self.save_model()
             logger.info("Trained new moderation model.")
@@ -251,6 +275,7 @@ class MessageModeration(commands.Cog):
             if categories:
                 await self.moderate_message(message, categories, log_channel)
         else:
+            await self.wait_for_model()
             if self.model:
                 X = self.vectorizer.transform([cleaned_content])
                 prediction = self.model.predict(X)
@@ -0,0 +1,75 @@
+"""Benchmark the proxy bidding engine against the sort-per-call approach it replaced.
+
+Each of ``n`` bidders sets a random proxy maximum in turn and the auction's
+proxy war is resolved after every one, as ``proxybid`` does. Run it from the
+repository root::
+
+    python tests/bench_proxy.py 1000 5000
+    python tests/bench_proxy.py 100000 --skip-sorted
+
+The sort-per-call baseline is quadratic and takes minutes beyond ~20k bidders.
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from auction.proxy import IncrementTable, ProxyBook, resolve  # noqa: E402
+
+TIERS = {"0": 1000, "10000": 5000, "100000": 10000, "1000000": 50000, "10000000": 100000}
+
+
+def sorted_resolve(proxy_bids: Dict[str, int], current_bid: int) -> int:
+    # The old engine: sort every proxy bid on each call and outbid the runner-up by 1.
+    ranked = sorted(proxy_bids.items(), key=lambda bid: bid[1], reverse=True)
+    if len(ranked) < 2 or ranked[1][1] < current_bid:
+        return current_bid
+    return min(ranked[1][1] + 1, ranked[0][1])
+
+
+def run_sorted(maxima: List[int]) -> float:
+    start = time.perf_counter()
+    proxy_bids: Dict[str, int] = {}
+    current_bid = 0
+    for user_id, maximum in enumerate(maxima):
+        proxy_bids[str(user_id)] = maximum
+        current_bid = sorted_resolve(proxy_bids, current_bid)
+    return time.perf_counter() - start
+
+
+def run_heap(maxima: List[int]) -> Tuple[float, Optional[Tuple[int, int]]]:
+    increments = IncrementTable(TIERS, 1000)
+    start = time.perf_counter()
+    book = ProxyBook()
+    current_bid, current_bidder = 0, None
+    for user_id, maximum in enumerate(maxima):
+        book.set(user_id, maximum)
+        outcome = resolve(book, current_bid, current_bidder, 0, increments)
+        if outcome:
+            current_bidder, current_bid = outcome
+    return time.perf_counter() - start, (current_bidder, current_bid)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("bidders", type=int, nargs="*", default=[1000, 5000])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--skip-sorted", action="store_true", help="only time the heap engine")
+    args = parser.parse_args()
+
+    for n in args.bidders:
+        rng = random.Random(args.seed)
+        maxima = [rng.randint(1, 10 ** 7) for _ in range(n)]
+        heap_time, (winner, price) = run_heap(maxima)
+        line = f"{n:>7} bidders: heap {heap_time * 1000:8.1f} ms"
+        if not args.skip_sorted:
+            line += f", sort per call {run_sorted(maxima) * 1000:9.1f} ms"
+        print(f"{line}  (bidder {winner} wins at ${price:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import asyncio
+import gc
+import sys
+import types
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+# The cogs are top-level packages of the repository, as Red loads them.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def red_data(tmp_path, monkeypatch, loop):
+    """Point Red's data manager and JSON driver at a temporary directory."""
+    from redbot.core import _drivers, data_manager
+    from redbot.core._drivers import json as json_driver
+
+    # Drivers of earlier tests' cogs unregister themselves when collected; let that happen now.
+    gc.collect()
+    monkeypatch.setattr(
+        data_manager,
+        "basic_config",
+        {
+            "DATA_PATH": str(tmp_path),
+            "STORAGE_TYPE": "JSON",
+            "STORAGE_DETAILS": {},
+            "COG_PATH_APPEND": "cogs",
+            "CORE_PATH_APPEND": "core",
+        },
+    )
+    monkeypatch.setattr(data_manager, "instance_name", "test")
+    # The JSON driver shares data and locks between instances of a cog at module level.
+    monkeypatch.setattr(json_driver, "_shared_datastore", {})
+    monkeypatch.setattr(json_driver, "_locks", defaultdict(asyncio.Lock))
+    monkeypatch.setattr(json_driver, "_driver_counts", {})
+    loop.run_until_complete(_drivers.get_driver_class().initialize())
+    yield tmp_path
+    gc.collect()
+
+
+@pytest.fixture
+def bot(loop):
+    """The parts of a Red bot the cogs use before the gateway connects."""
+    ready = asyncio.Event()
+    return types.SimpleNamespace(
+        guilds=[], loop=loop, get_guild=lambda guild_id: None, ready=ready, wait_until_red_ready=ready.wait
+    )
@@ -0,0 +1,240 @@
+import asyncio
+import types
+from functools import partial
+
+import discord
+import pytest
+
+from auction.auction import AdvancedAuctionSystem, AuctionDetailsModal
+
+
+def test_cog_builds_and_loads(red_data, bot, loop):
+    cog = AdvancedAuctionSystem(bot)
+    assert cog.embed_updater is not None
+    for name in ("render_auction_embed", "settle_bid", "settle_buyout", "handle_bid", "AuctionControls"):
+        assert hasattr(cog, name), name
+    assert {command.name for command in cog.get_commands()} >= {"bid", "proxybid", "auctioninfo", "spawnauction"}
+    assert not hasattr(AuctionDetailsModal, "bid")
+
+    async def load_and_unload():
+        await cog.initialize()
+        await asyncio.sleep(0)
+        assert cog.auction_loop.is_running()
+        await cog.cog_unload()
+        await asyncio.sleep(0)
+        assert not cog.auction_loop.is_running()
+
+    loop.run_until_complete(load_and_unload())
+
+
+def test_render_auction_embed(red_data, bot, loop):
+    cog = AdvancedAuctionSystem(bot)
+    cog.auction_store.put(1, {
+        'auction_id': '7',
+        'user_id': 10,
+        'items': [{'name': 'Rare Pepe', 'amount': 1}],
+        'min_bid': 100,
+        'category': 'Regular',
+        'buy_out_price': None,
+        'current_bid': 150,
+        'current_bidder': 20,
+        'status': 'active',
+        'end_time': 2000000000,
+        'bid_history': [],
+        'proxy_bids': {},
+        'donations': [],
+    })
+
+    embed = loop.run_until_complete(cog.render_auction_embed(1, '7'))
+    assert isinstance(embed, discord.Embed)
+    fields = {field.name: field.value for field in embed.fields}
+    assert fields["Current Bid"] == "$150"
+    assert fields["Top Bidder"] == "<@20>"
+    assert loop.run_until_complete(cog.render_auction_embed(1, 'missing')) is None
+
+
+def make_auction(auction_id, **fields):
+    auction = {
+        'auction_id': auction_id,
+        'user_id': 10,
+        'items': [{'name': 'Rare Pepe', 'amount': 1}],
+        'min_bid': 100,
+        'max_bid': 10000,
+        'max_proxy_bid': 10000,
+        'category': 'Regular',
+        'buy_out_price': 5000,
+        'current_bid': 0,
+        'current_bidder': None,
+        'status': 'active',
+        'end_time': 2000000000,
+        'bid_history': [],
+        'proxy_bids': {},
+        'donations': [],
+    }
+    auction.update(fields)
+    return auction
+
+
+def fake_guild(guild_id=1):
+    return types.SimpleNamespace(id=guild_id, get_channel=lambda channel_id: None, get_member=lambda user_id: None)
+
+
+@pytest.mark.parametrize("close", ["deadline", "buyout"])
+def test_closing_an_auction_settles_it(red_data, bot, loop, close):
+    cog = AdvancedAuctionSystem(bot)
+    guild = fake_guild()
+
+    async def run():
+        await cog.initialize()
+        try:
+            if close == "deadline":
+                cog.auction_store.put(guild.id, make_auction('1', current_bid=300, current_bidder=20, end_time=1))
+                assert await cog.settle_close(guild, '1')
+            else:
+                cog.auction_store.put(guild.id, make_auction('1'))
+                assert await cog.settle_bid(guild, '1', 20, 5000) is None
+            await cog.end_auction(guild, '1')
+
+            auction = cog.auction_store.get(guild.id, '1')
+            assert auction['status'] == 'completed'
+            assert await cog.history_store.count(guild.id) == 1
+            user_stats = await cog.config.guild_from_id(guild.id).user_stats()
+            assert user_stats['20']['auctions_won'] == 1
+            assert user_stats['10']['auctions_sold'] == 1
+            assert await cog.config.guild_from_id(guild.id).pending_settlements() == {}
+            # A second close finds the auction finished and changes nothing.
+            assert not await cog.settle_close(guild, '1')
+            assert not await cog.settle_auction(guild.id, auction)
+        finally:
+            await cog.cog_unload()
+
+    loop.run_until_complete(run())
+
+
+def test_initialize_rebuilds_indexes_before_the_bot_connects(red_data, bot, loop):
+    guild = fake_guild()
+
+    async def save_auction():
+        cog = AdvancedAuctionSystem(bot)
+        await cog.initialize()
+        auction = make_auction('1', channel_id=555, current_bid=300, current_bidder=20)
+        auction['bid_history'].append({'user_id': 20, 'amount': 300, 'timestamp': 1.0})
+        cog.auction_store.put(guild.id, auction)
+        await cog.cog_unload()
+
+    async def reload():
+        cog = AdvancedAuctionSystem(bot)
+        await cog.initialize()
+        try:
+            assert not bot.guilds
+            assert cog.auction_scheduler.next_deadline() == (2000000000, guild.id, '1')
+            assert cog.auction_channels[guild.id] == {555: '1'}
+            assert '1' in cog.search_index.search(guild.id, "pepe")
+            assert cog.participants.auctions(guild.id, 20) == {'1'}
+        finally:
+            await cog.cog_unload()
+
+    loop.run_until_complete(save_auction())
+    loop.run_until_complete(reload())
+
+
+def test_analytics_survive_a_restart(red_data, bot, loop):
+    guild = fake_guild()
+
+    async def settle_auctions():
+        cog = AdvancedAuctionSystem(bot)
+        await cog.initialize()
+        for auction_id in ('1', '2'):
+            cog.auction_store.put(guild.id, make_auction(auction_id, current_bid=300, current_bidder=20, end_time=1))
+            assert await cog.settle_close(guild, auction_id)
+        snapshot = await cog.config.guild_from_id(guild.id).analytics()
+        assert snapshot['total_auctions'] == 2
+        assert 'ingested' not in snapshot
+        # Recorded in history, but the cog stops before the analytics are saved.
+        await cog.history_store.append(guild.id, make_auction('3', current_bid=50, status='completed', end_time=1))
+        cog.save_analytics = lambda: asyncio.sleep(0)
+        await cog.cog_unload()
+
+    async def reload():
+        cog = AdvancedAuctionSystem(bot)
+        await cog.initialize()
+        try:
+            analytics = cog.analytics[guild.id]
+            assert analytics.total_auctions == 3
+            assert analytics.total_value == 650
+            # Ingesting a row twice does not count it twice.
+            await cog.catch_up_analytics(guild.id)
+            assert analytics.total_auctions == 3
+        finally:
+            await cog.cog_unload()
+
+    loop.run_until_complete(settle_auctions())
+    loop.run_until_complete(reload())
+
+
+def test_overdue_auction_ends_once_the_bot_is_ready(red_data, bot, loop):
+    guild = fake_guild()
+
+    async def save_overdue_auction():
+        cog = AdvancedAuctionSystem(bot)
+        await cog.initialize()
+        cog.auction_store.put(guild.id, make_auction('1', current_bid=300, current_bidder=20, end_time=1))
+        await cog.cog_unload()
+
+    async def restart():
+        cog = AdvancedAuctionSystem(bot)
+        await cog.initialize()
+        try:
+            # Loaded before the gateway connects: nothing may fire and the deadline must be kept.
+            await asyncio.sleep(0.05)
+            assert cog.auction_store.get(guild.id, '1')['status'] == 'active'
+            assert cog.auction_scheduler.next_deadline() == (1, guild.id, '1')
+
+            # Ready, but the guild is unavailable: the deadline is retried later instead of dropped.
+            bot.ready.set()
+            await asyncio.sleep(0.05)
+            assert cog.auction_store.get(guild.id, '1')['status'] == 'active'
+            end_time, _, auction_id = cog.auction_scheduler.next_deadline()
+            assert auction_id == '1' and end_time > 1
+
+            bot.get_guild = lambda guild_id: guild
+            await cog.on_auction_due(guild.id, '1')
+            assert cog.auction_store.get(guild.id, '1')['status'] == 'completed'
+        finally:
+            await cog.cog_unload()
+
+    loop.run_until_complete(save_overdue_auction())
+    loop.run_until_complete(restart())
+
+
+def test_cancel_waits_for_a_queued_buyout(red_data, bot, loop):
+    guild = fake_guild()
+    sent = []
+
+    async def send(content):
+        sent.append(content)
+
+    ctx = types.SimpleNamespace(guild=guild, send=send)
+
+    async def run():
+        cog = AdvancedAuctionSystem(bot)
+        await cog.initialize()
+        try:
+            cog.auction_store.put(guild.id, make_auction('1'))
+            cog.auction_store.put(guild.id, make_auction('2'))
+            buyout = asyncio.ensure_future(
+                cog.bid_sequencer.submit(guild.id, '1', partial(cog.settle_bid, guild, '1', 20, 5000))
+            )
+            await asyncio.sleep(0)
+            await AdvancedAuctionSystem.cancelauction.callback(cog, ctx, '1')
+            assert await buyout is None
+            assert cog.auction_store.get(guild.id, '1')['status'] == 'completed'
+            assert sent == ["This auction is not active and cannot be cancelled."]
+
+            await AdvancedAuctionSystem.cancelauction.callback(cog, ctx, '2')
+            assert cog.auction_store.get(guild.id, '2')['status'] == 'cancelled'
+            assert sent[-1] == "Auction #2 has been cancelled."
+        finally:
+            await cog.cog_unload()
+
+    loop.run_until_complete(run())
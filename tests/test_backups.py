@@ -0,0 +1,78 @@
+import asyncio
+
+from auction.backups import BackupManager
+from auction.history import AuctionHistoryStore
+
+
+def history_row(auction_id, user_id=1, end_time=1000):
+    return {
+        'auction_id': auction_id,
+        'end_time': end_time,
+        'user_id': user_id,
+        'current_bidder': 2,
+        'status': 'completed',
+        'current_bid': 100,
+        'bid_history': [],
+    }
+
+
+async def restored_history(backups, history, guild_id):
+    await backups.restore(guild_id, await backups.chain(guild_id))
+    return {auction['auction_id']: auction for auction in await history.fetch_range(guild_id)}
+
+
+def test_delta_chain_restores_new_rows(tmp_path):
+    async def run():
+        history = AuctionHistoryStore(tmp_path / "history.sqlite3")
+        await history.open()
+        backups = BackupManager(tmp_path / "backups", history)
+        try:
+            await history.extend(1, [history_row('1'), history_row('2')])
+            assert (await backups.create(1, {}, {}))['kind'] == "snapshot"
+            await history.append(1, history_row('3'))
+            assert (await backups.create(1, {}, {}))['kind'] == "delta"
+            assert set(await restored_history(backups, history, 1)) == {'1', '2', '3'}
+        finally:
+            await history.close()
+            backups.close()
+
+    asyncio.run(run())
+
+
+def test_pruned_and_scrubbed_rows_stay_gone_after_restore(tmp_path):
+    async def run():
+        history = AuctionHistoryStore(tmp_path / "history.sqlite3")
+        await history.open()
+        backups = BackupManager(tmp_path / "backups", history)
+        try:
+            await history.extend(1, [history_row('1', end_time=10), history_row('2', user_id=99)])
+            await backups.create(1, {}, {})
+
+            assert await history.prune(1, before=100) == 1
+            await backups.force_snapshot(1)
+            scrubbed = history_row('2', user_id=None)
+            await history.update(1, scrubbed)
+            await backups.force_snapshot(1)
+
+            assert (await backups.create(1, {}, {}))['kind'] == "snapshot"
+            restored = await restored_history(backups, history, 1)
+            assert set(restored) == {'2'}
+            assert restored['2']['user_id'] is None
+        finally:
+            await history.close()
+            backups.close()
+
+    asyncio.run(run())
+
+
+def test_force_snapshot_without_backups_is_a_no_op(tmp_path):
+    async def run():
+        history = AuctionHistoryStore(tmp_path / "history.sqlite3")
+        backups = BackupManager(tmp_path / "backups", history)
+        try:
+            await backups.force_snapshot(1)
+            assert not backups.guild_path(1).exists()
+        finally:
+            backups.close()
+
+    asyncio.run(run())
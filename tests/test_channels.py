@@ -0,0 +1,133 @@
+import asyncio
+import itertools
+import types
+from datetime import timedelta
+
+import discord
+
+from auction.channels import IDLE_NAME, ChannelPool
+
+ids = itertools.count(100)
+
+
+class FakeGuild:
+    def __init__(self):
+        self.id = 1
+        self.channels = {}
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+
+class FakeChannel:
+    def __init__(self, category, name, message_ages=()):
+        self.id = next(ids)
+        self.guild = category.guild
+        self.category = category
+        self.category_id = category.id
+        self.name = name
+        now = discord.utils.utcnow()
+        self.messages = [types.SimpleNamespace(created_at=now - age) for age in message_ages]
+        self.calls = []
+        self.guild.channels[self.id] = self
+        category.channels.append(self)
+
+    async def history(self, limit):
+        for message in self.messages[:limit]:
+            yield message
+
+    async def delete_messages(self, messages):
+        self.calls.append(("delete_messages", len(messages)))
+        self.messages = [message for message in self.messages if message not in messages]
+
+    async def edit(self, **fields):
+        self.calls.append(("edit", fields.get("name")))
+        self.name = fields.get("name", self.name)
+
+    async def delete(self):
+        self.calls.append(("delete",))
+        del self.guild.channels[self.id]
+        self.category.channels.remove(self)
+
+
+class FakeCategory:
+    def __init__(self):
+        self.id = 9
+        self.guild = FakeGuild()
+        self.channels = []
+        self.created = 0
+
+    @property
+    def text_channels(self):
+        return list(self.channels)
+
+    async def create_text_channel(self, name):
+        self.created += 1
+        return FakeChannel(self, name)
+
+
+def test_acquire_reuses_idle_channels_before_creating():
+    async def run():
+        category = FakeCategory()
+        idle = FakeChannel(category, IDLE_NAME)
+        FakeChannel(category, "auction-7")
+        pool = ChannelPool()
+        assert pool.idle_count(category) == 1
+        assert await pool.acquire(category, "auction-1") is idle
+        assert idle.name == "auction-1"
+        assert (await pool.acquire(category, "auction-2")).name == "auction-2"
+        assert category.created == 1
+
+    asyncio.run(run())
+
+
+def test_replenish_tops_up_the_pool():
+    async def run():
+        category = FakeCategory()
+        pool = ChannelPool()
+        pool.replenish(category, 3)
+        await asyncio.sleep(0.01)
+        assert pool.idle_count(category) == 3
+        assert category.created == 3
+        pool.close()
+
+    asyncio.run(run())
+
+
+def test_quiet_channel_is_emptied_with_one_bulk_delete():
+    async def run():
+        category = FakeCategory()
+        pool = ChannelPool()
+        channel = FakeChannel(category, "auction-1", [timedelta(minutes=5)] * 40)
+        await pool.release(channel, 2)
+        assert channel.calls == [("delete_messages", 40), ("edit", IDLE_NAME)]
+        assert pool.idle_count(category) == 1
+
+    asyncio.run(run())
+
+
+def test_busy_or_old_channels_are_deleted():
+    async def run():
+        category = FakeCategory()
+        pool = ChannelPool()
+        busy = FakeChannel(category, "auction-1", [timedelta(minutes=5)] * 250)
+        old = FakeChannel(category, "auction-2", [timedelta(minutes=5), timedelta(days=15)])
+        await pool.release(busy, 2)
+        await pool.release(old, 2)
+        assert busy.calls == [("delete",)]
+        assert old.calls == [("delete",)]
+        assert pool.idle_count(category) == 0
+
+    asyncio.run(run())
+
+
+def test_release_deletes_when_the_pool_is_full():
+    async def run():
+        category = FakeCategory()
+        FakeChannel(category, IDLE_NAME)
+        pool = ChannelPool()
+        channel = FakeChannel(category, "auction-1")
+        await pool.release(channel, 1)
+        assert channel.calls == [("delete",)]
+
+    asyncio.run(run())
@@ -0,0 +1,18 @@
+import asyncio
+
+from auction.charts import ChartRenderer
+
+
+def test_charts_render_in_spawned_workers():
+    async def run():
+        renderer = ChartRenderer(max_workers=1)
+        try:
+            png = await renderer.render("value_distribution", [100, 200, 200, 300])
+            assert png.startswith(b"\x89PNG")
+            assert renderer._get_executor()._mp_context.get_start_method() == "spawn"
+            # Identical data is served from the cache.
+            assert await renderer.render("value_distribution", [100, 200, 200, 300]) is png
+        finally:
+            renderer.close()
+
+    asyncio.run(run())
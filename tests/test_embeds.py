@@ -0,0 +1,71 @@
+import asyncio
+import types
+
+import discord
+
+from auction.embeds import EmbedUpdater
+
+
+class FakeMessage:
+    def __init__(self, message_id):
+        self.id = message_id
+        self.edits = []
+
+    async def edit(self, embed):
+        self.edits.append(embed.title)
+
+
+def fake_channel(message):
+    guild = types.SimpleNamespace(id=1)
+    return types.SimpleNamespace(guild=guild, get_partial_message=lambda message_id: message)
+
+
+def test_requests_are_coalesced():
+    async def run():
+        price = {"value": 100}
+        message = FakeMessage(5)
+        channel = fake_channel(message)
+
+        async def render(guild_id, auction_id):
+            return discord.Embed(title=f"${price['value']}")
+
+        updater = EmbedUpdater(render, interval=0.05)
+        for value in (100, 200, 300):
+            price["value"] = value
+            updater.request(channel, "7", 5)
+        await asyncio.sleep(0.1)
+        assert message.edits == ["$300"]
+        updater.close()
+
+    asyncio.run(run())
+
+
+def test_request_during_the_final_flush_is_not_lost():
+    async def run():
+        price = {"value": 100}
+        message = FakeMessage(5)
+        channel = fake_channel(message)
+
+        async def render(guild_id, auction_id):
+            return discord.Embed(title=f"${price['value']}")
+
+        updater = EmbedUpdater(render, interval=0)
+
+        def late_bid():
+            price["value"] = 200
+            updater.request(channel, "7", 5)
+
+        async def edit(embed):
+            message.edits.append(embed.title)
+            if len(message.edits) == 1:
+                # Runs after the flush task's last stale check but before its done-callbacks.
+                asyncio.get_running_loop().call_soon(late_bid)
+
+        message.edit = edit
+        updater.request(channel, "7", 5)
+        await asyncio.sleep(0.05)
+        assert message.edits == ["$100", "$200"]
+        assert not updater._tasks
+        updater.close()
+
+    asyncio.run(run())
@@ -0,0 +1,37 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+# Modules a running Red bot has already imported before it loads any cog.
+PRELOADED = "aiohttp, discord, redbot.core.bot, redbot.core.commands, redbot.core.utils.menus"
+BUDGET_US = 250_000
+HEAVY = ("numpy", "matplotlib", "seaborn", "sklearn", "joblib", "openai", "requests")
+
+
+def import_cog(package: str):
+    """Import ``package`` after the preloaded modules under ``-X importtime``.
+
+    Returns its cumulative import time in microseconds and the heavy modules
+    that ended up imported.
+    """
+    script = (
+        f"import {PRELOADED}; import sys; before = set(sys.modules); import {package}; "
+        f"print(' '.join(sorted(set(sys.modules) - before)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script], cwd=REPO, capture_output=True, text=True, check=True
+    )
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(package)}$", result.stderr, re.MULTILINE)
+    heavy = sorted({name.split(".")[0] for name in result.stdout.split()} & set(HEAVY))
+    return int(match.group(1)), heavy
+
+
+@pytest.mark.parametrize("package", ["auction", "mod", "ai_chat"])
+def test_cog_import_time(package):
+    cumulative, heavy = import_cog(package)
+    assert not heavy, f"importing {package} loads {', '.join(heavy)}"
+    assert cumulative < BUDGET_US, f"importing {package} took {cumulative / 1000:.0f} ms"
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+import time
+
+from mod.moderation_cog import MessageModeration
+
+
+def test_model_load_failure_is_logged_and_awaited(red_data, bot, loop, caplog):
+    bot.wait_until_ready = lambda: asyncio.sleep(0)
+    cog = MessageModeration(bot)
+
+    def load_model():
+        raise OSError("corrupt model file")
+
+    cog.load_model = load_model
+
+    async def run():
+        await cog.initialize()
+        try:
+            await cog.wait_for_model()
+            await asyncio.sleep(0)
+            assert cog.model is None
+        finally:
+            for task in asyncio.all_tasks() - {asyncio.current_task()}:
+                task.cancel()
+            await cog.session.close()
+
+    with caplog.at_level(logging.ERROR, logger="red.MessageModeration"):
+        loop.run_until_complete(run())
+    assert "Failed to load the moderation model." in caplog.text
+
+
+def test_model_is_loaded_before_use(red_data, bot, loop):
+    bot.wait_until_ready = lambda: asyncio.sleep(0)
+    cog = MessageModeration(bot)
+    model = object()
+
+    def load_model():
+        time.sleep(0.1)
+        cog.model = model
+
+    cog.load_model = load_model
+
+    async def run():
+        await cog.initialize()
+        try:
+            await cog.wait_for_model()
+            assert cog.model is model
+        finally:
+            for task in asyncio.all_tasks() - {asyncio.current_task()}:
+                task.cancel()
+            await cog.session.close()
+
+    loop.run_until_complete(run())
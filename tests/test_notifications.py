@@ -0,0 +1,107 @@
+import asyncio
+import types
+
+import discord
+
+from auction.auction import AdvancedAuctionSystem
+from auction.notifications import DMDispatcher, SubscriptionIndex
+
+
+def http_error(status: int) -> discord.HTTPException:
+    error = discord.Forbidden if status == 403 else discord.HTTPException
+    return error(types.SimpleNamespace(status=status, reason="stub"), "stub error")
+
+
+class FakeRecipient:
+    """Stands in for a member; ``failures`` are raised by successive sends before one succeeds."""
+
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, *failures):
+        self.failures = list(failures)
+        self.attempts = 0
+        self.received = []
+
+    async def send(self, content: str):
+        self.attempts += 1
+        FakeRecipient.in_flight += 1
+        FakeRecipient.peak = max(FakeRecipient.peak, FakeRecipient.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self.failures:
+                raise self.failures.pop(0)
+            self.received.append(content)
+        finally:
+            FakeRecipient.in_flight -= 1
+
+
+def dispatch(recipients, **options):
+    dispatcher = DMDispatcher(backoff=0.001, **options)
+    return asyncio.run(dispatcher.send(recipients, "A new auction started!"))
+
+
+def test_transient_failures_are_retried():
+    recipient = FakeRecipient(http_error(503), discord.RateLimited(0.001))
+    stats = dispatch([recipient])
+    assert stats == {"sent": 1, "failed": 0, "retries": 2}
+    assert recipient.received == ["A new auction started!"]
+
+
+def test_retries_stop_after_max_attempts():
+    recipient = FakeRecipient(*(http_error(500) for _ in range(5)))
+    stats = dispatch([recipient], max_attempts=3)
+    assert stats == {"sent": 0, "failed": 1, "retries": 2}
+    assert recipient.attempts == 3
+
+
+def test_permanent_failures_are_not_retried():
+    closed_dms, bad_request = FakeRecipient(http_error(403)), FakeRecipient(http_error(400))
+    stats = dispatch([closed_dms, bad_request])
+    assert stats == {"sent": 0, "failed": 2, "retries": 0}
+    assert closed_dms.attempts == bad_request.attempts == 1
+
+
+def test_concurrency_is_bounded():
+    FakeRecipient.peak = 0
+    recipients = [FakeRecipient() for _ in range(50)]
+    stats = dispatch(recipients, concurrency=4)
+    assert stats == {"sent": 50, "failed": 0, "retries": 0}
+    assert FakeRecipient.peak == 4
+
+
+def test_subscription_index():
+    index = SubscriptionIndex()
+    index.load({1: {5: {'subscribed_categories': ['Regular', 'Massive']}, 6: {}}})
+    index.subscribe(1, 6, ['Massive'])
+    index.unsubscribe(1, 5, ['Massive'])
+    assert index.subscribers(1, 'Regular') == {5}
+    assert index.subscribers(1, 'Massive') == {6}
+    assert index.subscribers(2, 'Regular') == set()
+
+
+def test_extension_is_pushed_to_watchers(red_data, bot, loop):
+    guild = types.SimpleNamespace(id=1)
+    sent = []
+
+    async def send(content):
+        sent.append(content)
+
+    ctx = types.SimpleNamespace(guild=guild, author=types.SimpleNamespace(id=10), send=send)
+
+    async def run():
+        cog = AdvancedAuctionSystem(bot)
+        cog.auction_store.put(guild.id, {
+            'auction_id': '1', 'user_id': 10, 'items': [{'name': 'Rare Pepe', 'amount': 1}],
+            'status': 'active', 'end_time': 2000000000,
+        })
+        await cog.config.guild(guild).max_auction_extensions.set(1)
+        cog.watch_index.watch(guild.id, 30, '1')
+        await AdvancedAuctionSystem.auctionextension.callback(cog, ctx, '1', 15)
+        return cog.watch_notifier._pending
+
+    pending = loop.run_until_complete(run())
+    recipients, events = pending[(1, '1')]
+    assert recipients == {30}
+    assert events == {'extension': "Auction #1 was extended and now ends <t:2000000900:R>."}
+    assert sent[0].startswith("Auction #1 has been extended by 15 minutes.")
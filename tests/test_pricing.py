@@ -0,0 +1,121 @@
+import asyncio
+import types
+from collections import Counter
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from auction import pricing
+from auction.pricing import PricingClient
+
+
+class StubPricingServer:
+    """Local item-value API: each item is worth 100 per letter, plus one per request served for it."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.hits = Counter()
+        self.failing = set()
+        app = web.Application()
+        app.router.add_get("/items/{name}", self.handle)
+        self.server = TestServer(app)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        self.hits[name] += 1
+        await asyncio.sleep(self.delay)
+        if name in self.failing:
+            return web.Response(status=500)
+        return web.json_response({"value": len(name) * 100 + self.hits[name]})
+
+    @property
+    def base_url(self) -> str:
+        return str(self.server.make_url("/items/"))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the pricing client's monotonic clock with one the test moves by hand."""
+    now = types.SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(pricing, "time", types.SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def run_with_client(test, delay: float = 0.0, **options):
+    async def run():
+        stub = StubPricingServer(delay)
+        await stub.server.start_server()
+        client = PricingClient(base_url=stub.base_url, **options)
+        try:
+            await test(stub, client)
+        finally:
+            await client.close()
+            await stub.server.close()
+
+    asyncio.run(run())
+
+
+def test_concurrent_lookups_share_one_request():
+    async def test(stub, client):
+        values = await asyncio.gather(*(client.get_value("pepe") for _ in range(20)))
+        assert set(values) == {401}
+        assert stub.hits["pepe"] == 1
+
+    run_with_client(test, delay=0.05)
+
+
+def test_batch_valuation_looks_up_each_item_once():
+    async def test(stub, client):
+        items = [{"name": "a", "amount": 2}, {"name": "bb", "amount": 1}, {"name": "a", "amount": 1}]
+        assert await client.get_total_value(items) == 101 * 3 + 201
+        assert stub.hits == {"a": 1, "bb": 1}
+
+    run_with_client(test)
+
+
+def test_cache_expiry_and_stale_while_revalidate(clock):
+    async def test(stub, client):
+        assert await client.get_value("pepe") == 401
+
+        clock.value += 50
+        assert await client.get_value("pepe") == 401
+        assert stub.hits["pepe"] == 1
+
+        # Stale: the old value comes back at once and a refresh runs behind it.
+        clock.value += 60
+        assert await client.get_value("pepe") == 401
+        await asyncio.sleep(0.05)
+        assert stub.hits["pepe"] == 2
+        assert await client.get_value("pepe") == 402
+
+        # Past the stale window the lookup waits for a fresh value.
+        clock.value += 1000
+        assert await client.get_value("pepe") == 403
+
+    run_with_client(test, ttl=100, stale_ttl=500)
+
+
+def test_failed_refresh_keeps_the_last_value(clock):
+    async def test(stub, client):
+        assert await client.get_value("pepe") == 401
+        stub.failing.add("pepe")
+        clock.value += 1000
+        assert await client.get_value("pepe") == 401
+        stub.failing.add("unknown")
+        assert await client.get_value("unknown") is None
+
+    run_with_client(test, ttl=100, stale_ttl=500)
+
+
+def test_cache_evicts_least_recently_used():
+    async def test(stub, client):
+        await client.get_value("a")
+        await client.get_value("bb")
+        await client.get_value("a")
+        await client.get_value("ccc")
+        await client.get_value("a")
+        await client.get_value("bb")
+        assert stub.hits == {"a": 1, "bb": 2, "ccc": 1}
+
+    run_with_client(test, max_entries=2)
@@ -0,0 +1,80 @@
+from auction.proxy import IncrementTable, ProxyBook, resolve
+
+TIERS = {"0": 1000, "10000": 5000, "100000": 10000}
+
+
+def book_of(*bids):
+    book = ProxyBook()
+    for user_id, amount in bids:
+        book.set(user_id, amount)
+    return book
+
+
+def settle(book, current_bid=0, current_bidder=None, min_bid=0):
+    return resolve(book, current_bid, current_bidder, min_bid, IncrementTable(TIERS, 1000))
+
+
+def test_increment_boundaries():
+    increments = IncrementTable(TIERS, 1000)
+    assert increments.step(0) == 1000
+    assert increments.step(9999) == 1000
+    assert increments.step(10000) == 5000
+    assert increments.step(99999) == 5000
+    assert increments.step(100000) == 10000
+    assert increments.step(10 ** 9) == 10000
+    # Below the lowest tier, and for tiers under it, the guild minimum applies.
+    assert IncrementTable({"100": 5}, 2).step(50) == 2
+    assert IncrementTable({"0": 1, "100": 5}, 10).step(150) == 10
+
+
+def test_proxy_war_goes_to_the_highest_maximum():
+    # One increment above the runner-up's maximum, as the baseline's "runner-up + 1"
+    # with the guild's increment in place of the fixed dollar.
+    assert settle(book_of((1, 35000), (2, 20000))) == (1, 25000)
+    assert settle(book_of((1, 20000), (2, 35000))) == (2, 25000)
+
+
+def test_proxy_war_is_capped_at_the_winners_maximum():
+    assert settle(book_of((1, 22000), (2, 20000))) == (1, 22000)
+
+
+def test_increment_follows_the_runner_ups_tier():
+    assert settle(book_of((1, 50000), (2, 9999))) == (1, 10999)
+    assert settle(book_of((1, 50000), (2, 10000))) == (1, 15000)
+
+
+def test_tie_goes_to_the_earlier_proxy():
+    assert settle(book_of((1, 20000), (2, 20000))) == (1, 20000)
+    assert settle(book_of((2, 20000), (1, 20000))) == (2, 20000)
+    # Placing the same maximum again counts as a new bid.
+    book = book_of((1, 20000), (2, 20000))
+    book.set(1, 20000)
+    assert settle(book) == (2, 20000)
+
+
+def test_standing_leader_holds():
+    book = book_of((1, 35000), (2, 20000))
+    assert settle(book, current_bid=25000, current_bidder=1) is None
+
+
+def test_proxy_outbids_a_manual_bid():
+    book = book_of((1, 35000), (2, 20000))
+    assert settle(book, current_bid=22000, current_bidder=3) == (1, 27000)
+    assert settle(book_of((1, 5000)), current_bid=8000, current_bidder=3) is None
+
+
+def test_single_proxy_bids_straight_away():
+    # The baseline waited for a second proxy before bidding at all.
+    assert settle(book_of((1, 35000))) == (1, 1000)
+    assert settle(book_of((1, 35000)), min_bid=2500) == (1, 2500)
+    assert settle(book_of((1, 500)), min_bid=2500) is None
+    assert settle(ProxyBook()) is None
+
+
+def test_book_tracks_raised_and_withdrawn_bids():
+    book = book_of((1, 35000), (2, 20000), (3, 10000))
+    book.set(1, 15000)
+    assert book.top_two() == [(2, 20000), (1, 15000)]
+    book.remove(2)
+    assert book.top_two() == [(1, 15000), (3, 10000)]
+    assert len(book) == 2